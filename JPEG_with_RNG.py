@@ -1,21 +1,20 @@
 import cv2
 import numpy as np
+import scipy.fft
 import scipy.fftpack
-import hashlib
-import time
 import os
 
+from entropy_pool import varsayilan_havuz
+from frame_sources import kaynak_ac
+from image_loader import goruntu_yukle
+from sampling import varsayilan_ornekleyici
+from von_neumann import von_neumann_str
+
 
 # --- 1. TRNG MOTORU (Rastgelelik Kaynağı) ---
 def von_neumann_temizle(bit_dizisi):
-    temiz_bitler = ""
-    for i in range(0, len(bit_dizisi) - 1, 2):
-        cift = bit_dizisi[i: i + 2]
-        if cift == "01":
-            temiz_bitler += "0"
-        elif cift == "10":
-            temiz_bitler += "1"
-    return temiz_bitler
+    # Vektörel, bayt tablolu ekstraktöre yönlendir (von_neumann.py)
+    return von_neumann_str(bit_dizisi)
 
 
 def collatz_adimi(n):
@@ -25,38 +24,24 @@ def collatz_adimi(n):
         return 3 * n + 1
 
 
-def trng_tablo_uretici():
+def trng_tablo_uretici(adet=None):
+    """
+    TRNG ile 8x8 kuantalama tablosu üretir.
+    adet verilirse (adet, 8, 8) boyutunda tablo yığını döndürür (tek havuz okumasıyla).
+    """
     print("\n[SİSTEM] TRNG Kuantalama Tablosu için fiziksel entropi toplanıyor (Kamera)...")
-    tablo_degerleri = []
-
-    cap = cv2.VideoCapture(0)
-    if not cap.isOpened():
-        print("HATA: Kamera bulunamadı, varsayılan tablo kullanılıyor.")
-        return np.ones((8, 8)) * 50
-
-    ret, frame = cap.read()
-    cap.release()
-
-    if not ret: return np.ones((8, 8)) * 50
+    sekil = (8, 8) if adet is None else (adet, 8, 8)
 
-    seed = int(hashlib.sha256(frame.tobytes()).hexdigest(), 16)
-    curr = seed
+    # Kamera -> Hash -> Collatz -> Von Neumann hattı arka plandaki havuzda çalışır (entropy_pool.py)
+    havuz = varsayilan_havuz()
 
-    while len(tablo_degerleri) < 64:
-        ham_bitler = ""
-        for _ in range(50):
-            curr = collatz_adimi(curr)
-            ham_bitler += "1" if curr % 2 != 0 else "0"
+    # 1-99 arası normalizasyon: (bayt % 99) + 1 yerine yanlılıksız, bit verimli toplu çekim (sampling.py)
+    tablo_degerleri = varsayilan_ornekleyici().randint(1, 100, size=sekil)
+    if tablo_degerleri is None:
+        print(f"HATA: {havuz.hata or 'Entropi alınamadı'}, varsayılan tablo kullanılıyor.")
+        return np.ones(sekil) * 50
 
-        temiz_bitler = von_neumann_temizle(ham_bitler)
-
-        if len(temiz_bitler) >= 8:
-            sayi = int(temiz_bitler[:8], 2)
-            # 1-100 arası normalizasyon
-            normalize_deger = (sayi % 99) + 1
-            tablo_degerleri.append(normalize_deger)
-
-    return np.array(tablo_degerleri[:64]).reshape(8, 8)
+    return tablo_degerleri.reshape(sekil)
 
 
 # --- 2. JPEG SİMÜLASYON MOTORU ---
@@ -81,12 +66,55 @@ def idct2(a):
     return scipy.fftpack.idct(scipy.fftpack.idct(a, axis=0, norm='ortho'), axis=1, norm='ortho')
 
 
-def jpeg_simule_et(goruntu, kuantalama_tablosu):
+# --- TOPLU (VEKTÖREL) BLOK DCT ---
+def bloklara_bol(img):
+    """
+    (H, W) görüntüyü kopyalamadan (H/8, W/8, 8, 8) blok görünümüne çevirir.
+    """
+    h, w = img.shape
+    return img.reshape(h // 8, 8, w // 8, 8).swapaxes(1, 2)
+
+
+def bloklari_birlestir(bloklar):
+    """
+    (H/8, W/8, 8, 8) blokları tekrar (H, W) görüntüye birleştirir.
+    """
+    bh, bw = bloklar.shape[:2]
+    return bloklar.swapaxes(1, 2).reshape(bh * 8, bw * 8)
+
+
+def blok_dct(bloklar):
+    # Son iki eksendeki tüm 8x8 bloklara tek çağrıda uygulanır (dct2 ile bit düzeyinde aynı)
+    return scipy.fft.dct(scipy.fft.dct(bloklar, axis=-2, norm='ortho'), axis=-1, norm='ortho')
+
+
+def blok_idct(katsayilar):
+    return scipy.fft.idct(scipy.fft.idct(katsayilar, axis=-2, norm='ortho'), axis=-1, norm='ortho')
+
+
+def jpeg_simule_et(goruntu, kuantalama_tablosu, toplu=True):
+    """
+    Görüntüyü 8x8 bloklarda DCT -> kuantalama -> ters DCT işleminden geçirir.
+    (sıkıştırılmış görüntü, sıfır olmayan katsayı sayısı) döndürür.
+    toplu=True: tüm bloklar birkaç dizi işlemiyle birlikte işlenir.
+    toplu=False: eski blok blok döngü (scipy.fftpack).
+    """
     h, w = goruntu.shape
     h = (h // 8) * 8
     w = (w // 8) * 8
     img = goruntu[:h, :w].astype(float)
 
+    if toplu:
+        dct_bloklar = blok_dct(bloklara_bol(img) - 128)
+        kuante_bloklar = np.round(dct_bloklar / kuantalama_tablosu)
+        sifir_olmayan_katsayi = np.count_nonzero(kuante_bloklar)
+
+        dekuante_bloklar = kuante_bloklar * kuantalama_tablosu
+        sikistirilmis_img = bloklari_birlestir(blok_idct(dekuante_bloklar) + 128)
+
+        sikistirilmis_img = np.clip(sikistirilmis_img, 0, 255)
+        return sikistirilmis_img, sifir_olmayan_katsayi
+
     sikistirilmis_img = np.zeros_like(img)
     sifir_olmayan_katsayi = 0
 
@@ -114,6 +142,61 @@ def psnr_hesapla(orijinal, islenmis):
     return 20 * np.log10(max_pixel / np.sqrt(mse))
 
 
+# --- DÜŞÜK BELLEKLİ (BANTLI) SİMÜLASYON ---
+def bant_sikistir(orijinal, tablo, hedef=None):
+    """
+    8'in katı boyutlu tek bir bandı tablo.dtype hassasiyetinde sıkıştırıp geri çatar.
+    hedef verilirse geri çatılan bant uint8'e yuvarlanıp oraya yazılır.
+    (sıfır olmayan katsayı sayısı, karesel hata toplamı) döndürür.
+    """
+    bant = orijinal.astype(tablo.dtype)
+    bant -= 128
+
+    katsayilar = blok_dct(bloklara_bol(bant))
+    katsayilar /= tablo
+    np.round(katsayilar, out=katsayilar)
+    sifir_olmayan_katsayi = np.count_nonzero(katsayilar)
+    katsayilar *= tablo
+
+    bant = bloklari_birlestir(blok_idct(katsayilar))
+    bant += 128
+    np.clip(bant, 0, 255, out=bant)
+    if hedef is not None:
+        np.rint(bant, out=hedef, casting="unsafe")
+
+    bant -= orijinal
+    return sifir_olmayan_katsayi, float(np.einsum("ij,ij->", bant, bant, dtype=np.float64))
+
+
+def jpeg_simule_et_bantli(goruntu, kuantalama_tablosu, bant_blok=16, dtype=np.float32, cikti=True):
+    """
+    jpeg_simule_et + psnr_hesapla'nın düşük bellekli hali: görüntü 'bant_blok' blok satırlık bantlar
+    halinde işlenir, karesel hata geri çatma sırasında biriktirilir. Tam boyutlu float kopya, fark
+    dizisi ya da clip kopyası oluşmaz; en yüksek bellek birkaç bant boyutu kadardır.
+    (sıkıştırılmış uint8 görüntü veya cikti=False ise None, sıfır olmayan katsayı sayısı, PSNR) döndürür.
+    dtype=np.float64 ile katsayı sayısı ve PSNR jpeg_simule_et ile aynıdır; float32'de
+    yuvarlama sınırındaki birkaç katsayı farklı çıkabilir.
+    """
+    h, w = goruntu.shape
+    h = (h // 8) * 8
+    w = (w // 8) * 8
+    tablo = np.asarray(kuantalama_tablosu, dtype=dtype)
+    sikistirilmis_img = np.empty((h, w), dtype=np.uint8) if cikti else None
+    sifir_olmayan_katsayi = 0
+    hata_toplami = 0.0
+
+    for i in range(0, h, 8 * bant_blok):
+        son = min(i + 8 * bant_blok, h)
+        hedef = sikistirilmis_img[i:son] if cikti else None
+        katsayi, hata = bant_sikistir(goruntu[i:son, :w], tablo, hedef)
+        sifir_olmayan_katsayi += katsayi
+        hata_toplami += hata
+
+    mse = hata_toplami / (h * w)
+    psnr = 100 if mse == 0 else 20 * np.log10(255.0 / np.sqrt(mse))
+    return sikistirilmis_img, sifir_olmayan_katsayi, psnr
+
+
 # --- GÖRÜNTÜ KAYNAĞI SEÇİMİ ---
 def goruntu_kaynagi_al():
     print("\n" + "=" * 40)
@@ -127,8 +210,7 @@ def goruntu_kaynagi_al():
 
     if secim == '1':
         print("Kamera başlatılıyor...")
-        cap = cv2.VideoCapture(0)
-        time.sleep(1)
+        cap = kaynak_ac(isinma_suresi=1)
         ret, frame = cap.read()
         cap.release()
         if ret:
@@ -143,19 +225,9 @@ def goruntu_kaynagi_al():
         if os.path.exists(dosya_yolu):
             print(f"Dosya okunuyor: {dosya_yolu}")
             try:
-                # Türkçe karakter sorunu için numpy ile okuma
-                with open(dosya_yolu, "rb") as f:
-                    bytes_data = bytearray(f.read())
-                    numpy_array = np.asarray(bytes_data, dtype=np.uint8)
-                    img = cv2.imdecode(numpy_array, cv2.IMREAD_COLOR)
-
-                if img is not None:
-                    img_gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-                    h, w = img_gray.shape
-                    if w > 1024:
-                        scale = 1024 / w
-                        img_gray = cv2.resize(img_gray, (0, 0), fx=scale, fy=scale)
-                else:
+                # memmap + doğrudan gri, küçültülmüş çözme (image_loader.py)
+                img_gray = goruntu_yukle(dosya_yolu)
+                if img_gray is None:
                     print("Hata: Dosya formatı bozuk veya resim değil.")
             except Exception as e:
                 print(f"Okuma hatası: {e}")
@@ -1,21 +1,18 @@
-import cv2
-import hashlib
 import time
 
+import numpy as np
+
+from entropy_pool import varsayilan_havuz
+from von_neumann import von_neumann_str
+
 
 # --- YARDIMCI FONKSİYONLAR ---
 def von_neumann_debias(bit_stream):
     """
     Ham bit akışını Von Neumann kuralına göre süzgeçten geçirir.
+    (Vektörel sürüm: von_neumann.py)
     """
-    clean_bits = ""
-    for i in range(0, len(bit_stream) - 1, 2):
-        pair = bit_stream[i: i + 2]
-        if pair == "01":
-            clean_bits += "0"
-        elif pair == "10":
-            clean_bits += "1"
-    return clean_bits
+    return von_neumann_str(bit_stream)
 
 
 def collatz_step(n):
@@ -35,76 +32,38 @@ def full_system_test(hedef_sayi_adedi=100):
     print("Yöntem: Kamera -> Hash -> Collatz -> Von Neumann -> Tam Sayı")
     print("Lütfen bekleyin, temiz veri toplanıyor...\n")
 
-    cap = cv2.VideoCapture(0)
-    if not cap.isOpened():
-        print("Hata: Kamera bulunamadı.")
-        return
-
-    # İstatistik Değişkenleri
-    bit_havuzu = ""  # İşlenmeyi bekleyen temiz bitler
-    uretilen_sayilar = []  # Sonuç sayıları listesi
-
-    toplam_islenen_ham_bit = 0
-    toplam_sifir_bit = 0  # Bit bazında 0 sayacı
-    toplam_bir_bit = 0  # Bit bazında 1 sayacı
-
-    tek_sayi_sayaci = 0  # Sayı bazında Tek sayacı
-    cift_sayi_sayaci = 0  # Sayı bazında Çift sayacı
+    # Kamera -> Hash -> Collatz -> Von Neumann hattı arka plandaki havuzda çalışır
+    havuz = varsayilan_havuz()
+    ham_bit_baslangic = havuz.ham_bit_sayisi
+    temiz_bit_baslangic = havuz.temiz_bit_sayisi
 
     start_time = time.time()
 
-    # Yeterli sayıda tam sayı üretene kadar döngü
-    while len(uretilen_sayilar) < hedef_sayi_adedi:
-        ret, frame = cap.read()
-        if not ret: continue
-
-        # 1. Tohum (Seed)
-        h = hashlib.sha256(frame.tobytes()).hexdigest()
-        seed = int(h, 16)
-
-        # 2. Ham Bit Akışı (Collatz ile) - Her karede 64 bit üretelim
-        ham_akis = ""
-        curr = seed
-        for _ in range(64):
-            curr = collatz_step(curr)
-            ham_akis += "1" if curr % 2 != 0 else "0"
-
-        toplam_islenen_ham_bit += len(ham_akis)
-
-        # 3. Von Neumann Temizliği
-        temiz_akis = von_neumann_debias(ham_akis)
-
-        # Bit istatistiklerini kaydet
-        toplam_sifir_bit += temiz_akis.count('0')
-        toplam_bir_bit += temiz_akis.count('1')
-
-        # Temiz bitleri havuza ekle
-        bit_havuzu += temiz_akis
-
-        # 4. Sayı Oluşturma (8 bit = 1 Sayı)
-        while len(bit_havuzu) >= 8:
-            # İlk 8 biti al ve kes
-            byte_parcasi = bit_havuzu[:8]
-            bit_havuzu = bit_havuzu[8:]
+    # 1-3. Temiz bitleri havuzdan tek seferde al (8 bit = 1 Sayı)
+    temiz_akis = havuz.read_bits(8 * hedef_sayi_adedi)
+    if temiz_akis is None:
+        print(f"Hata: {havuz.hata or 'Entropi alınamadı.'}")
+        return
 
-            # Binary string'i sayıya çevir (Örn: "10110010" -> 178)
-            sayi = int(byte_parcasi, 2)
-            uretilen_sayilar.append(sayi)
+    # Bit istatistiklerini kaydet
+    toplam_bir_bit = int(temiz_akis.sum())
+    toplam_sifir_bit = temiz_akis.size - toplam_bir_bit
 
-            # Tek mi Çift mi Analizi
-            if sayi % 2 == 0:
-                cift_sayi_sayaci += 1
-            else:
-                tek_sayi_sayaci += 1
+    # 4. Sayı Oluşturma (Örn: 10110010 -> 178)
+    uretilen_sayilar = np.packbits(temiz_akis).tolist()
 
-            # İlerleme durumunu göster (Hedef sayıya ulaşma yüzdesi)
-            if len(uretilen_sayilar) % 5 == 0:
-                print(".", end="", flush=True)
+    # Tek mi Çift mi Analizi (sayının son biti)
+    tek_sayi_sayaci = int(temiz_akis[7::8].sum())
+    cift_sayi_sayaci = len(uretilen_sayilar) - tek_sayi_sayaci
 
-            if len(uretilen_sayilar) >= hedef_sayi_adedi:
-                break
+    # Havuzun bu test sırasında işlediği ham ve temiz bit (verimlilik için)
+    toplam_islenen_ham_bit = havuz.ham_bit_sayisi - ham_bit_baslangic
+    toplam_kurtarilan_bit = havuz.temiz_bit_sayisi - temiz_bit_baslangic
+    if toplam_islenen_ham_bit == 0:
+        # Bitlerin hepsi havuzda hazır bekliyordu; genel verimliliği kullan
+        toplam_islenen_ham_bit = havuz.ham_bit_sayisi
+        toplam_kurtarilan_bit = havuz.temiz_bit_sayisi
 
-    cap.release()
     gecen_sure = time.time() - start_time
     print(f"\n\nTest Tamamlandı! ({gecen_sure:.2f} sn)")
 
@@ -112,7 +71,7 @@ def full_system_test(hedef_sayi_adedi=100):
 
     # 1. BÖLÜM: Verimlilik ve Bit Analizi
     toplam_temiz_bit = toplam_sifir_bit + toplam_bir_bit
-    verimlilik = (toplam_temiz_bit / toplam_islenen_ham_bit) * 100
+    verimlilik = (toplam_kurtarilan_bit / toplam_islenen_ham_bit) * 100
     bit_0_orani = (toplam_sifir_bit / toplam_temiz_bit) * 100
     bit_1_orani = (toplam_bir_bit / toplam_temiz_bit) * 100
 
@@ -121,7 +80,7 @@ def full_system_test(hedef_sayi_adedi=100):
     print("=" * 50)
     print(f"I. SİSTEM VERİMLİLİĞİ (Von Neumann)")
     print(f"- İşlenen Ham Bit  : {toplam_islenen_ham_bit}")
-    print(f"- Kurtarılan Bit   : {toplam_temiz_bit}")
+    print(f"- Kurtarılan Bit   : {toplam_kurtarilan_bit}")
     print(f"- Arıtma Oranı     : %{verimlilik:.2f}")
     print("-" * 50)
 
@@ -139,6 +98,16 @@ def full_system_test(hedef_sayi_adedi=100):
     print(f"- Üretilen Sayı    : {toplam_sayi} adet")
     print(f"- Çift Sayılar     : {cift_sayi_sayaci} adet (Oran: %{cift_orani:.2f})")
     print(f"- Tek Sayılar      : {tek_sayi_sayaci}  adet (Oran: %{tek_orani:.2f})")
+
+    # 3. BÖLÜM: Sürekli Sağlık Testleri (SP 800-90B)
+    if havuz.saglik is not None:
+        sayac = havuz.saglik.sayaclar
+        print("-" * 50)
+        print(f"IV. SAĞLIK TESTLERİ (SP 800-90B)")
+        print(f"- İncelenen Kare   : {sayac['kare']}")
+        print(f"- Atılan Kare      : {sayac['atilan_kare']}")
+        print(f"- RCT / APT Hatası : {sayac['rct_hata']} / {sayac['apt_hata']}")
+        print(f"- Tekrar Eden Kare : {sayac['tekrar_kare']}")
     print("=" * 50)
 
     # --- YORUM ---
@@ -1,7 +1,9 @@
-import cv2
-import hashlib
 import time
 
+from collatz import collatz_advance, collatz_toplu
+from conditioning import Kosullandirici
+from frame_sources import kaynak_ac
+
 
 # --- YARDIMCI FONKSİYONLAR ---
 def collatz_step(n):
@@ -18,12 +20,8 @@ def collatz_process(seed_number):
     """
     # Adım sayısı da seed'e bağlı olarak dinamik olsun (100 ile 500 adım arası)
     adim_sayisi = (seed_number % 400) + 100
-    current = seed_number
-
-    for _ in range(adim_sayisi):
-        current = collatz_step(current)
-
-    return current
+    # Çok adımlı motor: tek adımlı döngüyle aynı sonucu verir (collatz.py)
+    return collatz_advance(seed_number, adim_sayisi)
 
 
 # --- TEST FONKSİYONU ---
@@ -32,34 +30,41 @@ def collatz_turing_test(ornek_sayisi=100):
     print(f"Hedef: {ornek_sayisi} adet 'kaotik sayı' üretmek ve incelemek.")
     print("Kamera 'Seri Çekim' modunda açılıyor (Lütfen bekleyin)...\n")
 
-    cap = cv2.VideoCapture(0)
+    # Kameranın ısınması için açılışta bekler (BSG_KAYNAK ile dosya/sentetik kaynak da seçilebilir)
+    cap = kaynak_ac(isinma_suresi=1)
     if not cap.isOpened():
         print("Hata: Kamera bulunamadı.")
         return
 
+    # Tüm kare SHA-256 (kopyasız, hex string'e çevirmeden)
+    kosullandirici = Kosullandirici()
+
     toplam_sifir = 0
     toplam_bir = 0
     cift_sayi_adedi = 0
     tek_sayi_adedi = 0
 
-    # Kameranın ısınması için bekle
-    time.sleep(1)
-
     baslangic_zamani = time.time()
 
+    # 1. FİZİKSEL TOHUMLAR (SEED) - önce tüm kareler okunup özetlenir
+    tohumlar = []
     for i in range(ornek_sayisi):
         ret, frame = cap.read()
         if not ret: continue
 
-        # 1. FİZİKSEL TOHUM (SEED)
-        hash_val = hashlib.sha256(frame.tobytes()).hexdigest()
-        seed = int(hash_val, 16)
+        tohumlar.append(kosullandirici.tohum(frame))
 
-        # 2. MATEMATİKSEL KAOS (COLLATZ)
-        # Seed'i alıp Collatz tüneline sokuyoruz
-        final_sayi = collatz_process(seed)
+        # İlerleme göstergesi
+        if i % 10 == 0:
+            print(f"İşleniyor... (%{int((i / ornek_sayisi) * 100)})")
+
+    # 2. MATEMATİKSEL KAOS (COLLATZ)
+    # Tüm tohumlar birlikte Collatz tüneline sokulur (toplu mod, collatz.py);
+    # her tohumun adım sayısı collatz_process'teki gibi (seed % 400) + 100
+    _, final_sayilar = collatz_toplu(tohumlar, [(seed % 400) + 100 for seed in tohumlar])
 
-        # 3. ANALİZ
+    # 3. ANALİZ
+    for final_sayi in final_sayilar:
         # Çıkan sayıyı Binary'ye çevirip 0 ve 1'leri sayalım
         binary_str = bin(final_sayi)[2:]
         toplam_sifir += binary_str.count('0')
@@ -71,10 +76,6 @@ def collatz_turing_test(ornek_sayisi=100):
         else:
             tek_sayi_adedi += 1
 
-        # İlerleme göstergesi
-        if i % 10 == 0:
-            print(f"İşleniyor... (%{int((i / ornek_sayisi) * 100)})")
-
     cap.release()
     gecen_sure = time.time() - baslangic_zamani
     print(f"\nTest Tamamlandı! ({gecen_sure:.2f} saniye sürdü)\n")
@@ -1,6 +1,8 @@
 import cv2
-import hashlib
-import time
+
+from collatz import collatz_advance
+from entropy_pool import varsayilan_havuz
+from sampling import AralikOrnekleyici
 
 
 def collatz_step(n):
@@ -15,35 +17,26 @@ def collatz_step(n):
 
 
 def collatz_chaos_generator(min_deger=1, max_deger=100):
-    print("Kamera başlatılıyor (Collatz Modu)...")
-    cap = cv2.VideoCapture(0)
-
-    if not cap.isOpened():
-        print("Hata: Kamera açılamadı.")
-        return None
-
-    time.sleep(0.5)  # Işık ayarı için bekle
-    ret, frame = cap.read()
-    cap.release()
-
-    if not ret:
-        print("Görüntü alınamadı.")
+    print("Entropi havuzuna bağlanılıyor (Collatz Modu)...")
+    # Kamera arka plandaki havuzda sürekli açık; burada sadece bellekten bit okuyoruz
+    havuz = varsayilan_havuz()
+
+    # --- 1. FİZİKSEL TOHUMU (SEED) AL ---
+    # Havuzdaki bitler zaten Kamera -> SHA-256 -> Collatz -> Von Neumann hattından geçti
+    tohum_baytlari = havuz.read_bytes(32)
+    if tohum_baytlari is None:
+        print(f"Hata: {havuz.hata or 'Entropi alınamadı.'}")
         return None
 
-    # --- 1. GÖRÜNTÜYÜ GÖSTER ---
-    print("Görüntü ekranda. Devam etmek için resim penceresinde bir tuşa basın.")
-    cv2.imshow("Collatz Entropi Kaynagi", frame)
-    cv2.waitKey(0)
-    cv2.destroyAllWindows()
-
-    # --- 2. FİZİKSEL TOHUMU (SEED) OLUŞTUR ---
-    # Görüntüyü SHA-256 ile özetle
-    frame_bytes = frame.tobytes()
-    hash_object = hashlib.sha256(frame_bytes)
-    hex_dig = hash_object.hexdigest()
+    # --- 2. GÖRÜNTÜYÜ GÖSTER ---
+    if havuz.son_kare is not None:
+        print("Görüntü ekranda. Devam etmek için resim penceresinde bir tuşa basın.")
+        cv2.imshow("Collatz Entropi Kaynagi", havuz.son_kare)
+        cv2.waitKey(0)
+        cv2.destroyAllWindows()
 
-    # Bu devasa sayıyı başlangıç noktamız (n) olarak alıyoruz
-    baslangic_sayisi = int(hex_dig, 16)
+    # Bu devasa sayıyı (256 bit) başlangıç noktamız (n) olarak alıyoruz
+    baslangic_sayisi = int.from_bytes(tohum_baytlari, "big")
 
     # --- 3. ADIM SAYISINI BELİRLE ---
     # Collatz algoritmasını kaç adım çalıştıracağız?
@@ -58,19 +51,29 @@ def collatz_chaos_generator(min_deger=1, max_deger=100):
     # --- 4. COLLATZ TÜNELİ (MATEMATİKSEL KAOS) ---
     mevcut_sayi = baslangic_sayisi
 
-    for i in range(adim_sayisi):
+    # Sadece görselleştirmek için ilk 3 ve son 2 adımı tek tek yazdıralım
+    for i in range(3):
         mevcut_sayi = collatz_step(mevcut_sayi)
+        print(f"Adım {i + 1}: {mevcut_sayi} (İşleniyor...)")
 
-        # Sadece görselleştirmek için ilk 5 ve son 5 adımı yazdıralım
-        if i < 3 or i > adim_sayisi - 3:
-            print(f"Adım {i + 1}: {mevcut_sayi} (İşleniyor...)")
-        elif i == 3:
-            print("... (Matematiksel karıştırma devam ediyor) ...")
+    print("... (Matematiksel karıştırma devam ediyor) ...")
+    # Aradaki adımları çok adımlı motorla tek seferde atla (collatz.py)
+    mevcut_sayi = collatz_advance(mevcut_sayi, adim_sayisi - 5)
+
+    for i in range(adim_sayisi - 2, adim_sayisi):
+        mevcut_sayi = collatz_step(mevcut_sayi)
+        print(f"Adım {i + 1}: {mevcut_sayi} (İşleniyor...)")
 
     # --- 5. SONUÇ İNDİRGEME ---
-    # Collatz sürecinden çıkan son sayıyı istediğimiz aralığa (min-max) sığdırıyoruz
-    aralik = max_deger - min_deger + 1
-    final_rastgele_sayi = (mevcut_sayi % aralik) + min_deger
+    # Collatz sürecinden çıkan son sayıyı istediğimiz aralığa (min-max) sığdırıyoruz.
+    # (mevcut_sayi % aralik) küçük değerleri kayırır; bunun yerine sayının bitleri
+    # yanlılıksız örnekleyiciye verilir, nadir ret durumunda eksik bitler havuzdan gelir.
+    ornekleyici = AralikOrnekleyici(havuz)
+    # En üst bit her zaman 1 olduğundan örnekleyiciye katılmaz
+    ornekleyici.bitleri_ekle(mevcut_sayi, mevcut_sayi.bit_length() - 1)
+    final_rastgele_sayi = ornekleyici.randrange(min_deger, max_deger + 1)
+    if final_rastgele_sayi is None:
+        print(f"Hata: {havuz.hata or 'Entropi alınamadı.'}")
 
     return final_rastgele_sayi
 
@@ -0,0 +1,202 @@
+import asyncio
+import concurrent.futures
+import functools
+
+import numpy as np
+
+from entropy_pool import varsayilan_havuz
+from sampling import AralikOrnekleyici
+
+
+# --- ASYNCIO İSTEMCİ ARAYÜZÜ ---
+# Kamera okuma, hash ve Collatz zaten havuzun arka plan thread'inde (ya da capture_supervisor
+# süreçlerinde) çalışır; olay döngüsünü bloklayan tek şey entropi beklemektir.
+#   - Havuz beklemesi toplayıcıya ayrılmış tek thread'lik yürütücüde, aralık örnekleme gibi CPU işi
+#     'yurutucu'da (varsayılan: döngünün yürütücüsü) çalışır. Ayrı tutulmaları, örnekleyici
+#     thread'leri toplayıcıyı beklerken yürütücünün tükenip kilitlenmesini önler.
+#   - Aynı anda gelen küçük istekler tek bir toplayıcı görevde birleşip tek havuz okumasıyla
+#     karşılanır; sonuç istek sırasına göre dilimlenir.
+#     Birleşik okuma isteklerin süresiyle sınırlıdır; parti karşılanamazsa eldekine sığan istekler
+#     ayrı ayrı karşılanır.
+#   - İstek kuyruğu sınırlıdır: çağıranlar entropi hızını aşarsa 'await' kuyrukta bekler (backpressure).
+class AsyncEntropiHavuzu:
+    """
+    Havuz benzeri (read_bytes / hata) bir kaynağın asyncio sarmalayıcısı:
+
+        async with AsyncEntropiHavuzu() as havuz:
+            baytlar = await havuz.read_bytes(32)
+            zar = await havuz.randint(1, 7, size=10)
+            async for bitler in havuz.bit_parcalari(4096):
+                ...
+
+    kaynak     : EntropiHavuzu, YakalamaYoneticisi, DrbgUreteci ... (None = varsayılan havuz)
+    parti_bayt : birleştirilen isteklerin tek okumadaki üst sınırı
+    maks_istek : kuyrukta bekleyebilecek istek sayısı (fazlası 'await' ile bekletilir)
+    """
+
+    def __init__(self, kaynak=None, yurutucu=None, parti_bayt=1 << 16, maks_istek=1024):
+        self.kaynak = kaynak
+        self.yurutucu = yurutucu
+        self.parti_bayt = parti_bayt
+        self.maks_istek = maks_istek
+
+        self._kuyruk = None
+        self._toplayici = None
+        self._dongu = None
+        self._ornekleyici = None
+        self._okuma_yurutucu = None
+
+        self.okuma_sayisi = 0
+        self.istek_sayisi = 0
+
+    @property
+    def hata(self):
+        return getattr(self.kaynak, "hata", None)
+
+    def _baslat(self):
+        dongu = asyncio.get_running_loop()
+        if self._toplayici is None or self._dongu is not dongu:
+            if self.kaynak is None:
+                self.kaynak = varsayilan_havuz()
+            self._dongu = dongu
+            if self._okuma_yurutucu is None:
+                self._okuma_yurutucu = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="bsg-async-okuma")
+            self._kuyruk = asyncio.Queue(maxsize=self.maks_istek)
+            self._toplayici = dongu.create_task(self._topla())
+
+    async def aclose(self):
+        if self._toplayici is not None:
+            self._toplayici.cancel()
+            try:
+                await self._toplayici
+            except asyncio.CancelledError:
+                pass
+            self._toplayici = None
+        if self._okuma_yurutucu is not None:
+            self._okuma_yurutucu.shutdown(wait=False)
+            self._okuma_yurutucu = None
+
+    async def __aenter__(self):
+        self._baslat()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+    async def _oku(self, n, blok=True, zaman_asimi=None):
+        return await self._dongu.run_in_executor(
+            self._okuma_yurutucu,
+            functools.partial(self.kaynak.read_bytes, n, blok=blok, zaman_asimi=zaman_asimi))
+
+    async def _topla(self):
+        # Tek toplayıcı görev: kuyruktaki istekleri parti_bayt'a kadar birleştirip tek okumada karşılar
+        while True:
+            istekler = [await self._kuyruk.get()]
+            toplam = istekler[0][0]
+            while toplam < self.parti_bayt and not self._kuyruk.empty():
+                istek = self._kuyruk.get_nowait()
+                istekler.append(istek)
+                toplam += istek[0]
+
+            # İptal edilmiş / süresi dolmuş isteklerin baytları okunmaz
+            istekler = [istek for istek in istekler if not istek[1].done()]
+            toplam = sum(n for n, _, _ in istekler)
+            if not istekler:
+                continue
+
+            # Birleşik okuma en geç biten isteğin süresi kadar bekler (süresiz istek varsa süresiz);
+            # böylece takılan kaynak toplayıcıyı isteklerin süresinden uzun tutmaz
+            son_anlar = [son_an for _, _, son_an in istekler]
+            zaman_asimi = None if None in son_anlar else max(0.0, max(son_anlar) - self._dongu.time())
+
+            try:
+                baytlar = await self._oku(toplam, zaman_asimi=zaman_asimi)
+                if baytlar is not None:
+                    sonuclar = []
+                    bas = 0
+                    for n, _, _ in istekler:
+                        sonuclar.append(baytlar[bas:bas + n])
+                        bas += n
+                elif len(istekler) > 1:
+                    # Parti karşılanamadı (zaman aşımı / kaynak hatası). Havuz yarım okumayı geri
+                    # koyduğu için eldeki bitlere sığan istekler sırayla beklemeden karşılanır.
+                    sonuclar = []
+                    for n, f, _ in istekler:
+                        sonuclar.append(None if f.done() else await self._oku(n, blok=False))
+                else:
+                    sonuclar = [None]
+            except Exception as e:
+                for _, f, _ in istekler:
+                    if not f.done():
+                        f.set_exception(e)
+                continue
+
+            self.okuma_sayisi += 1
+            for (_, f, _), sonuc in zip(istekler, sonuclar):
+                if not f.done():
+                    f.set_result(sonuc)
+
+    # --- TÜKETİCİ API ---
+    async def read_bytes(self, n, zaman_asimi=None):
+        """
+        n bayt döndürür; kaynak hatasında veya zaman aşımında None döner.
+        """
+        self._baslat()
+        if n == 0:
+            return b""
+        self.istek_sayisi += 1
+        sonuc = self._dongu.create_future()
+        son_an = None if zaman_asimi is None else self._dongu.time() + zaman_asimi
+        await self._kuyruk.put((n, sonuc, son_an))
+        try:
+            return await asyncio.wait_for(sonuc, zaman_asimi)
+        except asyncio.TimeoutError:
+            return None
+
+    async def read_bits(self, n, zaman_asimi=None):
+        baytlar = await self.read_bytes((n + 7) // 8, zaman_asimi)
+        if baytlar is None:
+            return None
+        return np.unpackbits(np.frombuffer(baytlar, dtype=np.uint8), count=n)
+
+    async def randint(self, low, high, size=None):
+        """
+        sampling.AralikOrnekleyici ile yanlılıksız [low, high) çekimi. Örnekleyici yürütücüde
+        çalışır; bit ihtiyacı yine toplayıcı üzerinden diğer isteklerle birleştirilir.
+        """
+        self._baslat()
+        if self._ornekleyici is None:
+            self._ornekleyici = AralikOrnekleyici(_DonguKoprusu(self))
+        return await self._dongu.run_in_executor(
+            self.yurutucu, functools.partial(self._ornekleyici.randint, low, high, size))
+
+    async def bit_parcalari(self, parca_bit=4096, adet=None):
+        """
+        parca_bit'lik 0/1 bit dizileri veren async yineleyici (adet=None: kaynak bitene kadar).
+        """
+        i = 0
+        while adet is None or i < adet:
+            bitler = await self.read_bits(parca_bit)
+            if bitler is None:
+                return
+            yield bitler
+            i += 1
+
+
+class _DonguKoprusu:
+    """
+    Yürütücü thread'inden olay döngüsündeki toplayıcıya bit isteği ileten havuz benzeri nesne.
+    """
+
+    def __init__(self, async_havuz):
+        self.async_havuz = async_havuz
+
+    @property
+    def hata(self):
+        return self.async_havuz.hata
+
+    def read_bits(self, n, blok=True, zaman_asimi=None):
+        gelecek = asyncio.run_coroutine_threadsafe(self.async_havuz.read_bits(n, zaman_asimi),
+                                                   self.async_havuz._dongu)
+        return gelecek.result()
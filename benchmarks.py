@@ -0,0 +1,268 @@
+import argparse
+import hashlib
+import json
+import os
+import platform
+import sys
+import time
+
+import cv2
+import numpy as np
+
+from collatz import collatz_bits, collatz_step, collatz_toplu
+from conditioning import Kosullandirici
+from frame_sources import HamDokumKaynagi, SentetikKaynak, kareleri_kaydet
+from JPEG_with_RNG import jpeg_simule_et, jpeg_simule_et_bantli, psnr_hesapla, standart_tablo
+from rd_sweep import TabloDegerlendirici
+from von_neumann import bits_to_str, peres_packed, von_neumann_packed, von_neumann_str
+
+
+# --- AŞAMA BAZLI PERFORMANS ÖLÇÜMÜ ---
+# collatz_turing_test / full_system_test sonundaki 'geçen süre' kamera gecikmesiyle hesabı karıştırır.
+# Burada her aşama kaydedilmiş kareler ve ORİJİNAL.png üzerinde ayrı ayrı ölçülür:
+#   yakalama, SHA-256 koşullandırma, collatz_step döngüsü (ve çok adımlı motorlar), Von Neumann,
+#   bit -> tam sayı paketleme, jpeg_simule_et, psnr_hesapla (ve bantlı, düşük bellekli hali),
+#   Huffman bayt tahmini.
+# Her ölçüm 'tekrar' kez çalıştırılır, en iyi süre alınır; hız = iş birimi / saniye.
+# Kamera gerekmez: kare dökümü yoksa sabit tohumlu sentetik kareler bir kez kaydedilir; özeti
+# KARE_OZETI ile doğrulanır (PCG64 akışı NumPy sürümleri arasında sabittir).
+# Sonuçlar JSON olarak yazılır ve depodaki referans temel (benchmark_temel.json) ile karşılaştırılır.
+# Temel yoksa ya da farklı fikstürlerle ölçülmüşse karşılaştırma açık bir mesajla atlanır.
+VARSAYILAN_KARELER = "benchmark_kareler.npy"
+VARSAYILAN_TEMEL = "benchmark_temel.json"
+VARSAYILAN_CIKTI = "benchmark_sonuclari.json"
+
+# SentetikKaynak(2024), 64 kare (480, 640, 3) dökümünün SHA-256 özeti
+KARE_OZETI = "1174fc43ec4b9024cb0b4cec8c210a3f0b83fa0be71c4ab167e3d417469d23f7"
+
+
+def kare_fiksturu(yol=VARSAYILAN_KARELER, adet=64, tohum=2024):
+    """
+    Kaydedilmiş kare dökümünü döndürür. Dosya yoksa sabit tohumlu sentetik kareler kaydedilir
+    (kamera kaydı için: kareleri_kaydet(kaynak_ac("kamera:0"), yol, adet)).
+    """
+    if not os.path.exists(yol):
+        print(f"[BENCH] {yol} bulunamadı, sabit tohumlu sentetik kareler kaydediliyor...")
+        kareleri_kaydet(SentetikKaynak(tohum, adet=adet), yol, adet)
+        kareler = np.load(yol, mmap_mode="r")
+        if (adet, tohum) == (64, 2024) and dizi_ozeti(kareler) != KARE_OZETI:
+            print("Uyarı: Üretilen sentetik kareler KARE_OZETI ile eşleşmiyor; temelle karşılaştırma geçersiz olur.")
+        return kareler
+    return np.load(yol, mmap_mode="r")
+
+
+def dizi_ozeti(dizi):
+    return hashlib.sha256(np.ascontiguousarray(dizi)).hexdigest()
+
+
+def goruntu_oku(yol):
+    # Türkçe karakter sorunu için numpy ile okuma
+    return cv2.imdecode(np.fromfile(yol, dtype=np.uint8), cv2.IMREAD_GRAYSCALE)
+
+
+def olc(fonksiyon, tekrar=5, min_sure=0.1):
+    """
+    fonksiyon'u ölçer, (çağrı başına en iyi süre, son dönüş değeri) döndürür.
+    Kısa işler bir denemede en az min_sure sürecek kadar art arda çağrılır (zamanlayıcı gürültüsü);
+    tekrar deneme içinden en iyisi alınır.
+    """
+    baslangic = time.perf_counter()
+    sonuc = fonksiyon()
+    ilk = time.perf_counter() - baslangic
+    cagri = max(1, int(min_sure / ilk)) if ilk > 0 else 1000
+
+    en_iyi = ilk
+    for _ in range(tekrar):
+        baslangic = time.perf_counter()
+        for _ in range(cagri):
+            sonuc = fonksiyon()
+        en_iyi = min(en_iyi, (time.perf_counter() - baslangic) / cagri)
+    return en_iyi, sonuc
+
+
+class Olcumler:
+    """
+    Aşama sonuçlarını toplar: {ad: {"sure_s", "birim", "miktar", "hiz"}}.
+    """
+
+    def __init__(self, tekrar=5):
+        self.tekrar = tekrar
+        self.sonuclar = {}
+
+    def ekle(self, ad, fonksiyon, miktar, birim, tekrar=None):
+        sure, sonuc = olc(fonksiyon, tekrar or self.tekrar)
+        hiz = miktar / sure if sure > 0 else float("inf")
+        self.sonuclar[ad] = {"sure_s": sure, "birim": birim, "miktar": miktar, "hiz": hiz}
+        print(f"  {ad:<32}: {hiz:>14,.0f} {birim}/s  ({sure * 1000:.2f} ms)")
+        return sonuc
+
+
+def asamalari_olc(kareler, goruntu, tekrar=5, collatz_adim=100):
+    olcumler = Olcumler(tekrar)
+    kare_sayisi = len(kareler)
+    kare_bayt = kareler[0].nbytes
+
+    print("\n[1] Yakalama (kaydedilmiş kareler, kamera gecikmesi hariç)")
+
+    def yakalama():
+        cap = HamDokumKaynagi(kareler.filename)
+        okunan = 0
+        while True:
+            parti = cap.read_batch(cap.parti_boyutu)
+            if len(parti) == 0:
+                break
+            # Kamera her karede yeni bir tampon verir; memmap dilimini de belleğe kopyala
+            okunan += len(np.array(parti))
+        cap.release()
+        return okunan
+    olcumler.ekle("yakalama", yakalama, kare_sayisi, "kare")
+
+    kareler = np.ascontiguousarray(kareler)
+    print("\n[2] Koşullandırma (SHA-256)")
+    olcumler.ekle("sha256_kosullandirma", lambda: [int(hashlib.sha256(f).hexdigest(), 16) for f in kareler],
+                  kare_sayisi, "kare")
+    kosullandirici = Kosullandirici()
+    tohumlar = olcumler.ekle("sha256_kosullandirici", lambda: [kosullandirici.tohum(f) for f in kareler],
+                             kare_sayisi, "kare")
+    olcumler.ekle("sha256_bant_genisligi", lambda: [hashlib.sha256(f).digest() for f in kareler],
+                  kare_sayisi * kare_bayt, "bayt")
+
+    print(f"\n[3] Collatz ({collatz_adim} adım / tohum, ham bit)")
+    ham_bit = kare_sayisi * collatz_adim
+
+    def collatz_dongusu():
+        # Scriptlerdeki döngünün aynısı
+        bitler = []
+        for n in tohumlar:
+            for _ in range(collatz_adim):
+                n = collatz_step(n)
+                bitler.append("1" if n % 2 else "0")
+        return "".join(bitler)
+    ham_str = olcumler.ekle("collatz_step_dongusu", collatz_dongusu, ham_bit, "ham_bit")
+    olcumler.ekle("collatz_bits_motor", lambda: [collatz_bits(n, collatz_adim) for n in tohumlar],
+                  ham_bit, "ham_bit")
+    olcumler.ekle("collatz_toplu", lambda: collatz_toplu(tohumlar, collatz_adim), ham_bit, "ham_bit")
+
+    print("\n[4] Von Neumann (giriş ham bit)")
+    # Aşamayı tek başına ölçmek için büyük, sabit tohumlu bir bit tamponu
+    rng = np.random.default_rng(7)
+    ham_bitler = rng.integers(0, 2, size=1 << 22, dtype=np.uint8)
+    paketli = np.packbits(ham_bitler)
+    ham_str_buyuk = bits_to_str(ham_bitler[:1 << 18])
+    olcumler.ekle("von_neumann_str", lambda: von_neumann_str(ham_str_buyuk), len(ham_str_buyuk), "ham_bit")
+    _, temiz_sayi = olcumler.ekle("von_neumann_packed", lambda: von_neumann_packed(paketli, ham_bitler.size),
+                                  ham_bitler.size, "ham_bit")
+    olcumler.sonuclar["von_neumann_packed"]["temiz_bit_hizi"] = (
+        temiz_sayi / olcumler.sonuclar["von_neumann_packed"]["sure_s"])
+    _, temiz_sayi = olcumler.ekle("peres_packed_d4", lambda: peres_packed(paketli, ham_bitler.size, 4),
+                                  ham_bitler.size, "ham_bit")
+    olcumler.sonuclar["peres_packed_d4"]["temiz_bit_hizi"] = (
+        temiz_sayi / olcumler.sonuclar["peres_packed_d4"]["sure_s"])
+    olcumler.ekle("von_neumann_kare_ciktisi", lambda: von_neumann_str(ham_str), len(ham_str), "ham_bit")
+
+    print("\n[5] Bit -> tam sayı paketleme (64 bitlik sayılar)")
+    sayi_bitleri = ham_bitler[:64 * 4096]
+    sayi_str = [bits_to_str(sayi_bitleri[i:i + 64]) for i in range(0, sayi_bitleri.size, 64)]
+    olcumler.ekle("int_str_donusumu", lambda: [int(s, 2) for s in sayi_str], len(sayi_str), "sayi")
+    olcumler.ekle("packbits_uint64", lambda: np.packbits(sayi_bitleri).view(">u8"), len(sayi_str), "sayi")
+
+    print("\n[6] JPEG simülasyonu ve PSNR")
+    h, w = goruntu.shape
+    blok_sayisi = (h // 8) * (w // 8)
+    goruntu_float = goruntu[:(h // 8) * 8, :(w // 8) * 8].astype(float)
+    sikistirilmis, _ = olcumler.ekle("jpeg_simule_et", lambda: jpeg_simule_et(goruntu, standart_tablo),
+                                     blok_sayisi, "blok")
+    olcumler.ekle("jpeg_simule_et_dongu", lambda: jpeg_simule_et(goruntu, standart_tablo, toplu=False),
+                  blok_sayisi, "blok", tekrar=1)
+    olcumler.ekle("psnr_hesapla", lambda: psnr_hesapla(goruntu_float, sikistirilmis),
+                  goruntu_float.size, "piksel")
+    olcumler.ekle("jpeg_bantli_psnr_f32", lambda: jpeg_simule_et_bantli(goruntu, standart_tablo),
+                  blok_sayisi, "blok")
+    degerlendirici = TabloDegerlendirici(goruntu)
+    olcumler.ekle("huffman_bayt_tahmini", lambda: degerlendirici.bayt_tahmini(standart_tablo),
+                  blok_sayisi, "blok")
+
+    return olcumler.sonuclar
+
+
+def temelle_karsilastir(sonuclar, temel, tolerans=0.2):
+    """
+    Hızı temelin (1 - tolerans) katının altına düşen aşamaları listeler.
+    """
+    gerilemeler = []
+    print("\n" + "=" * 64)
+    print(f"{'AŞAMA':<32}{'TEMEL':>14}{'ŞİMDİ':>14}{'ORAN':>8}")
+    print("=" * 64)
+    for ad, olcum in sonuclar.items():
+        if ad not in temel:
+            continue
+        oran = olcum["hiz"] / temel[ad]["hiz"]
+        isaret = "✅" if oran >= 1 - tolerans else "❌"
+        print(f"{ad:<32}{temel[ad]['hiz']:>14,.0f}{olcum['hiz']:>14,.0f}{oran:>7.2f}x {isaret}")
+        if oran < 1 - tolerans:
+            gerilemeler.append(ad)
+    print("=" * 64)
+    return gerilemeler
+
+
+def ortam_bilgisi():
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "opencv": cv2.__version__,
+        "platform": platform.platform(),
+        "islemci": platform.processor() or platform.machine(),
+        "zaman": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+# --- ÇALIŞTIRMA ---
+if __name__ == "__main__":
+    ayrac = argparse.ArgumentParser(description="BSG-RNG aşama bazlı performans ölçümü")
+    ayrac.add_argument("--kareler", default=VARSAYILAN_KARELER, help="kaydedilmiş kare dökümü (.npy)")
+    ayrac.add_argument("--goruntu", default="ORİJİNAL.png")
+    ayrac.add_argument("--tekrar", type=int, default=5)
+    ayrac.add_argument("--cikti", default=VARSAYILAN_CIKTI, help="JSON sonuç dosyası")
+    ayrac.add_argument("--temel", default=VARSAYILAN_TEMEL, help="karşılaştırılacak temel JSON")
+    ayrac.add_argument("--temel-kaydet", action="store_true", help="sonuçları yeni temel olarak kaydet")
+    ayrac.add_argument("--tolerans", type=float, default=0.2, help="izin verilen yavaşlama oranı")
+    argumanlar = ayrac.parse_args()
+
+    goruntu = goruntu_oku(argumanlar.goruntu)
+    if goruntu is None:
+        print(f"Hata: {argumanlar.goruntu} okunamadı.")
+        sys.exit(2)
+
+    kareler = kare_fiksturu(argumanlar.kareler)
+    print(f"[BENCH] {len(kareler)} kare {kareler.shape[1:]}, görüntü {goruntu.shape}")
+
+    # Temel sadece aynı girdilerle ölçülmüşse karşılaştırılır
+    fiksturler = {"kareler": dizi_ozeti(kareler), "goruntu": dizi_ozeti(goruntu)}
+    sonuclar = asamalari_olc(kareler, goruntu, argumanlar.tekrar)
+    rapor = {"ortam": ortam_bilgisi(), "fiksturler": fiksturler, "sonuclar": sonuclar}
+    with open(argumanlar.cikti, "w", encoding="utf-8") as f:
+        json.dump(rapor, f, indent=2, ensure_ascii=False)
+    print(f"\n[BENCH] Sonuçlar yazıldı: {argumanlar.cikti}")
+
+    if argumanlar.temel_kaydet:
+        with open(argumanlar.temel, "w", encoding="utf-8") as f:
+            json.dump(rapor, f, indent=2, ensure_ascii=False)
+        print(f"[BENCH] Temel kaydedildi: {argumanlar.temel}")
+    elif not os.path.exists(argumanlar.temel):
+        print(f"[BENCH] Temel dosyası yok ({argumanlar.temel}); karşılaştırma atlandı. "
+              "--temel-kaydet ile oluşturun.")
+    else:
+        with open(argumanlar.temel, encoding="utf-8") as f:
+            temel = json.load(f)
+        if temel.get("fiksturler") != fiksturler:
+            print(f"[BENCH] Temel ({argumanlar.temel}) farklı kareler / görüntüyle ölçülmüş; "
+                  "karşılaştırma atlandı. --temel-kaydet ile bu fikstürler için yeni temel oluşturun.")
+            sys.exit(0)
+        if temel["ortam"].get("islemci") != rapor["ortam"]["islemci"]:
+            print(f"Uyarı: Temel başka bir işlemcide ölçülmüş ({temel['ortam'].get('islemci')}); "
+                  "oranlar makine farkını da içerir.")
+        gerilemeler = temelle_karsilastir(sonuclar, temel["sonuclar"], argumanlar.tolerans)
+        if gerilemeler:
+            print(f"❌ Gerileme: {', '.join(gerilemeler)}")
+            sys.exit(1)
+        print("✅ Temelle karşılaştırma: gerileme yok.")
@@ -0,0 +1,330 @@
+import multiprocessing
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from entropy_pool import kareleri_kosullandir
+from frame_sources import kaynak_ac
+from health_tests import SaglikIzleyici
+
+
+# --- ÇOK KAYNAKLI / ÇOK SÜREÇLİ YAKALAMA ---
+# Her kaynak (kamera indeksi, video, ham döküm ...) ayrı bir süreçte Kare -> Hash -> Collatz ->
+# Von Neumann hattını çalıştırır; böylece hash ve Collatz işi çekirdek ve sensör sayısıyla ölçeklenir.
+# Süreçler temiz bitleri (paketli bayt olarak) tek bir multiprocessing.shared_memory bloğuna yazar:
+#   - Her işçinin kendi halkası vardır (tek yazar / tek okuyucu), bu yüzden yazarken kilit gerekmez.
+#   - Başlık: işçi başına int64 sayaçlar. yaz / oku toplam bayt sayısıdır, hiç geri sarılmaz;
+#     halkadaki konum = sayaç % halka_bayt. Yazar önce veriyi, sonra 'yaz' sayacını günceller.
+#   - Okuyucu halkaları sırayla boşaltır; veri pickle edilmeden doğrudan paylaşılan bellekten kopyalanır.
+_YAZ, _OKU, _DURUM, _KARE, _HAM_BIT, _TEMIZ_BIT = range(6)
+_ALAN_SAYISI = 8
+
+# İşçi durumu
+CALISIYOR, BITTI, HATA = 0, 1, 2
+
+
+class PaylasimliHalka:
+    """
+    kaynak_sayisi adet tek yazar / tek okuyucu bayt halkası (tek paylaşılan bellek bloğunda).
+    ad verilirse var olan bloğa bağlanır (örn. işçi süreçlerinden ya da başka bir tüketici sürecinden).
+    """
+
+    def __init__(self, kaynak_sayisi=None, halka_bayt=1 << 20, ad=None):
+        if ad is None:
+            baslik = kaynak_sayisi * _ALAN_SAYISI * 8
+            self.shm = shared_memory.SharedMemory(create=True, size=baslik + kaynak_sayisi * halka_bayt + 16)
+            self.sahip = True
+            ust = np.ndarray((2,), dtype=np.int64, buffer=self.shm.buf)
+            ust[:] = (kaynak_sayisi, halka_bayt)
+        else:
+            self.shm = shared_memory.SharedMemory(name=ad)
+            self.sahip = False
+            ust = np.ndarray((2,), dtype=np.int64, buffer=self.shm.buf)
+            kaynak_sayisi, halka_bayt = int(ust[0]), int(ust[1])
+
+        self.kaynak_sayisi = kaynak_sayisi
+        self.halka_bayt = halka_bayt
+        self.baslik = np.ndarray((kaynak_sayisi, _ALAN_SAYISI), dtype=np.int64, buffer=self.shm.buf, offset=16)
+        self.veri = np.ndarray((kaynak_sayisi, halka_bayt), dtype=np.uint8, buffer=self.shm.buf,
+                               offset=16 + self.baslik.nbytes)
+        if self.sahip:
+            self.baslik[:] = 0
+
+    @property
+    def ad(self):
+        return self.shm.name
+
+    def bos_alan(self, i):
+        return self.halka_bayt - int(self.baslik[i, _YAZ] - self.baslik[i, _OKU])
+
+    def dolu(self, i):
+        return int(self.baslik[i, _YAZ] - self.baslik[i, _OKU])
+
+    def yaz(self, i, baytlar):
+        """
+        i. halkaya sığdığı kadar bayt yazar (sadece i. işçi çağırır). Yazılan bayt sayısını döndürür.
+        """
+        n = min(len(baytlar), self.bos_alan(i))
+        if n == 0:
+            return 0
+        yaz = int(self.baslik[i, _YAZ])
+        konum = yaz % self.halka_bayt
+        ilk = min(n, self.halka_bayt - konum)
+        self.veri[i, konum:konum + ilk] = baytlar[:ilk]
+        self.veri[i, :n - ilk] = baytlar[ilk:n]
+        # Veri yazıldıktan sonra yayınla
+        self.baslik[i, _YAZ] = yaz + n
+        return n
+
+    def oku(self, i, n):
+        """
+        i. halkadan en fazla n bayt okur (sadece okuyucu çağırır).
+        """
+        oku = int(self.baslik[i, _OKU])
+        n = min(n, int(self.baslik[i, _YAZ]) - oku)
+        konum = oku % self.halka_bayt
+        ilk = min(n, self.halka_bayt - konum)
+        parca = np.concatenate((self.veri[i, konum:konum + ilk], self.veri[i, :n - ilk]))
+        self.baslik[i, _OKU] = oku + n
+        return parca
+
+    def kapat(self):
+        # numpy görünümleri bırakılmadan paylaşılan bellek kapatılamaz
+        self.baslik = self.veri = None
+        self.shm.close()
+        if self.sahip:
+            self.shm.unlink()
+
+
+def _yakalama_iscisi(ad, indeks, kaynak, ayarlar, dur_olayi):
+    """
+    İşçi süreç: tek bir kaynaktan kare okuyup temiz bitleri kendi halkasına yazar.
+    """
+    halka = PaylasimliHalka(ad=ad)
+    baslik = halka.baslik[indeks]
+    cap = None
+    try:
+        cap = kaynak_ac(kaynak, isinma_suresi=ayarlar["isinma_suresi"])
+        if not cap.isOpened():
+            print(f"Hata: Kaynak açılamadı ({kaynak}).")
+            baslik[_DURUM] = HATA
+            return
+
+        saglik = SaglikIzleyici() if ayarlar["saglik"] else None
+        artik = np.zeros(0, dtype=np.uint8)
+        while not dur_olayi.is_set():
+            kareler = cap.read_batch(cap.parti_boyutu)
+            if len(kareler) == 0:
+                baslik[_DURUM] = BITTI
+                return
+
+            if saglik is not None:
+                kareler = [frame for frame in kareler if saglik.kontrol(frame)]
+                if saglik.durdu:
+                    print(f"Hata: Sağlık testi hatası ({kaynak}): {saglik.son_hata}")
+                    baslik[_DURUM] = HATA
+                    return
+                if not kareler:
+                    continue
+
+            ham_bitler, temiz_bitler = kareleri_kosullandir(kareler, ayarlar["collatz_adim"], None,
+                                                            ayarlar["ekstraktor"], ayarlar["peres_derinlik"])
+            baslik[_KARE] += len(kareler)
+            baslik[_HAM_BIT] += ham_bitler.size
+            baslik[_TEMIZ_BIT] += temiz_bitler.size
+
+            # Tam baytlar yazılır; 8'e tamamlanmayan bitler sonraki partiye kalır
+            bitler = np.concatenate((artik, temiz_bitler))
+            tam = bitler.size - bitler.size % 8
+            artik = bitler[tam:]
+            baytlar = np.packbits(bitler[:tam])
+
+            # Halka doluysa okuyucu boşaltana kadar bekle (kare yakalamayı da yavaşlatır)
+            while baytlar.size and not dur_olayi.is_set():
+                yazilan = halka.yaz(indeks, baytlar)
+                baytlar = baytlar[yazilan:]
+                if baytlar.size:
+                    time.sleep(0.001)
+    except Exception as e:
+        print(f"Hata: Yakalama işçisi çöktü ({kaynak}): {e}")
+        baslik[_DURUM] = HATA
+    finally:
+        if cap is not None:
+            cap.release()
+        baslik = None
+        halka.kapat()
+
+
+class YakalamaYoneticisi:
+    """
+    Her kaynak için bir işçi süreç başlatır ve bitleri paylaşılan halkalardan servis eder.
+    EntropiHavuzu ile aynı okuma arayüzü: read_bits / read_bytes / hata / verimlilik.
+
+        with YakalamaYoneticisi(["kamera:0", "kamera:1"]) as yonetici:
+            baytlar = yonetici.read_bytes(1 << 20)
+
+    Okuma bu süreçteki thread'ler arasında kilitle sıralanır. Başka bir süreç halkaya
+    PaylasimliHalka(ad=yonetici.ad) ile bağlanabilir, ancak tek okuyucu olmalıdır.
+    """
+
+    def __init__(self, kaynaklar, halka_bayt=1 << 20, collatz_adim=100, isinma_suresi=0.5,
+                 saglik=True, ekstraktor="von_neumann", peres_derinlik=4):
+        if not kaynaklar:
+            raise ValueError("En az bir kaynak verilmeli")
+        self.kaynaklar = list(kaynaklar)
+        self.halka_bayt = halka_bayt
+        self.ayarlar = {
+            "collatz_adim": collatz_adim,
+            "isinma_suresi": isinma_suresi,
+            "saglik": saglik,
+            "ekstraktor": ekstraktor,
+            "peres_derinlik": peres_derinlik,
+        }
+
+        self.halka = None
+        self._surecler = []
+        self._dur_olayi = None
+        self._kilit = multiprocessing.get_context().Lock()
+        self._sira = 0
+        # Yarım kalan okumalardan geri konan baytlar; sonraki okumada önce bunlar verilir
+        self._iade = b""
+        self.hata = None
+
+    # --- YAŞAM DÖNGÜSÜ ---
+    def start(self):
+        if self.halka is not None:
+            return self
+        baglam = multiprocessing.get_context()
+        self.halka = PaylasimliHalka(len(self.kaynaklar), self.halka_bayt)
+        self._dur_olayi = baglam.Event()
+        self._surecler = [
+            baglam.Process(target=_yakalama_iscisi, name=f"bsg-yakalama-{i}", daemon=True,
+                           args=(self.halka.ad, i, kaynak, self.ayarlar, self._dur_olayi))
+            for i, kaynak in enumerate(self.kaynaklar)
+        ]
+        for surec in self._surecler:
+            surec.start()
+        return self
+
+    def stop(self):
+        if self.halka is None:
+            return
+        self._dur_olayi.set()
+        for surec in self._surecler:
+            surec.join(timeout=5)
+            if surec.is_alive():
+                surec.terminate()
+        self._surecler = []
+        self.halka.kapat()
+        self.halka = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    @property
+    def ad(self):
+        return self.halka.ad
+
+    # --- SAYAÇLAR ---
+    def _toplam(self, alan):
+        return 0 if self.halka is None else int(self.halka.baslik[:, alan].sum())
+
+    @property
+    def kare_sayisi(self):
+        return self._toplam(_KARE)
+
+    @property
+    def ham_bit_sayisi(self):
+        return self._toplam(_HAM_BIT)
+
+    @property
+    def temiz_bit_sayisi(self):
+        return self._toplam(_TEMIZ_BIT)
+
+    @property
+    def verimlilik(self):
+        ham = self.ham_bit_sayisi
+        return self.temiz_bit_sayisi / ham if ham else 0.0
+
+    @property
+    def doluluk(self):
+        # Bit cinsinden (EntropiHavuzu.doluluk ile aynı birim)
+        if self.halka is None:
+            return 8 * len(self._iade)
+        return 8 * (len(self._iade) + sum(self.halka.dolu(i) for i in range(len(self.kaynaklar))))
+
+    def durumlar(self):
+        return [int(d) for d in self.halka.baslik[:, _DURUM]]
+
+    def _olu_iscileri_isaretle(self):
+        # Sert öldürülen işçi (OOM, segfault) durumunu kendisi güncelleyemez; süreçten anlaşılır
+        for i, surec in enumerate(self._surecler):
+            if not surec.is_alive() and self.halka.baslik[i, _DURUM] == CALISIYOR:
+                print(f"Hata: Yakalama işçisi beklenmedik şekilde sonlandı "
+                      f"({self.kaynaklar[i]}, çıkış kodu {surec.exitcode}).")
+                self.halka.baslik[i, _DURUM] = HATA
+
+    # --- TÜKETİCİ API ---
+    def read_bytes(self, n, blok=True, zaman_asimi=None):
+        """
+        Halkalardan sırayla n bayt toplar. blok=False iken yeterli veri yoksa hiç okumadan None döner.
+        Tüm işçiler durduysa (beklenmedik şekilde ölenler dahil) ve veri bittiyse ya da zaman
+        aşımında None döner; o ana kadar toplanan baytlar saklanır ve sonraki okumada önce verilir.
+        """
+        self.start()
+        son_an = None if zaman_asimi is None else time.monotonic() + zaman_asimi
+        kaynak_sayisi = len(self.kaynaklar)
+
+        with self._kilit:
+            if not blok and self.doluluk < 8 * n:
+                return None
+
+            parcalar = []
+            kalan = n
+            if self._iade:
+                parca, self._iade = self._iade[:kalan], self._iade[kalan:]
+                parcalar.append(np.frombuffer(parca, dtype=np.uint8))
+                kalan -= len(parca)
+
+            while kalan > 0:
+                okunan = 0
+                for _ in range(kaynak_sayisi):
+                    i = self._sira
+                    self._sira = (self._sira + 1) % kaynak_sayisi
+                    parca = self.halka.oku(i, kalan)
+                    if parca.size:
+                        parcalar.append(parca)
+                        kalan -= parca.size
+                        okunan += parca.size
+                    if kalan == 0:
+                        break
+
+                if kalan and not okunan:
+                    self._olu_iscileri_isaretle()
+                    if all(d != CALISIYOR for d in self.durumlar()) and self.doluluk == 0:
+                        self.hata = "Tüm yakalama işçileri durdu."
+                        self._geri_koy(parcalar)
+                        return None
+                    if son_an is not None and time.monotonic() >= son_an:
+                        self._geri_koy(parcalar)
+                        return None
+                    time.sleep(0.001)
+
+        if not parcalar:
+            return b""
+        return np.concatenate(parcalar).tobytes()
+
+    def _geri_koy(self, parcalar):
+        # Kilit altında: halkalara geri yazılamaz (yazar o bölgeyi kullanmış olabilir), yerel tutulur
+        if parcalar:
+            self._iade = np.concatenate(parcalar).tobytes() + self._iade
+
+    def read_bits(self, n, blok=True, zaman_asimi=None):
+        baytlar = self.read_bytes((n + 7) // 8, blok=blok, zaman_asimi=zaman_asimi)
+        if baytlar is None:
+            return None
+        return np.unpackbits(np.frombuffer(baytlar, dtype=np.uint8), count=n)
@@ -0,0 +1,248 @@
+import numpy as np
+
+
+def collatz_step(n):
+    if n % 2 == 0:
+        return n // 2
+    else:
+        return 3 * n + 1
+
+
+# --- ÇOK ADIMLI COLLATZ MOTORU (2-adik parite vektörü sıçraması) ---
+# n = 2^k * a + b  (b = n'nin en düşük k biti) yazalım.
+# İlk k adımın hepsinde Tek/Çift kararı sadece b'ye bağlıdır:
+#   - Çift adım (n/2) yüksek kısmın katsayısını 2^j -> 2^(j-1) yapar,
+#   - Tek adım (3n+1) yüksek kısmı 3 ile çarpar, 2^j katsayısına dokunmaz.
+# k adımda m tek adım ve (k - m) çift adım olduğundan:
+#   T^k(n) = a * 3^m * 2^m + T^k(b) = a * 6^m + T^k(b)
+# Böylece 256 bitlik sayı üzerinde k adım yerine tek bir çarpma + toplama yapılır.
+class CollatzMotoru:
+    """
+    Collatz yörüngesini tablolar yardımıyla k adım birden ilerletir.
+    Tek adımlı collatz_step ile birebir aynı yörüngeyi ve parite akışını üretir.
+    """
+
+    def __init__(self, k=16):
+        if not 1 <= k <= 20:
+            raise ValueError("k 1 ile 20 arasında olmalı")
+
+        self.k = k
+        self.maske = (1 << k) - 1
+
+        b = np.arange(1 << k, dtype=np.int64)
+        pariteler = np.empty((1 << k, k), dtype=np.uint8)
+        for i in range(k):
+            tek = (b & 1).astype(bool)
+            pariteler[:, i] = tek
+            b = np.where(tek, 3 * b + 1, b >> 1)
+
+        # Her b için: k adımdaki karar pariteleri, tek adım sayısı ve T^k(b)
+        self.pariteler = pariteler
+        self._tek_sayisi = pariteler.sum(axis=1).tolist()
+        self._son_deger = b.tolist()
+        self._carpan = [6 ** m for m in range(k + 1)]
+
+    def jump(self, n):
+        """
+        n'yi tam k adım ilerletir. (yeni_n, k adımın karar pariteleri) döndürür.
+        """
+        b = n & self.maske
+        yeni = (n >> self.k) * self._carpan[self._tek_sayisi[b]] + self._son_deger[b]
+        return yeni, self.pariteler[b]
+
+    def advance(self, n, adim):
+        """
+        n'yi 'adim' kadar Collatz adımı ilerletir (parite üretmeden).
+        """
+        k, maske = self.k, self.maske
+        tek_sayisi, son_deger, carpan = self._tek_sayisi, self._son_deger, self._carpan
+
+        tam, kalan = divmod(adim, k)
+        for _ in range(tam):
+            b = n & maske
+            n = (n >> k) * carpan[tek_sayisi[b]] + son_deger[b]
+        for _ in range(kalan):
+            n = collatz_step(n)
+        return n
+
+    def parity_bits(self, n, adim):
+        """
+        Scriptlerdeki döngüyle aynı ham bit akışını üretir:
+            for _ in range(adim):
+                n = collatz_step(n)
+                bit = 1 if n tek ise, 0 değilse
+        (0/1 uint8 bit dizisi, son n) döndürür.
+        """
+        k, maske = self.k, self.maske
+        tek_sayisi, son_deger, carpan = self._tek_sayisi, self._son_deger, self._carpan
+
+        # Tablo, adımdan ÖNCEKİ sayının paritesini verir (x_0 ... x_{adim-1}).
+        # Scriptler adımdan SONRAKİ paritiyi yazar (x_1 ... x_adim); bu yüzden
+        # adim + 1 karar paritesi toplayıp ilkini atıyoruz.
+        tam, kalan = divmod(adim, k)
+        bloklar = []
+        for _ in range(tam):
+            b = n & maske
+            bloklar.append(b)
+            n = (n >> k) * carpan[tek_sayisi[b]] + son_deger[b]
+
+        ek = []
+        for _ in range(kalan):
+            ek.append(n & 1)
+            n = collatz_step(n)
+        ek.append(n & 1)
+
+        karar = self.pariteler[np.array(bloklar, dtype=np.intp)].ravel()
+        bitler = np.concatenate((karar, np.array(ek, dtype=np.uint8)))
+        return bitler[1:], n
+
+
+_varsayilan_motor = None
+
+
+def varsayilan_motor():
+    """
+    Tabloyu bir kez kurup paylaşılan motoru döndürür (k=16).
+    """
+    global _varsayilan_motor
+    if _varsayilan_motor is None:
+        _varsayilan_motor = CollatzMotoru()
+    return _varsayilan_motor
+
+
+def collatz_bits(n, adim):
+    """
+    Kısayol: varsayılan motorla 'adim' adımlık ham parite akışı ve son sayı.
+    """
+    return varsayilan_motor().parity_bits(n, adim)
+
+
+def collatz_advance(n, adim):
+    return varsayilan_motor().advance(n, adim)
+
+
+# --- TOPLU (ÇOK TOHUMLU) COLLATZ ---
+# Binlerce tohum birlikte ilerletilir. Her sayı 32 bitlik basamaklara (limb) bölünüp
+# uint64 dizide tutulur: A[j, i] = i. tohumun j. basamağı (en düşük basamak önce).
+# 32 bitlik basamak * 6^m (m <= 12 için < 2^32) + elde, uint64'e taşmadan sığar;
+# bu yüzden toplu sıçrama k = 12 adımla yapılır.
+_TOPLU_K = 12
+_BASAMAK = 32
+_BASAMAK_MASKE = np.uint64((1 << _BASAMAK) - 1)
+
+
+def _toplu_tablolar():
+    # r = 1 ... 12 adımlık sıçrama tabloları (r < 12 olanlar kalan adımlar için)
+    tablolar = {}
+    for r in range(1, _TOPLU_K + 1):
+        motor = CollatzMotoru(r)
+        carpan = np.array([motor._carpan[m] for m in motor._tek_sayisi], dtype=np.uint64)
+        son_deger = np.array(motor._son_deger, dtype=np.uint64)
+        tablolar[r] = (motor.pariteler, carpan, son_deger)
+    return tablolar
+
+
+_toplu = None
+
+
+def _sayilari_basamakla(sayilar, basamak_sayisi):
+    bayt = basamak_sayisi * 4
+    ham = b"".join(int(s).to_bytes(bayt, "little") for s in sayilar)
+    return np.frombuffer(ham, dtype="<u4").reshape(len(sayilar), basamak_sayisi).T.astype(np.uint64)
+
+
+def _basamaklardan_sayilar(A):
+    satirlar = np.ascontiguousarray(A.T.astype("<u4"))
+    return [int.from_bytes(satir.tobytes(), "little") for satir in satirlar]
+
+
+def _saga_kaydir(A, k):
+    Y = A >> np.uint64(k)
+    Y[:-1] |= (A[1:] << np.uint64(_BASAMAK - k)) & _BASAMAK_MASKE
+    return Y
+
+
+def _carp_ekle(A, carpan, elde):
+    Y = np.empty_like(A)
+    for j in range(A.shape[0]):
+        t = A[j] * carpan + elde
+        Y[j] = t & _BASAMAK_MASKE
+        elde = t >> np.uint64(_BASAMAK)
+    return Y
+
+
+def collatz_toplu(tohumlar, adim):
+    """
+    Birçok tohumun Collatz yörüngesini birlikte ilerletir.
+    adim tek bir sayı ya da tohum başına adım sayısı dizisi olabilir.
+
+    (bit matrisi (tohum x max_adim, uint8), son sayılar listesi) döndürür.
+    i. satırın ilk adim[i] biti, collatz_bits(tohumlar[i], adim[i]) ile aynıdır; kalanı 0'dır.
+    """
+    global _toplu
+    if _toplu is None:
+        _toplu = _toplu_tablolar()
+    pariteler, carpan_tablosu, son_deger_tablosu = _toplu[_TOPLU_K]
+
+    n = len(tohumlar)
+    adimlar = np.broadcast_to(np.asarray(adim, dtype=np.int64), (n,))
+    en_cok = int(adimlar.max()) if n else 0
+
+    # Tohumları adım sayısına göre azalan sırala: her sıçramada aktif olanlar baştaki bir dilim olur
+    sira = np.argsort(-adimlar, kind="stable")
+    adimlar = adimlar[sira]
+
+    # Her iki adımda en fazla 1 bit büyür ((3n+1)/2 < 2n)
+    en_uzun = max((int(s).bit_length() for s in tohumlar), default=1)
+    basamak_sayisi = (en_uzun + en_cok // 2 + 2) // _BASAMAK + 1
+    A = _sayilari_basamakla([tohumlar[i] for i in sira], basamak_sayisi)
+
+    # Karar pariteleri: sütun t = t. adımdan ÖNCEKİ sayının paritesi (t = 0 ... adim)
+    karar = np.zeros((n, en_cok + 1), dtype=np.uint8)
+    k = _TOPLU_K
+    maske = np.uint64((1 << k) - 1)
+    sicrama = adimlar // k
+
+    for j in range(int(sicrama[0]) if n else 0):
+        aktif = int(np.count_nonzero(sicrama > j))
+
+        # Bir sıçrama (12 adım) 32 bitten az büyütür: en üstte boş bir basamak yeter
+        if A[-1, :aktif].any():
+            A = np.vstack((A, np.zeros((1, n), dtype=np.uint64)))
+
+        parca = A[:, :aktif]
+        b = (parca[0] & maske).astype(np.intp)
+        karar[:aktif, j * k:(j + 1) * k] = pariteler[b]
+        A[:, :aktif] = _carp_ekle(_saga_kaydir(parca, k), carpan_tablosu[b], son_deger_tablosu[b])
+
+        # Tüm tohumlarda boşalan üst basamakları at (bir boş basamak pay olarak kalır)
+        while A.shape[0] > 2 and not A[-1].any() and not A[-2].any():
+            A = A[:-1]
+
+    # Kalan (< k) adımlar: aynı kalanı paylaşan tohumlar r adımlık tek sıçramayla ilerler
+    if A[-1].any():
+        A = np.vstack((A, np.zeros((1, n), dtype=np.uint64)))
+    kalan = adimlar - sicrama * k
+    for r in np.unique(kalan[kalan > 0]).tolist():
+        r_pariteler, r_carpan, r_son_deger = _toplu[r]
+        grup = np.flatnonzero(kalan == r)
+        parca = A[:, grup]
+        b = (parca[0] & np.uint64((1 << r) - 1)).astype(np.intp)
+        sutunlar = (sicrama[grup] * k)[:, None] + np.arange(r)
+        karar[grup[:, None], sutunlar] = r_pariteler[b]
+        A[:, grup] = _carp_ekle(_saga_kaydir(parca, r), r_carpan[b], r_son_deger[b])
+
+    satirlar = np.arange(n)
+
+    # Son sayının paritesi (adim. sütun)
+    karar[satirlar, adimlar] = (A[0] & np.uint64(1)).astype(np.uint8)
+
+    # Scriptler adımdan SONRAKİ paritiyi yazar: ilk sütunu at, her satırı kendi uzunluğunda kes
+    bitler = karar[:, 1:]
+    bitler[np.arange(en_cok)[None, :] >= adimlar[:, None]] = 0
+
+    # Orijinal tohum sırasına geri dön
+    geri = np.empty_like(sira)
+    geri[sira] = np.arange(n)
+    sayilar = _basamaklardan_sayilar(A)
+    return bitler[geri], [sayilar[i] for i in geri]
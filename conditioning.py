@@ -0,0 +1,107 @@
+import hashlib
+
+import numpy as np
+
+
+# --- KOŞULLANDIRMA (CONDITIONING) AŞAMASI ---
+# Varsayılan davranış eskisiyle aynıdır: tüm kare SHA-256 ile özetlenip 256 bitlik tek tohum olur.
+# Daha hızlı modlar:
+#   - "bit_duzlemi": sadece en gürültülü alt bit düzlemleri (LSB) paketlenip özetlenir,
+#   - "alt_ornek"  : tek kanalın adımlı / kırpılmış bölgesi özetlenir.
+# BLAKE2b anahtarlı çalışır; 64 bayttan uzun çıktılar BLAKE2X tarzı genişletme ile üretilir.
+class Kosullandirici:
+    """
+    Kareden tohum malzemesi üretir.
+
+    bolge       : "tum", "bit_duzlemi" veya "alt_ornek"
+    kanal       : alt_ornek / bit_duzlemi için kanal indeksi (None = tüm kanallar)
+    adim        : piksel atlama adımı (hem satır hem sütun)
+    pencere     : (y0, y1, x0, x1) kırpma bölgesi, None = tüm kare
+    bit_duzlemi : kullanılacak alt bit düzlemi sayısı (1 = sadece LSB)
+    algoritma   : "sha256", "blake2b" veya "shake256"
+    cikti_bayt  : toplam özet uzunluğu (sha256 için 32'ye sabit)
+    tohum_bayt  : her Collatz tohumunun uzunluğu; cikti_bayt / tohum_bayt tohum üretilir
+    """
+
+    def __init__(self, bolge="tum", kanal=None, adim=1, pencere=None, bit_duzlemi=1,
+                 algoritma="sha256", cikti_bayt=32, tohum_bayt=32, anahtar=b""):
+        if bolge not in ("tum", "bit_duzlemi", "alt_ornek"):
+            raise ValueError(f"Bilinmeyen bölge: {bolge}")
+        if algoritma not in ("sha256", "blake2b", "shake256"):
+            raise ValueError(f"Bilinmeyen özet algoritması: {algoritma}")
+        if algoritma == "sha256" and cikti_bayt != 32:
+            raise ValueError("sha256 sadece 32 bayt çıktı verir; daha uzunu için blake2b/shake256 kullanın")
+        if not 0 < tohum_bayt <= cikti_bayt:
+            raise ValueError(f"0 < tohum_bayt <= cikti_bayt olmalı (tohum_bayt={tohum_bayt}, cikti_bayt={cikti_bayt})")
+
+        self.bolge = bolge
+        self.kanal = kanal
+        self.adim = adim
+        self.pencere = pencere
+        self.bit_duzlemi = bit_duzlemi
+        self.algoritma = algoritma
+        self.cikti_bayt = cikti_bayt
+        self.tohum_bayt = tohum_bayt
+        self.anahtar = anahtar
+
+    def secim(self, frame):
+        """
+        Özetlenecek veriyi seçer. "tum" modunda bitişik (contiguous) kare kopyalanmaz (buffer
+        protokolü); dilimlenmiş / adımlı görünümler özetlenmeden önce bitişik kopyaya çevrilir.
+        """
+        if self.bolge == "tum":
+            return np.ascontiguousarray(frame)
+
+        gorunum = frame
+        if self.pencere is not None:
+            y0, y1, x0, x1 = self.pencere
+            gorunum = gorunum[y0:y1, x0:x1]
+        gorunum = gorunum[::self.adim, ::self.adim]
+        if self.kanal is not None and gorunum.ndim == 3:
+            gorunum = gorunum[..., self.kanal]
+
+        if self.bolge == "alt_ornek":
+            return np.ascontiguousarray(gorunum)
+
+        # Alt bit düzlemleri: her düzlem ayrı ayrı paketlenir (8 piksel -> 1 bayt)
+        if self.bit_duzlemi == 1:
+            return np.packbits(gorunum & 1)
+        return np.concatenate([np.packbits((gorunum >> i) & 1) for i in range(self.bit_duzlemi)])
+
+    def ozet(self, frame):
+        """
+        Kareyi koşullandırıp cikti_bayt uzunluğunda bayt dizisi döndürür.
+        """
+        veri = self.secim(frame)
+
+        if self.algoritma == "sha256":
+            return hashlib.sha256(veri).digest()
+        if self.algoritma == "shake256":
+            h = hashlib.shake_256(self.anahtar)
+            h.update(veri)
+            return h.digest(self.cikti_bayt)
+
+        # BLAKE2b: tek geçişte 64 baytlık kök özet, gerekirse BLAKE2X tarzı genişletme
+        kok = hashlib.blake2b(veri, key=self.anahtar, digest_size=min(64, self.cikti_bayt)).digest()
+        if self.cikti_bayt <= 64:
+            return kok
+        parcalar = []
+        for i in range(0, self.cikti_bayt, 64):
+            boy = min(64, self.cikti_bayt - i)
+            parcalar.append(hashlib.blake2b(kok, digest_size=boy, salt=(i // 64).to_bytes(16, "little"),
+                                            person=b"BSG-RNG blake2x").digest())
+        return b"".join(parcalar)
+
+    def tohumlar(self, frame):
+        """
+        Özeti tohum_bayt'lık parçalara bölüp tam sayı tohumlar listesi döndürür.
+        """
+        ozet = self.ozet(frame)
+        return [int.from_bytes(ozet[i:i + self.tohum_bayt], "big")
+                for i in range(0, len(ozet) - self.tohum_bayt + 1, self.tohum_bayt)]
+
+    def tohum(self, frame):
+        """
+        Tek tohum (eski int(sha256.hexdigest(), 16) ile aynı değer, varsayılan ayarlarda).
+        """
+        return int.from_bytes(self.ozet(frame), "big")
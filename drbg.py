@@ -0,0 +1,185 @@
+import collections
+import hashlib
+import hmac
+import threading
+import time
+
+import numpy as np
+
+from entropy_pool import varsayilan_havuz
+
+
+# --- HMAC-DRBG (NIST SP 800-90A, 10.1.2) ---
+# Kamera hattı kare başına birkaç düzine temiz bit verir; çıktı hızı kare hızına bağlıdır.
+# DRBG modunda havuzdaki (Von Neumann ile temizlenmiş) bitler sadece tohum olarak kullanılır,
+# toplu çıktıyı HMAC-SHA256 DRBG üretir. Belirli bayt / süre sonra havuzdan yeniden tohumlanır.
+class HmacDrbg:
+    """
+    Standart HMAC-DRBG (SHA-256). Sadece standart kütüphane kullanır.
+    """
+
+    # SP 800-90A Tablo 2: istek başına en fazla 2^19 bit, yeniden tohumlama aralığı en fazla 2^48 istek
+    MAKS_ISTEK_BAYT = 1 << 16
+    MAKS_ISTEK_SAYISI = 1 << 48
+
+    def __init__(self, entropi, nonce=b"", kisisellestirme=b"", algoritma="sha256"):
+        self.algoritma = algoritma
+        boy = hashlib.new(algoritma).digest_size
+        self._K = b"\x00" * boy
+        self._V = b"\x01" * boy
+        self._guncelle(entropi + nonce + kisisellestirme)
+        self.istek_sayaci = 1
+
+    def _hmac(self, anahtar, veri):
+        return hmac.digest(anahtar, veri, self.algoritma)
+
+    def _guncelle(self, veri=b""):
+        self._K = self._hmac(self._K, self._V + b"\x00" + veri)
+        self._V = self._hmac(self._K, self._V)
+        if veri:
+            self._K = self._hmac(self._K, self._V + b"\x01" + veri)
+            self._V = self._hmac(self._K, self._V)
+
+    def reseed(self, entropi, ek_girdi=b""):
+        self._guncelle(entropi + ek_girdi)
+        self.istek_sayaci = 1
+
+    def generate(self, n, ek_girdi=b""):
+        """
+        n bayt üretir. Uzun istekler standarttaki istek sınırına göre parçalara bölünür.
+        """
+        if self.istek_sayaci > self.MAKS_ISTEK_SAYISI:
+            raise RuntimeError("HMAC-DRBG yeniden tohumlanmalı")
+
+        parcalar = []
+        kalan = n
+        while kalan > 0:
+            if ek_girdi:
+                self._guncelle(ek_girdi)
+            istek = min(kalan, self.MAKS_ISTEK_BAYT)
+            cikti = []
+            uzunluk = 0
+            K, V = self._K, self._V
+            while uzunluk < istek:
+                V = hmac.digest(K, V, self.algoritma)
+                cikti.append(V)
+                uzunluk += len(V)
+            self._V = V
+            self._guncelle(ek_girdi)
+            self.istek_sayaci += 1
+            parcalar.append(b"".join(cikti)[:istek])
+            kalan -= istek
+        return b"".join(parcalar)
+
+
+class DrbgUreteci:
+    """
+    Havuzla aynı okuma arayüzüne (read_bits / read_bytes / hata) sahip DRBG çıktısı.
+    Kamera havuzu yerine verilebilir: AralikOrnekleyici(DrbgUreteci()), HavuzBitUreteci(DrbgUreteci()).
+
+    yeniden_tohum_bayt : bu kadar bayt üretildikten sonra havuzdan yeniden tohumlanır
+    yeniden_tohum_sure : bu kadar saniye geçtikten sonra yeniden tohumlanır (None = süre sınırı yok)
+    entropi_bayt       : her tohumlamada havuzdan alınan temiz bayt (nonce ayrıca alınır)
+    """
+
+    def __init__(self, havuz=None, yeniden_tohum_bayt=1 << 20, yeniden_tohum_sure=60.0,
+                 entropi_bayt=32, kisisellestirme=b"BSG-RNG HMAC-DRBG", zaman_asimi=None):
+        # Sıfır / negatif sınırlarda her generate öncesi yeniden tohumlama koşulu hep doğru olur
+        if yeniden_tohum_bayt <= 0:
+            raise ValueError("yeniden_tohum_bayt pozitif olmalı")
+        if yeniden_tohum_sure is not None and yeniden_tohum_sure <= 0:
+            raise ValueError("yeniden_tohum_sure pozitif ya da None olmalı")
+        if entropi_bayt <= 0:
+            raise ValueError("entropi_bayt pozitif olmalı")
+        self.havuz = havuz
+        self.yeniden_tohum_bayt = yeniden_tohum_bayt
+        self.yeniden_tohum_sure = yeniden_tohum_sure
+        self.entropi_bayt = entropi_bayt
+        self.kisisellestirme = kisisellestirme
+        self.zaman_asimi = zaman_asimi
+
+        self._drbg = None
+        self._kilit = threading.Lock()
+        self.hata = None
+
+        # Sayaçlar ve izlenebilirlik: her tohumlamada havuzun o anki kare sayısı kaydedilir
+        self.uretilen_bayt = 0
+        self.tohumlama_sayisi = 0
+        self._son_tohum_bayt = 0
+        self._son_tohum_zamani = None
+        self.tohum_kaydi = collections.deque(maxlen=64)
+
+    def _entropi_al(self, n, blok, zaman_asimi):
+        if self.havuz is None:
+            self.havuz = varsayilan_havuz()
+        baytlar = self.havuz.read_bytes(n, blok=blok, zaman_asimi=zaman_asimi)
+        if baytlar is None and blok:
+            self.hata = self.havuz.hata or "Entropi alınamadı."
+        return baytlar
+
+    def _tohumla(self, blok=True, zaman_asimi=None):
+        # Kilit altında çağrılır. İlk seferde nonce olarak yarım entropi_bayt daha alınır.
+        ilk = self._drbg is None
+        entropi = self._entropi_al(self.entropi_bayt + (self.entropi_bayt // 2 if ilk else 0), blok,
+                                   self.zaman_asimi if zaman_asimi is None else zaman_asimi)
+        if entropi is None:
+            return False
+
+        if ilk:
+            self._drbg = HmacDrbg(entropi[:self.entropi_bayt], entropi[self.entropi_bayt:],
+                                  self.kisisellestirme)
+        else:
+            self._drbg.reseed(entropi)
+
+        self.tohumlama_sayisi += 1
+        self._son_tohum_bayt = self.uretilen_bayt
+        self._son_tohum_zamani = time.monotonic()
+        self.tohum_kaydi.append((time.time(), getattr(self.havuz, "kare_sayisi", None), self.uretilen_bayt))
+        return True
+
+    def _tohum_gerekli(self):
+        if self._drbg is None:
+            return True
+        if self.uretilen_bayt - self._son_tohum_bayt >= self.yeniden_tohum_bayt:
+            return True
+        if self.yeniden_tohum_sure is not None:
+            return time.monotonic() - self._son_tohum_zamani >= self.yeniden_tohum_sure
+        return False
+
+    def read_bytes(self, n, blok=True, zaman_asimi=None):
+        """
+        n bayt DRBG çıktısı. Yeniden tohumlama havuzdan okunamazsa None döner
+        (eski tohumla üretmeye devam edilmez).
+        blok ve zaman_asimi sadece tohumlama okumasını etkiler.
+        """
+        with self._kilit:
+            parcalar = []
+            kalan = n
+            while kalan > 0:
+                if self._tohum_gerekli() and not self._tohumla(blok, zaman_asimi):
+                    return None
+                # Bir sonraki tohumlama sınırını aşmadan üret
+                istek = min(kalan, self.yeniden_tohum_bayt - (self.uretilen_bayt - self._son_tohum_bayt))
+                parcalar.append(self._drbg.generate(istek))
+                self.uretilen_bayt += istek
+                kalan -= istek
+            return b"".join(parcalar)
+
+    def read_bits(self, n, blok=True, zaman_asimi=None):
+        baytlar = self.read_bytes((n + 7) // 8, blok=blok, zaman_asimi=zaman_asimi)
+        if baytlar is None:
+            return None
+        return np.unpackbits(np.frombuffer(baytlar, dtype=np.uint8), count=n)
+
+
+_varsayilan_drbg = None
+
+
+def varsayilan_drbg():
+    """
+    Varsayılan havuzdan tohumlanan paylaşılan DRBG.
+    """
+    global _varsayilan_drbg
+    if _varsayilan_drbg is None:
+        _varsayilan_drbg = DrbgUreteci()
+    return _varsayilan_drbg
@@ -0,0 +1,156 @@
+import hashlib
+import mmap
+import os
+import struct
+import threading
+from contextlib import contextmanager
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: süreçler arası kilit yok, tek süreç varsayılır
+    fcntl = None
+
+
+# --- DİSKTE SICAK BAŞLANGIÇ ÖNBELLEĞİ ---
+# Her çalıştırma soğuk başlar: kamera açılır, pozlama için 0.5-1 sn beklenir, ilk istek bunu bekler.
+# Havuz boşta kaldığında ürettiği temiz baytları bu dosyaya yazar; bir sonraki açılışta kamera
+# ısınırken istekler önce buradan karşılanır.
+#   - Dosya mmap ile açılır. Başlık: sihir, kapasite, dolu, okunan, mühür.
+#   - Mühür = SHA-256(başlık alanları + okunmamış veri). Uyuşmazsa (yarım yazım, elle değişiklik)
+#     içerik hiç servis edilmez, dosya sıfırlanır.
+#   - Okunan baytlar okununca tüketilir: üzerleri sıfırlanır, 'okunan' ilerler, dosya diske
+#     yazılır (flush) ve ancak ondan sonra çağırana verilir. Aynı bayt iki kez verilmez.
+#   - Her işlem dosya kilidi (flock) altında yapılır; aynı dosyayı paylaşan süreçler çakışmaz.
+_SIHIR = b"BSGONB01"
+_BASLIK = struct.Struct("<8sQQQ32s")
+
+
+class EntropiOnbellegi:
+    """
+    Tek kullanımlık entropi baytları tutan, mmap ile açılmış mühürlü dosya.
+
+        onbellek = EntropiOnbellegi("~/.cache/bsg-rng.bin")
+        baytlar = onbellek.tuket(32)      # en fazla 32 bayt (yoksa daha az / b"")
+        onbellek.yaz(taze_baytlar)        # sığdığı kadar ekler
+    """
+
+    def __init__(self, yol, kapasite=1 << 16):
+        self.yol = os.path.expanduser(yol)
+        self.kapasite = kapasite
+        self._kilit = threading.Lock()
+
+        dizin = os.path.dirname(self.yol)
+        if dizin:
+            os.makedirs(dizin, exist_ok=True)
+        # Sadece sahibi okuyabilir
+        self._fd = os.open(self.yol, os.O_RDWR | os.O_CREAT, 0o600)
+        boyut = _BASLIK.size + kapasite
+        with self._dosya_kilidi():
+            if os.fstat(self._fd).st_size != boyut:
+                if os.fstat(self._fd).st_size:
+                    print(f"Uyarı: Önbellek boyutu uyuşmuyor, sıfırlanıyor ({self.yol}).")
+                os.ftruncate(self._fd, 0)
+                os.ftruncate(self._fd, boyut)
+            self._mm = mmap.mmap(self._fd, boyut)
+            self._veri = np.frombuffer(self._mm, dtype=np.uint8, offset=_BASLIK.size)
+            if not self._gecerli():
+                self._sifirla()
+
+    # --- DOSYA DÜZENİ ---
+    @contextmanager
+    def _dosya_kilidi(self):
+        with self._kilit:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _baslik(self):
+        # (sihir, kapasite, dolu, okunan, mühür)
+        return _BASLIK.unpack_from(self._mm, 0)
+
+    def _muhur(self, dolu, okunan):
+        ozet = hashlib.sha256(_SIHIR + struct.pack("<QQQ", self.kapasite, dolu, okunan))
+        ozet.update(self._veri[okunan:dolu])
+        return ozet.digest()
+
+    def _muhurle(self, dolu, okunan):
+        _BASLIK.pack_into(self._mm, 0, _SIHIR, self.kapasite, dolu, okunan, self._muhur(dolu, okunan))
+        self._mm.flush()
+
+    def _gecerli(self):
+        sihir, kapasite, dolu, okunan, muhur = self._baslik()
+        if sihir != _SIHIR or kapasite != self.kapasite or not okunan <= dolu <= kapasite:
+            if sihir != b"\0" * 8:
+                print(f"Uyarı: Önbellek başlığı geçersiz, sıfırlanıyor ({self.yol}).")
+            return False
+        if muhur != self._muhur(dolu, okunan):
+            print(f"Uyarı: Önbellek mührü bozuk, içerik kullanılmayacak ({self.yol}).")
+            return False
+        return True
+
+    def _sifirla(self):
+        self._veri[:] = 0
+        self._muhurle(0, 0)
+
+    # --- API ---
+    @property
+    def kalan(self):
+        """
+        Okunmamış bayt sayısı.
+        """
+        with self._dosya_kilidi():
+            _, _, dolu, okunan, _ = self._baslik()
+        return dolu - okunan
+
+    @property
+    def bos_alan(self):
+        return self.kapasite - self.kalan
+
+    def tuket(self, n=None):
+        """
+        En fazla n baytı (None: hepsini) okuyup tüketir. Mühür bozuksa b"" döner.
+        """
+        with self._dosya_kilidi():
+            # Başka bir süreç arada yazmış olabilir; mühür her seferinde doğrulanır
+            if not self._gecerli():
+                self._sifirla()
+                return b""
+            _, _, dolu, okunan, _ = self._baslik()
+            n = dolu - okunan if n is None else min(n, dolu - okunan)
+            baytlar = self._veri[okunan:okunan + n].tobytes()
+            self._veri[okunan:okunan + n] = 0
+            self._muhurle(dolu, okunan + n)
+        return baytlar
+
+    def yaz(self, baytlar):
+        """
+        Baytları sığdığı kadar ekler; eklenen bayt sayısını döndürür.
+        """
+        baytlar = np.frombuffer(baytlar, dtype=np.uint8)
+        with self._dosya_kilidi():
+            if not self._gecerli():
+                self._sifirla()
+            _, _, dolu, okunan, _ = self._baslik()
+            # Okunmamış kısım başa kaydırılır, tüketilmiş bölge sıfırlanır
+            if okunan:
+                kalan = dolu - okunan
+                self._veri[:kalan] = self._veri[okunan:dolu]
+                self._veri[kalan:dolu] = 0
+                dolu, okunan = kalan, 0
+            n = min(baytlar.size, self.kapasite - dolu)
+            self._veri[dolu:dolu + n] = baytlar[:n]
+            self._muhurle(dolu + n, 0)
+        return n
+
+    def kapat(self):
+        if self._mm is not None:
+            self._veri = None
+            self._mm.close()
+            self._mm = None
+            os.close(self._fd)
@@ -0,0 +1,371 @@
+import atexit
+import os
+import threading
+import time
+
+import numpy as np
+
+import metrics
+from collatz import collatz_bits, collatz_toplu
+from conditioning import Kosullandirici
+from entropy_cache import EntropiOnbellegi
+from frame_sources import kaynak_ac
+from health_tests import SaglikIzleyici
+from von_neumann import ekstrakt_et
+
+
+_VARSAYILAN_KOSULLANDIRICI = Kosullandirici()
+
+# Bu kadar veya daha fazla tohum varsa Collatz toplu (çok tohumlu) modda yürütülür
+TOPLU_ESIK = 128
+
+
+def kareyi_kosullandir(frame, collatz_adim=100, kosullandirici=None, ekstraktor="von_neumann", derinlik=4):
+    """
+    Tek bir kareden temiz bit üretir: Özet (varsayılan SHA-256) -> Collatz ham bitleri -> Von Neumann.
+    Koşullandırıcı birden fazla tohum veriyorsa her tohum ayrı Collatz yörüngesinde yürütülür.
+    ekstraktor="peres" ile Von Neumann yerine 'derinlik' düzeyli Peres kullanılır (von_neumann.py).
+    (Ham bit dizisi, temiz bit dizisi) döndürür; ikisi de 0/1 uint8 dizisidir.
+    """
+    kosullandirici = kosullandirici or _VARSAYILAN_KOSULLANDIRICI
+    with metrics.asama("ozet"):
+        tohumlar = kosullandirici.tohumlar(frame)
+    with metrics.asama("collatz"):
+        ham_bitler = np.concatenate([collatz_bits(seed, collatz_adim)[0] for seed in tohumlar])
+    with metrics.asama("ekstraktor"):
+        return ham_bitler, ekstrakt_et(ham_bitler, ekstraktor, derinlik)
+
+
+def kareleri_kosullandir(kareler, collatz_adim=100, kosullandirici=None, ekstraktor="von_neumann", derinlik=4):
+    """
+    kareyi_kosullandir'ın toplu hali: tüm karelerin tohumları birlikte Collatz'da yürütülür.
+    Her karenin ham bitleri ayrı ayrı çift uzunluğa kesildiği için Von Neumann sonucu, kareleri
+    tek tek işleyip birleştirmekle aynıdır. Peres ise tüm parti üzerinde tek seferde çalışır.
+    """
+    kosullandirici = kosullandirici or _VARSAYILAN_KOSULLANDIRICI
+    if len(kareler) * (kosullandirici.cikti_bayt // kosullandirici.tohum_bayt) < TOPLU_ESIK:
+        sonuclar = [kareyi_kosullandir(frame, collatz_adim, kosullandirici, ekstraktor, derinlik)
+                    for frame in kareler]
+        return (np.concatenate([s[0] for s in sonuclar]),
+                np.concatenate([s[1] for s in sonuclar]))
+
+    with metrics.asama("ozet"):
+        tohumlar = [seed for frame in kareler for seed in kosullandirici.tohumlar(frame)]
+    with metrics.asama("collatz"):
+        bit_matrisi, _ = collatz_toplu(tohumlar, collatz_adim)
+    kare_basina = bit_matrisi.reshape(len(kareler), -1)
+    ham_bitler = kare_basina.ravel()
+    cift = kare_basina.shape[1] - kare_basina.shape[1] % 2
+    with metrics.asama("ekstraktor"):
+        return ham_bitler, ekstrakt_et(kare_basina[:, :cift].ravel(), ekstraktor, derinlik)
+
+
+class EntropiHavuzu:
+    """
+    Kare kaynağını (varsayılan: kamera) arka planda bir thread içinde açık tutan ve temizlenmiş bitleri
+    sabit boyutlu bir halka tampona (ring buffer) dolduran uzun ömürlü havuz.
+
+    - Tampon ust_esik'e kadar dolunca üretim durur, alt_esik'in altına inince devam eder.
+    - read_bits / read_bytes bellekten servis edilir; blok=False iken yeterli bit
+      yoksa beklemeden None döner.
+    - saglik: her kare SP 800-90B sağlık testlerinden geçer (health_tests.py).
+      True -> varsayılan SaglikIzleyici, False -> kapalı, ya da hazır bir izleyici.
+    - kosullandirici: kareden tohum üreten aşama (conditioning.py), None = tüm kare SHA-256.
+    - ekstraktor: "von_neumann" (~%25 verim) veya "peres" (peres_derinlik düzeyli, daha yüksek verim).
+    - onbellek: sıcak başlangıç dosyası (yol veya EntropiOnbellegi, entropy_cache.py). start()'ta
+      içindeki baytlar tüketilip havuza alınır, kamera ısınırken istekler bunlardan karşılanır;
+      havuz üst eşikte boşta kaldığında dosya yeniden doldurulur.
+    """
+
+    def __init__(self, kaynak=None, kapasite=1 << 20, alt_esik=None, ust_esik=None,
+                 collatz_adim=100, isinma_suresi=0.5, saglik=True, kosullandirici=None,
+                 ekstraktor="von_neumann", peres_derinlik=4, onbellek=None, onbellek_bayt=1 << 16):
+        # kaynak: frame_sources.kaynak_ac'ın kabul ettiği her şey (None, 0, "sentetik:42", ...)
+        self.kaynak = kaynak
+        self.kapasite = kapasite
+        self.alt_esik = kapasite // 4 if alt_esik is None else alt_esik
+        self.ust_esik = kapasite if ust_esik is None else ust_esik
+        self.collatz_adim = collatz_adim
+        self.isinma_suresi = isinma_suresi
+        if saglik is True:
+            saglik = SaglikIzleyici()
+        self.saglik = saglik or None
+        self.kosullandirici = kosullandirici
+        self.ekstraktor = ekstraktor
+        self.peres_derinlik = peres_derinlik
+        if isinstance(onbellek, str):
+            onbellek = EntropiOnbellegi(onbellek, onbellek_bayt)
+        self.onbellek = onbellek
+
+        if not 0 <= self.alt_esik < self.ust_esik <= kapasite:
+            raise ValueError("0 <= alt_esik < ust_esik <= kapasite olmalı")
+        if ekstraktor not in ("von_neumann", "peres"):
+            raise ValueError(f"Bilinmeyen ekstraktör: {ekstraktor}")
+
+        # Halka tampon: her eleman tek bir temiz bit (0/1)
+        self._tampon = np.zeros(kapasite, dtype=np.uint8)
+        self._bas = 0
+        self._doluluk = 0
+        self._kosul = threading.Condition()
+
+        self._thread = None
+        self._cap = None
+        self._calisiyor = False
+        # read_bits sadece hiç başlatılmamış havuzu kendiliğinden başlatır
+        self._baslatildi = False
+        self._bosaltma = 0
+        self.hata = None
+        self.son_kare = None
+
+        # Sayaçlar (verimlilik raporu için)
+        self.kare_sayisi = 0
+        self.ham_bit_sayisi = 0
+        self.temiz_bit_sayisi = 0
+
+    # --- YAŞAM DÖNGÜSÜ ---
+    def start(self):
+        """
+        Üretimi başlatır. Durdurulmuş veya hata vermiş havuz sadece açıkça start() ile yeniden başlar.
+        Sağlık testiyle durmuş havuz start() ile başlamaz (hata korunur); yeniden_baslat() gerekir.
+        """
+        with self._kosul:
+            if self._thread is not None and self._thread.is_alive():
+                return self
+            if self.saglik is not None and self.saglik.durdu:
+                return self
+            self._baslatildi = True
+            self._calisiyor = True
+            self.hata = None
+            metrics.HAVUZ_KAPASITE.ayarla(self.kapasite)
+            if self.onbellek is not None:
+                # Önceki çalıştırmadan kalan baytlar: kamera açılmadan servis edilmeye hazır
+                baytlar = self.onbellek.tuket(self.kapasite // 8 - (self._doluluk + 7) // 8)
+                if baytlar:
+                    self._yaz(np.unpackbits(np.frombuffer(baytlar, dtype=np.uint8)))
+            self._thread = threading.Thread(target=self._uretici, name="EntropiHavuzu", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        with self._kosul:
+            self._calisiyor = False
+            self._kosul.notify_all()
+        # Kare bekleyen (örn. sürekli okuma hatası veren kamera) üreticinin okumasını kes
+        cap = self._cap
+        if cap is not None:
+            cap.durdur()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def yeniden_baslat(self):
+        """
+        Havuzu durdurur, sağlık izleyicisinin durmasını sıfırlar ve yeniden başlatır.
+        """
+        self.stop()
+        if self.saglik is not None:
+            self.saglik.sifirla()
+        return self.start()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    @property
+    def doluluk(self):
+        return self._doluluk
+
+    @property
+    def verimlilik(self):
+        if self.ham_bit_sayisi == 0:
+            return 0.0
+        return self.temiz_bit_sayisi / self.ham_bit_sayisi
+
+    # --- ÜRETİCİ (ARKA PLAN) ---
+    def _uretici(self):
+        # Kamera ise ışık ayarı için açılışta bir kez beklenir (frame_sources.py)
+        try:
+            cap = self._cap = kaynak_ac(self.kaynak, isinma_suresi=self.isinma_suresi)
+        except Exception as e:
+            self._durdur(repr(e))
+            return
+        if not cap.isOpened():
+            self._cap = None
+            self._durdur("Kamera açılamadı.")
+            return
+
+        try:
+            while True:
+                onbellege = None
+                with self._kosul:
+                    # Üst eşiğe ulaşıldıysa boşta kalan üretim önbelleği doldurur; önbellek de
+                    # doluysa alt eşiğe inene kadar bekle (histerezis)
+                    if self._doluluk >= self.ust_esik:
+                        bos = self.onbellek.bos_alan if self.onbellek is not None else 0
+                        if bos and self._doluluk >= 8:
+                            onbellege = self._al(min(8 * bos, self._doluluk - self._doluluk % 8))
+                        else:
+                            self._kosul.wait_for(lambda: not self._calisiyor or self._doluluk <= self.alt_esik)
+                    if not self._calisiyor:
+                        break
+                if onbellege is not None:
+                    # Havuzdan çıkarılan bitler artık sadece dosyada (aynı bit iki yerden verilmez)
+                    self.onbellek.yaz(np.packbits(onbellege))
+
+                # Kaynak parti veriyorsa (dosya/sentetik) kareler toplu işlenir; kamera tek kare verir
+                try:
+                    with metrics.asama("yakalama"):
+                        kareler = cap.read_batch(cap.parti_boyutu)
+                except RuntimeError as e:
+                    self._durdur(str(e))
+                    break
+                if len(kareler) == 0:
+                    if not self._calisiyor:
+                        # stop() okumayı kesti
+                        break
+                    # Kamera sürekli kare verir; dosya/sentetik kaynaklar ise bitebilir
+                    self._durdur("Kare kaynağı tükendi.")
+                    break
+
+                # Sağlık testleri (kapalı lens, doymuş sensör, donmuş kare)
+                if self.saglik is not None:
+                    with metrics.asama("saglik"):
+                        kareler = [frame for frame in kareler if self.saglik.kontrol(frame)]
+                    if self.saglik.durdu:
+                        self._durdur(f"Sağlık testi hatası: {self.saglik.son_hata}", bosalt=True)
+                        break
+                    if not kareler:
+                        continue
+
+                ham_bitler, temiz_bitler = kareleri_kosullandir(kareler, self.collatz_adim, self.kosullandirici,
+                                                                self.ekstraktor, self.peres_derinlik)
+                self.son_kare = kareler[-1]
+                self.kare_sayisi += len(kareler)
+                self.ham_bit_sayisi += ham_bitler.size
+                self.temiz_bit_sayisi += temiz_bitler.size
+                if metrics.etkin():
+                    metrics.KARE.ekle(len(kareler))
+                    metrics.HAM_BIT.ekle(ham_bitler.size)
+                    metrics.TEMIZ_BIT.ekle(temiz_bitler.size)
+                    metrics.TEMIZ_BIR.ekle(int(np.count_nonzero(temiz_bitler)))
+                self._yaz(temiz_bitler)
+        except Exception as e:
+            # Koşullandırma, sağlık testi, cv2 ... hatası: bekleyen okuyucular hatayla uyandırılır
+            self._durdur(repr(e))
+        finally:
+            cap.release()
+            self._cap = None
+
+    def _durdur(self, mesaj, bosalt=False):
+        with self._kosul:
+            self.hata = mesaj
+            if bosalt:
+                # Hatalı kaynaktan gelmiş olabilecek bitler artık servis edilmez
+                self._doluluk = 0
+                self._bosaltma += 1
+            self._calisiyor = False
+            self._kosul.notify_all()
+
+    def _yaz(self, bitler):
+        with self._kosul:
+            # Tampona sığmayan bitler atılır (aynı bit iki kez verilmez, eskiler ezilmez)
+            metrics.ATILAN_BIT.ekle(max(0, bitler.size - (self.kapasite - self._doluluk)))
+            bitler = bitler[:self.kapasite - self._doluluk]
+            if bitler.size:
+                kuyruk = (self._bas + self._doluluk) % self.kapasite
+                ilk = min(bitler.size, self.kapasite - kuyruk)
+                self._tampon[kuyruk:kuyruk + ilk] = bitler[:ilk]
+                self._tampon[:bitler.size - ilk] = bitler[ilk:]
+                self._doluluk += bitler.size
+                self._kosul.notify_all()
+            metrics.HAVUZ_DOLULUK.ayarla(self._doluluk)
+
+    def _al(self, n):
+        # Kilit altında çağrılır
+        bas = self._bas
+        ilk = min(n, self.kapasite - bas)
+        parca = np.concatenate((self._tampon[bas:bas + ilk], self._tampon[:n - ilk]))
+        self._bas = (bas + n) % self.kapasite
+        self._doluluk -= n
+        self._kosul.notify_all()
+        metrics.HAVUZ_DOLULUK.ayarla(self._doluluk)
+        return parca
+
+    def _geri_koy(self, bitler):
+        # Kilit altında, tampon boşken çağrılır: yarım kalan okumanın aldığı bitler aynı sırayla
+        # başa konur. Halkadan uzun okumalarda tampon bu boya büyütülür (bit atılmaz).
+        if bitler.size > self.kapasite:
+            self._tampon = np.zeros(bitler.size, dtype=np.uint8)
+            self.kapasite = bitler.size
+        self._tampon[:bitler.size] = bitler
+        self._bas = 0
+        self._doluluk = bitler.size
+        self._kosul.notify_all()
+        metrics.HAVUZ_DOLULUK.ayarla(self._doluluk)
+
+    # --- TÜKETİCİ API ---
+    def read_bits(self, n, blok=True, zaman_asimi=None):
+        """
+        n adet temiz bit (0/1 uint8 dizisi) döndürür.
+        blok=False: havuzda n bit yoksa hemen None döner.
+        blok=True : bitler gelene kadar bekler; zaman aşımında veya kamera hatasında None döner.
+                    O ana kadar alınmış bitler havuza geri konur, sonraki okumada aynı sırayla verilir
+                    (sağlık testi hatasıyla tampon boşaltıldıysa onlar da atılır).
+        İlk okuma havuzu başlatır. Durdurulmuş veya hata vermiş havuzda tamponda kalan bitler
+        verilir, sonra start() çağrılana kadar None döner.
+        """
+        if not self._baslatildi:
+            self.start()
+
+        if not blok:
+            with self._kosul:
+                if self._doluluk < n:
+                    return None
+                metrics.OKUNAN_BIT.ekle(n)
+                return self._al(n)
+
+        son_an = None if zaman_asimi is None else time.monotonic() + zaman_asimi
+        parcalar = []
+        kalan = n
+        with self._kosul:
+            bosaltma = self._bosaltma
+            while kalan > 0:
+                kalan_sure = None if son_an is None else son_an - time.monotonic()
+                hazir = self._kosul.wait_for(
+                    lambda: self._doluluk > 0 or not self._calisiyor, timeout=kalan_sure)
+                if self._doluluk == 0 and (not hazir or not self._calisiyor):
+                    if parcalar and bosaltma == self._bosaltma:
+                        self._geri_koy(np.concatenate(parcalar))
+                    return None
+                parca = self._al(min(kalan, self._doluluk))
+                parcalar.append(parca)
+                kalan -= parca.size
+
+        if not parcalar:
+            return np.zeros(0, dtype=np.uint8)
+        # Sadece tüketiciye verilen bitler sayılır (önbelleğe aktarılan ve geri konanlar hariç)
+        metrics.OKUNAN_BIT.ekle(n)
+        return np.concatenate(parcalar)
+
+    def read_bytes(self, n, blok=True, zaman_asimi=None):
+        bitler = self.read_bits(8 * n, blok=blok, zaman_asimi=zaman_asimi)
+        if bitler is None:
+            return None
+        return np.packbits(bitler).tobytes()
+
+
+_varsayilan_havuz = None
+
+
+def varsayilan_havuz():
+    """
+    Süreç boyunca paylaşılan tek havuz (kamera bir kez açılır).
+    """
+    global _varsayilan_havuz
+    if _varsayilan_havuz is None:
+        # BSG_ONBELLEK=~/.cache/bsg-rng.bin ile sıcak başlangıç önbelleği açılır
+        _varsayilan_havuz = EntropiHavuzu(onbellek=os.environ.get("BSG_ONBELLEK") or None).start()
+        atexit.register(_varsayilan_havuz.stop)
+    return _varsayilan_havuz
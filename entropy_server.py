@@ -0,0 +1,316 @@
+import asyncio
+import collections
+import json
+import os
+import socket
+import stat
+import struct
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from async_pool import AsyncEntropiHavuzu
+
+
+# --- YEREL ENTROPİ SUNUCUSU ---
+# Kamera aynı anda tek bir süreç tarafından açılabilir. Bu daemon havuzu tek başına tutar ve
+# aynı makinedeki süreçlere Unix soketi (ya da yerel TCP) üzerinden entropi dağıtır.
+# Eşzamanlı istekler AsyncEntropiHavuzu'nda birleşip toplu havuz okumasıyla karşılanır.
+#
+# İkili protokol (ağ bayt sırası), bağlantı açık kaldıkça istek / yanıt sırayla gider:
+#   İstek : 1 bayt komut + komuta göre sabit gövde
+#       BAYT       (1) : n (uint32)                      -> n rastgele bayt
+#       RANDINT    (2) : low (int64), high (int64), adet (uint32) -> adet x int64, [low, high)
+#       ISTATISTIK (3) : -                               -> JSON (UTF-8)
+#   Yanıt : durum (uint8, 0 = tamam, 1 = hata) + uzunluk (uint32) + veri (hata ise UTF-8 mesaj)
+#
+# Unix soketi sadece sahibine açıktır (0600) ve varsayılan olarak kullanıcıya özel dizinde
+# ($XDG_RUNTIME_DIR, yoksa /tmp/bsg-rng-<uid>, 0700) oluşturulur; diğer yerel kullanıcılar
+# akışı okuyamaz / tüketemez. TCP modu 127.0.0.1'e bağlanır ama makinedeki herkese açıktır.
+KOMUT_BAYT, KOMUT_RANDINT, KOMUT_ISTATISTIK = 1, 2, 3
+DURUM_TAMAM, DURUM_HATA = 0, 1
+
+_YANIT = struct.Struct("!BI")
+_BAYT_GOVDE = struct.Struct("!I")
+_RANDINT_GOVDE = struct.Struct("!qqI")
+
+
+def _varsayilan_adres():
+    if not hasattr(socket, "AF_UNIX") or not hasattr(os, "getuid"):
+        return "tcp:127.0.0.1:7770"
+    dizin = os.environ.get("XDG_RUNTIME_DIR") or os.path.join(tempfile.gettempdir(), f"bsg-rng-{os.getuid()}")
+    return "unix:" + os.path.join(dizin, "bsg-rng.sock")
+
+
+VARSAYILAN_ADRES = _varsayilan_adres()
+
+
+def adres_coz(adres=None):
+    """
+    "unix:/yol.sock" veya "tcp:host:port" -> ("unix", yol) / ("tcp", (host, port)).
+    None ise BSG_SUNUCU ortam değişkeni, yoksa VARSAYILAN_ADRES kullanılır.
+    """
+    if adres is None:
+        adres = os.environ.get("BSG_SUNUCU", VARSAYILAN_ADRES)
+    tur, _, deger = adres.partition(":")
+    if tur == "unix":
+        return "unix", deger
+    if tur == "tcp":
+        host, _, port = deger.rpartition(":")
+        return "tcp", (host or "127.0.0.1", int(port))
+    raise ValueError(f"Bilinmeyen sunucu adresi: {adres}")
+
+
+def _soket_yolunu_hazirla(yol):
+    """
+    Soket dizinini (yoksa 0700) oluşturur. Yolda eski bir soket varsa sadece bağlantıyı
+    reddediyorsa (sahipsiz) siler; çalışan bir sunucu ya da soket olmayan dosya varsa hata verir.
+    """
+    dizin = os.path.dirname(yol) or "."
+    if not os.path.isdir(dizin):
+        os.makedirs(dizin, mode=0o700)
+    dizin_bilgisi = os.stat(dizin)
+    # Başkasının soketi değiştirebileceği dizin kullanılmaz (/tmp gibi yapışkan bitli dizinler hariç)
+    if dizin_bilgisi.st_uid not in (os.getuid(), 0):
+        raise PermissionError(f"Soket dizini başka bir kullanıcıya ait: {dizin}")
+    if dizin_bilgisi.st_mode & (stat.S_IWGRP | stat.S_IWOTH) and not dizin_bilgisi.st_mode & stat.S_ISVTX:
+        raise PermissionError(f"Soket dizini başkalarınca yazılabilir: {dizin}")
+
+    try:
+        bilgi = os.lstat(yol)
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(bilgi.st_mode):
+        raise FileExistsError(f"Soket yolunda başka bir dosya var: {yol}")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as deneme:
+        try:
+            deneme.connect(yol)
+        except ConnectionRefusedError:
+            # Kapanırken silinmemiş eski soket
+            os.unlink(yol)
+            return
+    raise OSError(f"Bu adreste çalışan bir sunucu var: {yol}")
+
+
+class EntropiSunucusu:
+    """
+    Havuzu tutan ve istemcilere servis eden asyncio sunucusu.
+    istatistikler() istemci başına istek / bayt sayaçlarını döndürür (son 256 istemci).
+    """
+
+    def __init__(self, kaynak=None, adres=None, maks_bayt=1 << 20, maks_adet=1 << 17):
+        self.havuz = AsyncEntropiHavuzu(kaynak)
+        self.tur, self.adres = adres_coz(adres)
+        self.maks_bayt = maks_bayt
+        self.maks_adet = maks_adet
+
+        self._sunucu = None
+        self._istemci_no = 0
+        self.istemciler = collections.OrderedDict()
+        self.baslangic = time.time()
+
+    def _istemci_adi(self, yazici):
+        self._istemci_no += 1
+        soket = yazici.get_extra_info("socket")
+        if self.tur == "unix" and hasattr(socket, "SO_PEERCRED"):
+            # Linux: karşı sürecin PID'si
+            kimlik = soket.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+            return f"pid:{struct.unpack('3i', kimlik)[0]}#{self._istemci_no}"
+        karsi = yazici.get_extra_info("peername")
+        return f"{karsi[0]}:{karsi[1]}#{self._istemci_no}" if karsi else f"#{self._istemci_no}"
+
+    def istatistikler(self):
+        return {
+            "calisma_suresi": round(time.time() - self.baslangic, 1),
+            "havuz_okuma": self.havuz.okuma_sayisi,
+            "havuz_istek": self.havuz.istek_sayisi,
+            "hata": self.havuz.hata,
+            "istemciler": dict(self.istemciler),
+        }
+
+    async def _yanitla(self, yazici, durum, veri):
+        yazici.write(_YANIT.pack(durum, len(veri)) + veri)
+        await yazici.drain()
+
+    async def _istemci(self, okuyucu, yazici):
+        ad = self._istemci_adi(yazici)
+        sayac = {"baglanti": time.time(), "acik": True, "istek": 0, "bayt": 0, "randint": 0, "hata": 0}
+        self.istemciler[ad] = sayac
+        while len(self.istemciler) > 256:
+            self.istemciler.popitem(last=False)
+
+        try:
+            while True:
+                komut = await okuyucu.readexactly(1)
+                komut = komut[0]
+                sayac["istek"] += 1
+
+                if komut == KOMUT_BAYT:
+                    (n,) = _BAYT_GOVDE.unpack(await okuyucu.readexactly(_BAYT_GOVDE.size))
+                    if n > self.maks_bayt:
+                        veri = None
+                        hata = f"En fazla {self.maks_bayt} bayt istenebilir"
+                    else:
+                        veri = await self.havuz.read_bytes(n)
+                        hata = self.havuz.hata or "Entropi alınamadı."
+                    if veri is not None:
+                        sayac["bayt"] += n
+
+                elif komut == KOMUT_RANDINT:
+                    low, high, adet = _RANDINT_GOVDE.unpack(await okuyucu.readexactly(_RANDINT_GOVDE.size))
+                    veri = None
+                    if high <= low or adet > self.maks_adet:
+                        hata = f"low < high ve adet <= {self.maks_adet} olmalı"
+                    else:
+                        degerler = await self.havuz.randint(low, high, size=adet)
+                        hata = self.havuz.hata or "Entropi alınamadı."
+                        if degerler is not None:
+                            veri = degerler.astype(">i8").tobytes()
+                            sayac["randint"] += adet
+
+                elif komut == KOMUT_ISTATISTIK:
+                    veri = json.dumps(self.istatistikler(), ensure_ascii=False).encode("utf-8")
+                    hata = None
+
+                else:
+                    # Çerçeve bozuldu; bağlantıyı kapat
+                    await self._yanitla(yazici, DURUM_HATA, f"Bilinmeyen komut: {komut}".encode("utf-8"))
+                    break
+
+                if veri is None:
+                    sayac["hata"] += 1
+                    await self._yanitla(yazici, DURUM_HATA, hata.encode("utf-8"))
+                else:
+                    await self._yanitla(yazici, DURUM_TAMAM, veri)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            sayac["acik"] = False
+            yazici.close()
+
+    async def serve(self):
+        """
+        Sunucuyu başlatır ve kapatılana kadar çalıştırır.
+        """
+        async with self.havuz:
+            soket_kimligi = None
+            if self.tur == "unix":
+                _soket_yolunu_hazirla(self.adres)
+                # Soket baştan 0600 oluşsun (bind ile chmod arasında açık kalmasın)
+                eski_umask = os.umask(0o177)
+                try:
+                    self._sunucu = await asyncio.start_unix_server(self._istemci, path=self.adres)
+                finally:
+                    os.umask(eski_umask)
+                os.chmod(self.adres, 0o600)
+                bilgi = os.stat(self.adres)
+                soket_kimligi = (bilgi.st_dev, bilgi.st_ino)
+            else:
+                self._sunucu = await asyncio.start_server(self._istemci, *self.adres)
+
+            print(f"Entropi sunucusu dinliyor: {self.tur}:{self.adres}")
+            try:
+                async with self._sunucu:
+                    await self._sunucu.serve_forever()
+            finally:
+                # Sadece kendi soketimiz silinir (yol bu arada başka sunucuya geçmiş olabilir)
+                if soket_kimligi is not None:
+                    try:
+                        bilgi = os.stat(self.adres)
+                        if (bilgi.st_dev, bilgi.st_ino) == soket_kimligi:
+                            os.unlink(self.adres)
+                    except FileNotFoundError:
+                        pass
+
+
+class EntropiIstemcisi:
+    """
+    Sunucuya kalıcı bağlantıyla bağlanan senkron istemci. Havuzla aynı okuma arayüzü
+    (read_bytes / read_bits / hata) olduğu için AralikOrnekleyici, HavuzBitUreteci, DrbgUreteci'ye
+    kaynak olarak verilebilir. Hata durumunda None döner ve 'hata' doldurulur.
+    """
+
+    def __init__(self, adres=None, zaman_asimi=None):
+        self.tur, self.adres = adres_coz(adres)
+        self.zaman_asimi = zaman_asimi
+        self._soket = None
+        self.hata = None
+
+    def _baglan(self):
+        if self._soket is None:
+            if self.tur == "unix":
+                self._soket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            else:
+                self._soket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                self._soket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self._soket.settimeout(self.zaman_asimi)
+            self._soket.connect(self.adres)
+        return self._soket
+
+    def close(self):
+        if self._soket is not None:
+            self._soket.close()
+            self._soket = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _tam_oku(self, n):
+        parcalar = bytearray()
+        while len(parcalar) < n:
+            parca = self._soket.recv(n - len(parcalar))
+            if not parca:
+                raise ConnectionError("Sunucu bağlantıyı kapattı")
+            parcalar += parca
+        return bytes(parcalar)
+
+    def _istek(self, komut, govde=b""):
+        try:
+            soket = self._baglan()
+            soket.sendall(bytes([komut]) + govde)
+            durum, uzunluk = _YANIT.unpack(self._tam_oku(_YANIT.size))
+            veri = self._tam_oku(uzunluk)
+        except OSError as e:
+            self.close()
+            self.hata = f"Sunucuya ulaşılamadı: {e}"
+            return None
+        if durum != DURUM_TAMAM:
+            self.hata = veri.decode("utf-8")
+            return None
+        return veri
+
+    def read_bytes(self, n, blok=True, zaman_asimi=None):
+        return self._istek(KOMUT_BAYT, _BAYT_GOVDE.pack(n))
+
+    def read_bits(self, n, blok=True, zaman_asimi=None):
+        baytlar = self.read_bytes((n + 7) // 8)
+        if baytlar is None:
+            return None
+        return np.unpackbits(np.frombuffer(baytlar, dtype=np.uint8), count=n)
+
+    def randint(self, low, high, size=None):
+        adet = 1 if size is None else int(np.prod(size))
+        veri = self._istek(KOMUT_RANDINT, _RANDINT_GOVDE.pack(low, high, adet))
+        if veri is None:
+            return None
+        degerler = np.frombuffer(veri, dtype=">i8").astype(np.int64)
+        return int(degerler[0]) if size is None else degerler.reshape(size)
+
+    def istatistik(self):
+        veri = self._istek(KOMUT_ISTATISTIK)
+        return None if veri is None else json.loads(veri.decode("utf-8"))
+
+
+# --- ÇALIŞTIRMA ---
+if __name__ == "__main__":
+    # python entropy_server.py [unix:/run/user/1000/bsg-rng.sock | tcp:127.0.0.1:7770]
+    sunucu = EntropiSunucusu(adres=sys.argv[1] if len(sys.argv) > 1 else None)
+    try:
+        asyncio.run(sunucu.serve())
+    except KeyboardInterrupt:
+        print("\nSunucu kapatıldı.")
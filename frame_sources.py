@@ -0,0 +1,336 @@
+import glob
+import os
+import queue
+import threading
+import time
+
+import cv2
+import numpy as np
+
+
+def _yigin(kareler):
+    """
+    Kare listesini (k, H, W, C) dizisine yığar; boyutlar farklıysa nesne dizisi döndürür.
+    """
+    if not kareler:
+        return np.zeros((0,), dtype=np.uint8)
+    if any(k.shape != kareler[0].shape for k in kareler):
+        parti = np.empty(len(kareler), dtype=object)
+        parti[:] = kareler
+        return parti
+    return np.stack(kareler)
+
+
+# --- KARE KAYNAĞI SOYUTLAMASI ---
+# Tüm kaynaklar cv2.VideoCapture ile aynı küçük arayüzü sunar:
+#   isOpened(), read() -> (ret, frame), release()
+# Ek olarak read_batch(n) ile kareler (n, H, W, C) dizisi halinde toplu okunabilir.
+# onden_okuma > 0 verilirse bir arka plan thread'i parti_boyutu'luk partileri önceden okur.
+# durdur() bekleyen okumayı kaynağı kapatmadan keser (okuma boş parti döner).
+class KareKaynagi:
+    """
+    Kare kaynaklarının ortak taban sınıfı. Alt sınıflar _oku_parti(n) yazar.
+    """
+
+    def __init__(self, parti_boyutu=8, onden_okuma=0):
+        self.parti_boyutu = parti_boyutu
+        self.onden_okuma = onden_okuma
+        self._acik = True
+        self._bekleyen = []
+        self._kuyruk = None
+        self._thread = None
+        self._durdur = threading.Event()
+
+    # --- Alt sınıfların dolduracağı kısım ---
+    def _oku_parti(self, n):
+        """
+        En fazla n kare okur, (k, H, W, C) dizisi döndürür. Akış bittiyse k = 0.
+        """
+        raise NotImplementedError
+
+    def _kapat(self):
+        pass
+
+    # --- cv2.VideoCapture uyumlu arayüz ---
+    def isOpened(self):
+        return self._acik
+
+    def read(self):
+        if not self._bekleyen:
+            parti = self.read_batch(self.parti_boyutu)
+            if len(parti) == 0:
+                return False, None
+            self._bekleyen = list(parti[::-1])
+        return True, self._bekleyen.pop()
+
+    def durdur(self):
+        self._durdur.set()
+
+    def release(self):
+        self._durdur.set()
+        if self._thread is not None:
+            # Kuyrukta bekleyen üretici thread'in takılı kalmaması için boşalt
+            while self._thread.is_alive():
+                try:
+                    self._kuyruk.get_nowait()
+                except queue.Empty:
+                    self._thread.join(timeout=0.05)
+            self._thread = None
+        if self._acik:
+            self._acik = False
+            self._kapat()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+    # --- Toplu okuma ve önden okuma ---
+    def read_batch(self, n):
+        """
+        n kareye kadar toplu okur. Önden okuma açıksa hazır partiler kuyruktan alınır.
+        """
+        if not self._acik:
+            return np.zeros((0,), dtype=np.uint8)
+        if self._bekleyen:
+            # Önce read() ile açılmış partinin kalan karelerini ver
+            return _yigin([self._bekleyen.pop() for _ in range(min(n, len(self._bekleyen)))])
+        if self.onden_okuma <= 0:
+            return self._oku_parti(n)
+
+        if self._thread is None:
+            self._kuyruk = queue.Queue(maxsize=self.onden_okuma)
+            self._thread = threading.Thread(target=self._onden_oku, daemon=True)
+            self._thread.start()
+
+        parti = self._kuyruk.get()
+        if isinstance(parti, Exception) or len(parti) == 0:
+            # Akış bitti ya da okuma hatası; sonraki çağrılar da aynı sonucu alsın
+            self._kuyruk.put(parti)
+            if isinstance(parti, Exception):
+                raise parti
+        return parti
+
+    def _onden_oku(self):
+        while not self._durdur.is_set():
+            try:
+                parti = self._oku_parti(self.parti_boyutu)
+            except Exception as e:
+                # Hata tüketici thread'de (read_batch) yeniden fırlatılır
+                self._kuyruk.put(e)
+                return
+            self._kuyruk.put(parti)
+            if len(parti) == 0:
+                return
+        # durdur() ile kesildi: bekleyen read_batch boş parti alsın
+        try:
+            self._kuyruk.put_nowait(np.zeros((0,), dtype=np.uint8))
+        except queue.Full:
+            pass
+
+
+class KameraKaynagi(KareKaynagi):
+    """
+    Canlı kamera (cv2.VideoCapture). Açılışta ışık ayarı için bir kez bekler.
+    Art arda maks_hatali_okuma kare okunamazsa (örn. cihaz çıkarıldı ama "açık" görünüyor)
+    RuntimeError fırlatır.
+    """
+
+    def __init__(self, indeks=0, isinma_suresi=0.5, parti_boyutu=1, onden_okuma=0, maks_hatali_okuma=30):
+        super().__init__(parti_boyutu, onden_okuma)
+        self.maks_hatali_okuma = maks_hatali_okuma
+        self._cap = cv2.VideoCapture(indeks)
+        self._acik = self._cap.isOpened()
+        if self._acik:
+            time.sleep(isinma_suresi)
+
+    def _oku_parti(self, n):
+        kareler = []
+        hatali = 0
+        bekleme = 0.001
+        # Kamera anlık kare vermezse boş parti akış sonu sayılmasın, tekrar denensin. Başarısız
+        # okumalar arasında artan sürelerle beklenir (durdur() beklemeyi hemen keser)
+        while not kareler and self._cap.isOpened() and not self._durdur.is_set():
+            for _ in range(n):
+                ret, frame = self._cap.read()
+                if ret:
+                    kareler.append(frame)
+            if not kareler:
+                hatali += n
+                if hatali >= self.maks_hatali_okuma:
+                    raise RuntimeError(f"Kameradan art arda {hatali} kare okunamadı.")
+                self._durdur.wait(bekleme)
+                bekleme = min(2 * bekleme, 0.1)
+        return _yigin(kareler)
+
+    def _kapat(self):
+        self._cap.release()
+
+
+class VideoKaynagi(KareKaynagi):
+    """
+    Video dosyasından kare okur. dongu=True ise sona gelince başa sarar.
+    """
+
+    def __init__(self, yol, dongu=False, parti_boyutu=8, onden_okuma=2):
+        super().__init__(parti_boyutu, onden_okuma)
+        self.yol = yol
+        self.dongu = dongu
+        self._cap = cv2.VideoCapture(yol)
+        self._acik = self._cap.isOpened()
+
+    def _oku_parti(self, n):
+        kareler = []
+        basa_sarildi = False
+        while len(kareler) < n:
+            ret, frame = self._cap.read()
+            if not ret:
+                # Başa sardıktan hemen sonra da okunamıyorsa video boştur
+                if not self.dongu or basa_sarildi:
+                    break
+                self._cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                basa_sarildi = True
+                continue
+            basa_sarildi = False
+            kareler.append(frame)
+        return _yigin(kareler)
+
+    def _kapat(self):
+        self._cap.release()
+
+
+class KlasorKaynagi(KareKaynagi):
+    """
+    Bir klasördeki resimleri (alfabetik sırayla) kare olarak verir.
+    """
+
+    def __init__(self, klasor, desen="*.png", dongu=False, parti_boyutu=8, onden_okuma=2):
+        super().__init__(parti_boyutu, onden_okuma)
+        self.dosyalar = sorted(glob.glob(os.path.join(klasor, desen)))
+        self.dongu = dongu
+        self._sira = 0
+        self._acik = len(self.dosyalar) > 0
+
+    def _oku_parti(self, n):
+        kareler = []
+        while len(kareler) < n:
+            if self._sira >= len(self.dosyalar):
+                if not self.dongu:
+                    break
+                self._sira = 0
+            yol = self.dosyalar[self._sira]
+            self._sira += 1
+            # Türkçe karakterli yollar için numpy ile okuma
+            img = cv2.imdecode(np.fromfile(yol, dtype=np.uint8), cv2.IMREAD_COLOR)
+            if img is not None:
+                kareler.append(img)
+        # Farklı boyutlu resimler yığılamaz; o durumda nesne dizisi döner
+        return _yigin(kareler)
+
+
+class HamDokumKaynagi(KareKaynagi):
+    """
+    Bellek eşlemeli (memmap) ham kare dökümü. Kareler kopyalanmadan dilim olarak verilir.
+    .npy dosyalarında şekil dosyadan okunur, ham dosyalarda 'sekil' = (H, W, C) verilmelidir.
+    """
+
+    def __init__(self, yol, sekil=None, dtype=np.uint8, dongu=False, parti_boyutu=64, onden_okuma=0):
+        super().__init__(parti_boyutu, onden_okuma)
+        if yol.endswith(".npy"):
+            self._kareler = np.load(yol, mmap_mode="r")
+        else:
+            if sekil is None:
+                raise ValueError("Ham döküm için kare şekli (H, W, C) gerekli")
+            self._kareler = np.memmap(yol, dtype=dtype, mode="r").reshape((-1,) + tuple(sekil))
+        self.dongu = dongu
+        self._sira = 0
+        self._acik = len(self._kareler) > 0
+
+    def _oku_parti(self, n):
+        if self._sira >= len(self._kareler):
+            if not self.dongu:
+                return self._kareler[:0]
+            self._sira = 0
+        parti = self._kareler[self._sira:self._sira + n]
+        self._sira += len(parti)
+        return parti
+
+
+class SentetikKaynak(KareKaynagi):
+    """
+    Tohumlu (seed) sentetik gürültü kareleri. Aynı tohum her zaman aynı kareleri verir.
+    adet=None ise sonsuz akış üretir.
+    """
+
+    def __init__(self, tohum=0, sekil=(480, 640, 3), adet=None, parti_boyutu=16, onden_okuma=0):
+        super().__init__(parti_boyutu, onden_okuma)
+        self.sekil = tuple(sekil)
+        self.kalan = adet
+        self._rng = np.random.default_rng(tohum)
+
+    def _oku_parti(self, n):
+        if self.kalan is not None:
+            n = min(n, self.kalan)
+            self.kalan -= n
+        return self._rng.integers(0, 256, size=(n,) + self.sekil, dtype=np.uint8)
+
+
+def kareleri_kaydet(kaynak, yol, adet):
+    """
+    Bir kaynaktan 'adet' kareyi .npy dökümü olarak kaydeder (HamDokumKaynagi ile tekrar oynatılır).
+    Kaydedilen kare sayısını döndürür.
+    """
+    ret, ilk = kaynak.read()
+    if not ret:
+        return 0
+    dokum = np.lib.format.open_memmap(yol, mode="w+", dtype=ilk.dtype, shape=(adet,) + ilk.shape)
+    dokum[0] = ilk
+    yazilan = 1
+    while yazilan < adet:
+        parti = kaynak.read_batch(adet - yazilan)
+        if len(parti) == 0:
+            break
+        dokum[yazilan:yazilan + len(parti)] = parti
+        yazilan += len(parti)
+    dokum.flush()
+    del dokum
+    return yazilan
+
+
+_TURLER = {
+    "kamera": KameraKaynagi, "camera": KameraKaynagi,
+    "video": VideoKaynagi,
+    "klasor": KlasorKaynagi, "dir": KlasorKaynagi,
+    "ham": HamDokumKaynagi, "raw": HamDokumKaynagi,
+    "sentetik": SentetikKaynak, "synthetic": SentetikKaynak,
+}
+
+
+def kaynak_ac(tanim=None, isinma_suresi=0.5, **ayarlar):
+    """
+    Kare kaynağı oluşturur. 'tanim' şunlardan biri olabilir:
+      - None           : BSG_KAYNAK ortam değişkeni, yoksa "kamera:0"
+      - int            : kamera indeksi
+      - KareKaynagi    : olduğu gibi döndürülür
+      - "tur:deger"    : kamera:0, video:yol.mp4, klasor:yol, ham:yol.npy, sentetik:42
+    isinma_suresi sadece kameraya uygulanır; diğer anahtar kelimeler ilgili sınıfa
+    iletilir (örn. dongu, onden_okuma).
+    """
+    if isinstance(tanim, KareKaynagi):
+        return tanim
+    if tanim is None:
+        tanim = os.environ.get("BSG_KAYNAK", "kamera:0")
+    if isinstance(tanim, int):
+        return KameraKaynagi(tanim, isinma_suresi, **ayarlar)
+
+    tur, _, deger = tanim.partition(":")
+    if tur not in _TURLER:
+        raise ValueError(f"Bilinmeyen kare kaynağı: {tanim}")
+    sinif = _TURLER[tur]
+
+    if sinif is KameraKaynagi:
+        return sinif(int(deger or 0), isinma_suresi, **ayarlar)
+    if sinif is SentetikKaynak:
+        return sinif(int(deger or 0), **ayarlar)
+    return sinif(deger, **ayarlar)
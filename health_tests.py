@@ -0,0 +1,204 @@
+import collections
+import hashlib
+import math
+
+import numpy as np
+from scipy.stats import binom
+
+import metrics
+
+
+# --- SÜREKLİ SAĞLIK TESTLERİ (NIST SP 800-90B, 4.4) ---
+# Testler koşullandırılmış (hash'lenmiş) çıktıya değil, ham gürültü kaynağına uygulanır:
+# karenin sabit aralıklarla seçilmiş piksel baytları "örnek" kabul edilir.
+# Kapalı lens (hep 0), doymuş sensör (hep 255) veya donmuş kare bu örneklerde hemen görünür.
+# Varsayılan min_entropi=1.0 bit/örnek: düz (dokusuz) sahnede ~1 DN okuma gürültüsüyle sağlanır,
+# ~0.5 DN ve altında kaynak reddedilir; dokulu sahneler sahne değişkenliğiyle de geçer
+# (tests/test_health_tests.py sentetik karelerle sınar).
+def kare_ornekleri(frame, adim=257):
+    """
+    Kareden her 'adim' baytta bir örnek alır (kopyasız, adımlı görünüm).
+    """
+    return np.asarray(frame).reshape(-1)[::adim]
+
+
+def rct_esigi(min_entropi, alfa=2.0 ** -20):
+    # Tekrar Sayısı Testi kesim değeri: C = 1 + ceil(-log2(alfa) / H)
+    return 1 + math.ceil(-math.log2(alfa) / min_entropi)
+
+
+def apt_esigi(min_entropi, pencere=512, alfa=2.0 ** -20):
+    # Uyarlamalı Oran Testi kesim değeri: C = 1 + CRITBINOM(W, 2^-H, 1 - alfa)
+    return 1 + int(binom.ppf(1 - alfa, pencere, 2.0 ** -min_entropi))
+
+
+class TekrarSayisiTesti:
+    """
+    Repetition Count Test: aynı örneğin art arda C kez görülmesi hata sayılır.
+    Kare içindeki koşular diziyle bulunur; kareler arası koşu durumu taşınır.
+    """
+
+    def __init__(self, min_entropi, alfa=2.0 ** -20):
+        self.esik = rct_esigi(min_entropi, alfa)
+        self.sifirla()
+
+    def sifirla(self):
+        self._son = None
+        self._kosu = 0
+
+    def kontrol(self, ornekler):
+        if ornekler.size == 0:
+            return True
+        degisim = np.flatnonzero(ornekler[1:] != ornekler[:-1]) + 1
+        sinirlar = np.concatenate(([0], degisim, [ornekler.size]))
+        kosular = np.diff(sinirlar)
+
+        # Önceki karenin son koşusu bu karenin ilk koşusuyla devam ediyor olabilir
+        if self._son is not None and ornekler[0] == self._son:
+            kosular[0] += self._kosu
+
+        self._son = ornekler[-1]
+        self._kosu = int(kosular[-1])
+        return int(kosular.max()) < self.esik
+
+
+class UyarlamaliOranTesti:
+    """
+    Adaptive Proportion Test: W örneklik her pencerede ilk örneğin C kez
+    veya daha fazla görülmesi hata sayılır. Tam pencereler tek seferde sayılır.
+    """
+
+    def __init__(self, min_entropi, pencere=512, alfa=2.0 ** -20):
+        self.pencere = pencere
+        self.esik = apt_esigi(min_entropi, pencere, alfa)
+        self.sifirla()
+
+    def sifirla(self):
+        self._referans = None
+        self._kalan = 0
+        self._sayac = 0
+
+    def kontrol(self, ornekler):
+        gecti = True
+        i = 0
+
+        # Önceki kareden yarım kalan pencereyi tamamla
+        if self._kalan:
+            parca = ornekler[:self._kalan]
+            self._sayac += int(np.count_nonzero(parca == self._referans))
+            self._kalan -= parca.size
+            i = parca.size
+            if self._sayac >= self.esik:
+                gecti = False
+
+        # Tam pencereler
+        tam = (ornekler.size - i) // self.pencere
+        if tam:
+            pencereler = ornekler[i:i + tam * self.pencere].reshape(tam, self.pencere)
+            sayilar = np.count_nonzero(pencereler == pencereler[:, :1], axis=1)
+            if int(sayilar.max()) >= self.esik:
+                gecti = False
+            i += tam * self.pencere
+
+        # Yeni yarım pencere
+        if i < ornekler.size:
+            parca = ornekler[i:]
+            self._referans = parca[0]
+            self._sayac = int(np.count_nonzero(parca == self._referans))
+            self._kalan = self.pencere - parca.size
+            if self._sayac >= self.esik:
+                gecti = False
+
+        return gecti
+
+
+class SaglikIzleyici:
+    """
+    Kare -> Hash -> Collatz -> Von Neumann döngüsüne takılan sağlık izleyicisi.
+    Her karede RCT, APT ve tekrar eden kare kontrolü yapar.
+
+    eylem="at"     : hatalı kare atılır, üretim devam eder.
+    eylem="durdur" : ilk hatada çıktı durdurulur (durdu = True).
+    """
+
+    def __init__(self, min_entropi=1.0, ornek_adimi=257, apt_pencere=512,
+                 tekrar_penceresi=16, eylem="at", alfa=2.0 ** -20):
+        if eylem not in ("at", "durdur"):
+            raise ValueError("eylem 'at' veya 'durdur' olmalı")
+
+        self.ornek_adimi = ornek_adimi
+        self.eylem = eylem
+        self.rct = TekrarSayisiTesti(min_entropi, alfa)
+        self.apt = UyarlamaliOranTesti(min_entropi, apt_pencere, alfa)
+
+        self._son_ozetler = collections.deque(maxlen=tekrar_penceresi)
+        self._ozet_kumesi = set()
+
+        self.durdu = False
+        self.son_hata = None
+        self.sayaclar = {
+            "kare": 0,
+            "atilan_kare": 0,
+            "rct_hata": 0,
+            "apt_hata": 0,
+            "tekrar_kare": 0,
+        }
+
+    def sifirla(self):
+        """
+        Durmuş izleyiciyi yeniden çalışır hale getirir (sayaçlar korunur). Kaynak düzeltildikten
+        sonra açıkça çağrılır; durma kendiliğinden kalkmaz.
+        """
+        self.durdu = False
+        self.son_hata = None
+        self.rct.sifirla()
+        self.apt.sifirla()
+        self._son_ozetler.clear()
+        self._ozet_kumesi.clear()
+
+    def kontrol(self, frame):
+        """
+        Kare sağlıklıysa True döndürür. Hatalı karede sayaçları artırır ve
+        eyleme göre kareyi atar ya da izleyiciyi durdurur.
+        """
+        if self.durdu:
+            return False
+        self.sayaclar["kare"] += 1
+
+        ornekler = kare_ornekleri(frame, self.ornek_adimi)
+        hatalar = []
+
+        if not self.rct.kontrol(ornekler):
+            self.sayaclar["rct_hata"] += 1
+            metrics.SAGLIK_HATASI.ekle(test="rct")
+            hatalar.append("Tekrar Sayısı Testi")
+        if not self.apt.kontrol(ornekler):
+            self.sayaclar["apt_hata"] += 1
+            metrics.SAGLIK_HATASI.ekle(test="apt")
+            hatalar.append("Uyarlamalı Oran Testi")
+
+        # Donmuş kare: son birkaç karenin örnek özetiyle karşılaştır
+        ozet = hashlib.blake2b(np.ascontiguousarray(ornekler), digest_size=16).digest()
+        if ozet in self._ozet_kumesi:
+            self.sayaclar["tekrar_kare"] += 1
+            metrics.SAGLIK_HATASI.ekle(test="tekrar_kare")
+            hatalar.append("Tekrar Eden Kare")
+        else:
+            if len(self._son_ozetler) == self._son_ozetler.maxlen:
+                self._ozet_kumesi.discard(self._son_ozetler[0])
+            self._son_ozetler.append(ozet)
+            self._ozet_kumesi.add(ozet)
+
+        if not hatalar:
+            return True
+
+        self.son_hata = ", ".join(hatalar)
+        self.sayaclar["atilan_kare"] += 1
+        metrics.ATILAN_KARE.ekle()
+        if self.eylem == "durdur":
+            self.durdu = True
+        else:
+            # Hatalı karenin yarım kalan koşu/pencere durumu sonraki karelere taşınmasın
+            self.rct.sifirla()
+            self.apt.sifirla()
+        return False
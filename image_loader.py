@@ -0,0 +1,139 @@
+import mmap
+import os
+import queue
+import struct
+import threading
+
+import cv2
+import numpy as np
+
+
+# --- HIZLI GÖRÜNTÜ YÜKLEME ---
+# Eski yol: dosya bytearray'e okunur, NumPy'a kopyalanır, tam çözünürlükte renkli çözülür, griye
+# çevrilir ve ancak sonra 1024 genişliğe küçültülür. Burada:
+#   - Dosya memmap ile cv2.imdecode'a verilir (Türkçe karakterli yollar da çalışır, kopya yok).
+#   - Doğrudan gri çözülür; başlıktan okunan genişlik izin veriyorsa çözücünün küçültülmüş
+#     modları (IMREAD_REDUCED_GRAYSCALE_2/4/8, JPEG'de DCT ölçekleme) kullanılır.
+#   - onden_yukle toplu çalıştırmalarda sonraki dosyaları arka plan thread'inde çözer.
+# Sonuç eski yoldan birkaç gri seviye farklı olabilir (gri dönüşüm ve küçültme çözücüde yapılır).
+# Önbellek anahtarlarında kullanılır; çözme davranışı değişirse artırılmalı.
+YUKLEYICI_SURUMU = 2
+
+_AZALTMA_BAYRAKLARI = (
+    (8, cv2.IMREAD_REDUCED_GRAYSCALE_8),
+    (4, cv2.IMREAD_REDUCED_GRAYSCALE_4),
+    (2, cv2.IMREAD_REDUCED_GRAYSCALE_2),
+)
+
+# JPEG SOF işaretçileri (C4 = DHT, C8 = JPG, CC = DAC hariç)
+_JPEG_SOF = set(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def goruntu_boyutu(baytlar):
+    """
+    PNG / JPEG başlığından (genişlik, yükseklik) okur; bilinmeyen formatta None döner.
+    """
+    if bytes(baytlar[:8]) == b"\x89PNG\r\n\x1a\n" and len(baytlar) >= 24:
+        return struct.unpack(">II", bytes(baytlar[16:24]))
+
+    if bytes(baytlar[:2]) == b"\xff\xd8":
+        i = 2
+        while i + 9 < len(baytlar):
+            if baytlar[i] != 0xFF:
+                return None
+            isaret = baytlar[i + 1]
+            if isaret == 0xFF:
+                # Dolgu baytı
+                i += 1
+                continue
+            if 0xD0 <= isaret <= 0xD9 or isaret == 0x01:
+                # Uzunluksuz işaretçiler
+                i += 2
+                continue
+            if isaret in _JPEG_SOF:
+                yukseklik, genislik = struct.unpack(">HH", bytes(baytlar[i + 5:i + 9]))
+                return genislik, yukseklik
+            i += 2 + struct.unpack(">H", bytes(baytlar[i + 2:i + 4]))[0]
+    return None
+
+
+def azaltma_bayragi(genislik, maks_genislik):
+    """
+    Çözülen genişlik maks_genislik'in altına inmeden kullanılabilecek en büyük azaltma bayrağı.
+    """
+    if genislik is not None:
+        for oran, bayrak in _AZALTMA_BAYRAKLARI:
+            if genislik // oran >= maks_genislik:
+                return bayrak
+    return cv2.IMREAD_GRAYSCALE
+
+
+def goruntu_coz(dosya_baytlari, maks_genislik=1024):
+    """
+    Dosya içeriğini (bytes ya da uint8 dizi / memmap) gri görüntüye çözer, genişliği
+    maks_genislik'i aşarsa küçültür. Çözülemezse None döner.
+    """
+    baytlar = np.frombuffer(dosya_baytlari, dtype=np.uint8)
+    boyut = goruntu_boyutu(baytlar)
+    genislik = boyut[0] if boyut is not None else None
+    img_gray = cv2.imdecode(baytlar, azaltma_bayragi(genislik, maks_genislik))
+    if img_gray is None:
+        return None
+    h, w = img_gray.shape
+    if w > maks_genislik:
+        scale = maks_genislik / w
+        img_gray = cv2.resize(img_gray, (0, 0), fx=scale, fy=scale)
+    return img_gray
+
+
+def goruntu_yukle(yol, maks_genislik=1024):
+    """
+    Dosyayı memmap ile açıp goruntu_coz ile çözer. Boş / okunamayan dosyada None döner.
+    """
+    if os.path.getsize(yol) == 0:
+        return None
+    with open(yol, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as eslem:
+        baytlar = np.frombuffer(eslem, dtype=np.uint8)
+        try:
+            return goruntu_coz(baytlar, maks_genislik)
+        finally:
+            # mmap kapanmadan önce ona bakan dizi bırakılmalı
+            del baytlar
+
+
+def onden_yukle(dosyalar, yukleyici=goruntu_yukle, onden=4, **ayarlar):
+    """
+    (dosya, yukleyici(dosya, **ayarlar)) çiftlerini sırayla veren üreteç. Sonraki 'onden' dosya
+    arka plan thread'inde hazırlanır (cv2.imdecode GIL'i bırakır). Hata veren dosyada sonuç None olur.
+    """
+    kuyruk = queue.Queue(maxsize=max(1, onden))
+    dur = threading.Event()
+
+    def oku():
+        for dosya in dosyalar:
+            try:
+                sonuc = yukleyici(dosya, **ayarlar)
+            except Exception as e:
+                print(f"Okuma hatası ({dosya}): {e}")
+                sonuc = None
+            while not dur.is_set():
+                try:
+                    kuyruk.put((dosya, sonuc), timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+            if dur.is_set():
+                return
+        kuyruk.put(None)
+
+    thread = threading.Thread(target=oku, name="bsg-onden-yukle", daemon=True)
+    thread.start()
+    try:
+        while True:
+            oge = kuyruk.get()
+            if oge is None:
+                return
+            yield oge
+    finally:
+        # Tüketici erken bıraktıysa okuyucu thread'i durdur
+        dur.set()
@@ -0,0 +1,283 @@
+import argparse
+import concurrent.futures
+import csv
+import glob
+import hashlib
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from JPEG_with_RNG import standart_tablo
+from entropy_pool import varsayilan_havuz
+from image_loader import YUKLEYICI_SURUMU, goruntu_yukle, onden_yukle
+from rd_sweep import TabloDegerlendirici
+from sampling import varsayilan_ornekleyici
+
+
+# --- TOPLU (BAŞSIZ) JPEG SİMÜLASYONU ---
+# JPEG_with_RNG.py tek görüntüyle, input() ve cv2.imshow ile etkileşimli çalışır. Bu çalıştırıcı
+# bir klasör / glob desenindeki tüm görüntüleri süreç havuzuna dağıtır:
+#   - Görüntü başına DCT katsayıları bir kez hesaplanır, tüm tablolar birlikte puanlanır
+#     (rd_sweep.TabloDegerlendirici; sonuçlar jpeg_simule_et + psnr_hesapla ile aynı).
+#   - Sonuçlar bittikçe CSV / JSON satırı olarak yazılır (sıra, bitiş sırasıdır).
+#   - (görüntü içerik özeti, tablo özeti) anahtarıyla önbelleğe alınır; yeniden çalıştırmada
+#     önbellekte olan çiftler hesaplanmaz, sadece eksik tablolar işçiye gönderilir.
+#   - Dosyalar sonraki birkaç dosya önden okunarak özetlenir; isci=1 iken süreç havuzu yerine aynı
+#     süreçte çalışılır ve görüntü çözme de önden (arka plan thread'inde) yapılır.
+#   - Süreç havuzunda aynı anda sınırlı sayıda iş bekler; sonuçlar gönderim sürerken işlenir.
+#   - TRNG tabloları her çalıştırmada yeni çekildiği için önbellekte bulunmaz; --trng ile üretilen
+#     tablolar dosyaya kaydedilir, tekrar çalıştırmada --tablolar ile verilirse önbellek kullanılır.
+GORUNTU_UZANTILARI = (".png", ".jpg", ".jpeg", ".bmp", ".tif", ".tiff", ".webp")
+VARSAYILAN_ONBELLEK = "jpeg_toplu_onbellek.jsonl"
+VARSAYILAN_TRNG_KAYDI = "jpeg_toplu_trng_tablolari.npy"
+ALANLAR = ["dosya", "goruntu_ozeti", "tablo", "tablo_ozeti", "psnr", "boyut", "onbellekten"]
+
+
+def goruntuleri_bul(kaynak):
+    """
+    Klasör (alt klasörler dahil) veya glob deseni -> sıralı görüntü dosyası listesi.
+    """
+    if os.path.isdir(kaynak):
+        dosyalar = glob.glob(os.path.join(kaynak, "**", "*"), recursive=True)
+    else:
+        dosyalar = glob.glob(kaynak, recursive=True)
+    return sorted(d for d in dosyalar if os.path.isfile(d) and d.lower().endswith(GORUNTU_UZANTILARI))
+
+
+def tablo_ozeti(tablo):
+    return hashlib.sha256(np.asarray(tablo, dtype=np.float64).tobytes()).hexdigest()[:16]
+
+
+def goruntu_ozeti(dosya_baytlari, maks_genislik):
+    # Küçültme ayarı ve yükleyici sürümü de sonucu değiştirdiği için anahtara dahil
+    return hashlib.sha256(dosya_baytlari).hexdigest()[:32] + f":{maks_genislik}:v{YUKLEYICI_SURUMU}"
+
+
+def dosya_ozeti(dosya, maks_genislik):
+    with open(dosya, "rb") as f:
+        return goruntu_ozeti(f.read(), maks_genislik)
+
+
+class SonucOnbellegi:
+    """
+    (görüntü özeti, tablo özeti) -> (psnr, boyut). Diskte satır satır JSON (sadece ekleme)
+    olarak tutulur; yarım kalmış son satır açılışta yok sayılır.
+    """
+
+    def __init__(self, yol=VARSAYILAN_ONBELLEK):
+        self.yol = yol
+        self.kayitlar = {}
+        if yol and os.path.exists(yol):
+            with open(yol, encoding="utf-8") as f:
+                for satir in f:
+                    try:
+                        k = json.loads(satir)
+                    except json.JSONDecodeError:
+                        continue
+                    self.kayitlar[(k["goruntu"], k["tablo"])] = (k["psnr"], k["boyut"])
+        self._dosya = open(yol, "a", encoding="utf-8") if yol else None
+
+    def al(self, goruntu, tablo):
+        return self.kayitlar.get((goruntu, tablo))
+
+    def ekle(self, goruntu, tablo, psnr, boyut):
+        self.kayitlar[(goruntu, tablo)] = (psnr, boyut)
+        if self._dosya is not None:
+            self._dosya.write(json.dumps({"goruntu": goruntu, "tablo": tablo, "psnr": psnr, "boyut": boyut}) + "\n")
+
+    def kapat(self):
+        if self._dosya is not None:
+            self._dosya.close()
+            self._dosya = None
+
+
+def trng_tablolari(adet):
+    """
+    Havuzdan (adet, 8, 8) TRNG tablosu (1-99). Entropi alınamazsa None döner; sabit tabloya düşülmez.
+    """
+    # Kaynak frame_sources.kaynak_ac ile BSG_KAYNAK'tan seçilir
+    kaynak = os.environ.get("BSG_KAYNAK", "kamera:0")
+    print(f"\n[SİSTEM] TRNG Kuantalama Tabloları için fiziksel entropi toplanıyor ({kaynak})...")
+    degerler = varsayilan_ornekleyici().randint(1, 100, size=(adet, 8, 8))
+    if degerler is None:
+        print(f"Hata: {varsayilan_havuz().hata or 'Entropi alınamadı.'}")
+    return degerler
+
+
+def _goruntuyu_degerlendir(dosya, tablolar, maks_genislik, goruntu=None):
+    """
+    İşçi süreç: görüntüyü okuyup (önceden çözülmediyse) verilen (N, 8, 8) tabloları puanlar.
+    (psnr listesi, boyut listesi) ya da okunamazsa None döndürür.
+    """
+    if goruntu is None:
+        goruntu = goruntu_yukle(dosya, maks_genislik)
+    if goruntu is None or min(goruntu.shape) < 8:
+        return None
+    psnr, boyut = TabloDegerlendirici(goruntu).degerlendir(tablolar)
+    return psnr.tolist(), boyut.tolist()
+
+
+class SonucYazici:
+    """
+    Sonuç satırlarını geldikçe CSV (.csv) ya da satır satır JSON (diğer uzantılar) olarak yazar.
+    """
+
+    def __init__(self, yol):
+        self._dosya = open(yol, "w", encoding="utf-8", newline="")
+        self._csv = None
+        if yol.lower().endswith(".csv"):
+            self._csv = csv.DictWriter(self._dosya, fieldnames=ALANLAR)
+            self._csv.writeheader()
+
+    def yaz(self, satir):
+        if self._csv is not None:
+            self._csv.writerow(satir)
+        else:
+            self._dosya.write(json.dumps(satir, ensure_ascii=False) + "\n")
+        # Uzun çalıştırmalarda yarım sonuçlar da okunabilsin
+        self._dosya.flush()
+
+    def kapat(self):
+        self._dosya.close()
+
+
+def toplu_calistir(dosyalar, tablolar, tablo_adlari, yazici, onbellek, isci=None, maks_genislik=1024):
+    """
+    Tüm görüntü x tablo çiftlerini değerlendirir. (hesaplanan, önbellekten, hatalı) sayılarını döndürür.
+    """
+    tablolar = np.asarray(tablolar, dtype=float).reshape(-1, 8, 8)
+    ozetler = [tablo_ozeti(t) for t in tablolar]
+    hesaplanan = onbellekten = hatali = 0
+
+    def satir_yaz(dosya, g_ozeti, i, psnr, boyut, onbellekte):
+        yazici.yaz({"dosya": dosya, "goruntu_ozeti": g_ozeti, "tablo": tablo_adlari[i], "tablo_ozeti": ozetler[i],
+                    "psnr": round(psnr, 4), "boyut": boyut, "onbellekten": onbellekte})
+
+    def hazirla(dosya, coz):
+        # Önden okuma thread'inde: dosya özeti, önbellekte olmayan tablolar ve (coz ise) görüntü
+        g_ozeti = dosya_ozeti(dosya, maks_genislik)
+        eksik = [i for i, ozet in enumerate(ozetler) if onbellek.al(g_ozeti, ozet) is None]
+        goruntu = goruntu_yukle(dosya, maks_genislik) if coz and eksik else None
+        return g_ozeti, eksik, goruntu
+
+    def sonuc_isle(dosya, g_ozeti, eksik, sonuc):
+        nonlocal hesaplanan, hatali
+        if sonuc is None:
+            print(f"Hata: {dosya} okunamadı veya resim değil.")
+            hatali += 1
+            return
+        for i, psnr, boyut in zip(eksik, *sonuc):
+            onbellek.ekle(g_ozeti, ozetler[i], psnr, boyut)
+            satir_yaz(dosya, g_ozeti, i, psnr, boyut, False)
+            hesaplanan += 1
+
+    def onbellekten_yaz(dosya, g_ozeti, eksik):
+        nonlocal onbellekten
+        eksik_kume = set(eksik)
+        for i in range(len(ozetler)):
+            if i not in eksik_kume:
+                psnr, boyut = onbellek.al(g_ozeti, ozetler[i])
+                satir_yaz(dosya, g_ozeti, i, psnr, boyut, True)
+                onbellekten += 1
+
+    # Tek işçi: aynı süreçte, sonraki görüntüler arka planda çözülürken DCT ön planda
+    if isci == 1:
+        for dosya, hazir in onden_yukle(dosyalar, hazirla, coz=True):
+            if hazir is None:
+                hatali += 1
+                continue
+            g_ozeti, eksik, goruntu = hazir
+            onbellekten_yaz(dosya, g_ozeti, eksik)
+            if eksik:
+                sonuc = _goruntuyu_degerlendir(dosya, tablolar[eksik], maks_genislik, goruntu)
+                sonuc_isle(dosya, g_ozeti, eksik, sonuc)
+        return hesaplanan, onbellekten, hatali
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=isci) as havuz:
+        # Bekleyen iş sayısı sınırlı: bellek ve ilk sonuca kadar geçen süre dosya sayısına bağlı değil
+        maks_bekleyen = 2 * (isci or os.cpu_count() or 1)
+        isler = {}
+
+        def bitenleri_isle(bitenler):
+            for is_ in bitenler:
+                dosya, g_ozeti, eksik = isler.pop(is_)
+                try:
+                    sonuc = is_.result()
+                except Exception as e:
+                    sonuc = None
+                    print(f"Hata ({dosya}): {e}")
+                sonuc_isle(dosya, g_ozeti, eksik, sonuc)
+
+        # Önbellek anahtarı için dosyalar burada (önden) okunup özetlenir; çözme ve DCT işçide
+        for dosya, hazir in onden_yukle(dosyalar, hazirla, coz=False):
+            if hazir is None:
+                hatali += 1
+                continue
+            g_ozeti, eksik, _ = hazir
+            onbellekten_yaz(dosya, g_ozeti, eksik)
+            if eksik:
+                if len(isler) >= maks_bekleyen:
+                    bitenler, _ = concurrent.futures.wait(isler, return_when=concurrent.futures.FIRST_COMPLETED)
+                    bitenleri_isle(bitenler)
+                is_ = havuz.submit(_goruntuyu_degerlendir, dosya, tablolar[eksik], maks_genislik)
+                isler[is_] = (dosya, g_ozeti, eksik)
+            bitenleri_isle([is_ for is_ in isler if is_.done()])
+
+        bitenleri_isle(concurrent.futures.as_completed(list(isler)))
+
+    return hesaplanan, onbellekten, hatali
+
+
+# --- ÇALIŞTIRMA ---
+if __name__ == "__main__":
+    ayrac = argparse.ArgumentParser(description="Görüntü klasörü üzerinde toplu JPEG / TRNG tablo değerlendirmesi")
+    ayrac.add_argument("kaynak", help="klasör ya da glob deseni (örn. 'veri/**/*.jpg')")
+    ayrac.add_argument("--cikti", default="jpeg_toplu_sonuclari.csv", help=".csv veya .jsonl")
+    ayrac.add_argument("--trng", type=int, default=0, help="üretilecek TRNG tablosu sayısı (kamera gerekir)")
+    ayrac.add_argument("--trng-kayit", default=VARSAYILAN_TRNG_KAYDI,
+                       help="üretilen TRNG tablolarının kaydedileceği .npy (tekrar için --tablolar ile verilir)")
+    ayrac.add_argument("--tablolar", help="TRNG yerine (N, 8, 8) tablo dosyası (.npy)")
+    ayrac.add_argument("--onbellek", default=VARSAYILAN_ONBELLEK, help="sonuç önbelleği ('' = kapalı)")
+    ayrac.add_argument("--isci", type=int, default=None, help="süreç sayısı (varsayılan: çekirdek sayısı)")
+    ayrac.add_argument("--maks-genislik", type=int, default=1024)
+    argumanlar = ayrac.parse_args()
+
+    dosyalar = goruntuleri_bul(argumanlar.kaynak)
+    if not dosyalar:
+        print(f"Hata: {argumanlar.kaynak} içinde görüntü bulunamadı.")
+        sys.exit(1)
+
+    # Tablolar bir kez (ana süreçte) hazırlanır; kamera / havuz işçilerde açılmaz
+    if argumanlar.tablolar:
+        ek_tablolar = np.load(argumanlar.tablolar).reshape(-1, 8, 8)
+        ek_adlar = [f"tablo_{i}" for i in range(len(ek_tablolar))]
+    elif argumanlar.trng > 0:
+        ek_tablolar = trng_tablolari(argumanlar.trng)
+        if ek_tablolar is None:
+            sys.exit(1)
+        ek_adlar = [f"trng_{i}" for i in range(len(ek_tablolar))]
+        if argumanlar.trng_kayit:
+            np.save(argumanlar.trng_kayit, ek_tablolar)
+            print(f"[TOPLU] TRNG tabloları kaydedildi: {argumanlar.trng_kayit} "
+                  f"(aynı tablolarla tekrar için --tablolar {argumanlar.trng_kayit})")
+    else:
+        ek_tablolar, ek_adlar = np.zeros((0, 8, 8)), []
+    tablolar = np.concatenate((standart_tablo[None].astype(float), ek_tablolar))
+    tablo_adlari = ["standart"] + ek_adlar
+
+    print(f"[TOPLU] {len(dosyalar)} görüntü x {len(tablolar)} tablo -> {argumanlar.cikti}")
+    baslangic = time.perf_counter()
+    onbellek = SonucOnbellegi(argumanlar.onbellek)
+    yazici = SonucYazici(argumanlar.cikti)
+    try:
+        hesaplanan, onbellekten, hatali = toplu_calistir(dosyalar, tablolar, tablo_adlari, yazici, onbellek,
+                                                         argumanlar.isci, argumanlar.maks_genislik)
+    finally:
+        yazici.kapat()
+        onbellek.kapat()
+
+    print(f"[TOPLU] Hesaplanan: {hesaplanan}, önbellekten: {onbellekten}, hatalı görüntü: {hatali} "
+          f"({time.perf_counter() - baslangic:.1f} sn)")
@@ -0,0 +1,219 @@
+import heapq
+
+import numpy as np
+
+
+# --- ENTROPİ KODLU BOYUT TAHMİNİ ---
+# jpeg_simule_et'in "Veri Boyutu" sıfır olmayan katsayı sayısıdır; gerçek dosya boyutunu
+# (koşu uzunlukları, büyüklük kategorileri, Huffman kod uzunlukları) yansıtmaz ve tabloları kötü sıralar.
+# Burada tüm kuantalanmış bloklar birlikte zikzak taranır; DC farkları ve AC (koşu, kategori)
+# sembolleri dizi işlemleriyle çıkarılır ve bit maliyetleri toplanır:
+#   huffman="standart" : JPEG Ek K.3 / K.5 parlaklık (luminance) tabloları
+#   huffman="optimal"  : görüntü başına histogramdan kurulan 16 bit sınırlı tablolar (Ek K.2),
+#                        DHT segmentinin baytları da eklenir
+# Sonuç sadece taranan veri (scan) baytıdır; sabit başlıklar (SOI, DQT, SOF ...) dahil değildir.
+# Tek bileşen (gri), yeniden başlatma aralığı yok. 0xFF dolgu baytı ortalama (1/256) olarak eklenir.
+
+# Zikzak sırası: ZIKZAK[k] = k. taranan katsayının 8x8 blok içindeki düz indeksi
+ZIKZAK = np.array(sorted(range(64), key=lambda i: (i // 8 + i % 8,
+                                                   i // 8 if (i // 8 + i % 8) % 2 else i % 8)))
+
+# Ek K.3: parlaklık DC (BITS[1..16], HUFFVAL)
+_DC_BITS = [0, 1, 5, 1, 1, 1, 1, 1, 1, 0, 0, 0, 0, 0, 0, 0]
+_DC_DEGERLER = list(range(12))
+
+# Ek K.5: parlaklık AC
+_AC_BITS = [0, 2, 1, 3, 3, 2, 4, 3, 5, 5, 4, 4, 0, 0, 1, 0x7D]
+_AC_DEGERLER = [
+    0x01, 0x02, 0x03, 0x00, 0x04, 0x11, 0x05, 0x12, 0x21, 0x31, 0x41, 0x06, 0x13, 0x51, 0x61, 0x07,
+    0x22, 0x71, 0x14, 0x32, 0x81, 0x91, 0xA1, 0x08, 0x23, 0x42, 0xB1, 0xC1, 0x15, 0x52, 0xD1, 0xF0,
+    0x24, 0x33, 0x62, 0x72, 0x82, 0x09, 0x0A, 0x16, 0x17, 0x18, 0x19, 0x1A, 0x25, 0x26, 0x27, 0x28,
+    0x29, 0x2A, 0x34, 0x35, 0x36, 0x37, 0x38, 0x39, 0x3A, 0x43, 0x44, 0x45, 0x46, 0x47, 0x48, 0x49,
+    0x4A, 0x53, 0x54, 0x55, 0x56, 0x57, 0x58, 0x59, 0x5A, 0x63, 0x64, 0x65, 0x66, 0x67, 0x68, 0x69,
+    0x6A, 0x73, 0x74, 0x75, 0x76, 0x77, 0x78, 0x79, 0x7A, 0x83, 0x84, 0x85, 0x86, 0x87, 0x88, 0x89,
+    0x8A, 0x92, 0x93, 0x94, 0x95, 0x96, 0x97, 0x98, 0x99, 0x9A, 0xA2, 0xA3, 0xA4, 0xA5, 0xA6, 0xA7,
+    0xA8, 0xA9, 0xAA, 0xB2, 0xB3, 0xB4, 0xB5, 0xB6, 0xB7, 0xB8, 0xB9, 0xBA, 0xC2, 0xC3, 0xC4, 0xC5,
+    0xC6, 0xC7, 0xC8, 0xC9, 0xCA, 0xD2, 0xD3, 0xD4, 0xD5, 0xD6, 0xD7, 0xD8, 0xD9, 0xDA, 0xE1, 0xE2,
+    0xE3, 0xE4, 0xE5, 0xE6, 0xE7, 0xE8, 0xE9, 0xEA, 0xF1, 0xF2, 0xF3, 0xF4, 0xF5, 0xF6, 0xF7, 0xF8,
+    0xF9, 0xFA,
+]
+
+EOB, ZRL = 0x00, 0xF0
+
+# Tabloda olmayan semboller (standart tabloların kapsamı dışındaki kategoriler) için kod uzunluğu
+_EKSIK_UZUNLUK = 16
+
+
+def _uzunluk_tablosu(bits, degerler, boyut):
+    """
+    BITS / HUFFVAL -> sembol başına kod uzunluğu dizisi.
+    """
+    uzunluklar = np.full(boyut, _EKSIK_UZUNLUK, dtype=np.int64)
+    uzunluklar[degerler] = np.repeat(np.arange(1, 17), bits)
+    return uzunluklar
+
+
+STANDART_DC_UZUNLUK = _uzunluk_tablosu(_DC_BITS, _DC_DEGERLER, 16)
+STANDART_AC_UZUNLUK = _uzunluk_tablosu(_AC_BITS, _AC_DEGERLER, 256)
+
+
+def kategori(degerler):
+    """
+    JPEG büyüklük kategorisi (SSSS): |x|'in bit uzunluğu, 0 için 0.
+    """
+    return np.frexp(np.abs(degerler).astype(np.float64))[1]
+
+
+def huffman_uzunluklari(frekanslar, maks_bit=16):
+    """
+    Frekanslardan JPEG uyumlu (maks_bit sınırlı, tüm-birler kodu ayrılmış) kod uzunlukları (Ek K.2).
+    Frekansı 0 olan sembolün uzunluğu 0'dır.
+    """
+    frekanslar = np.asarray(frekanslar)
+    mevcut = [int(s) for s in np.flatnonzero(frekanslar)]
+    uzunluklar = np.zeros(len(frekanslar), dtype=np.int64)
+    if not mevcut:
+        return uzunluklar
+
+    # Ayrılmış kod için frekansı 1 olan sahte sembol (-1) eklenir
+    yigin = [(int(frekanslar[s]), i, [s]) for i, s in enumerate(mevcut)]
+    yigin.append((1, len(yigin), [-1]))
+    heapq.heapify(yigin)
+    derinlik = dict.fromkeys(mevcut + [-1], 0)
+    sayac = len(yigin)
+    while len(yigin) > 1:
+        f1, _, g1 = heapq.heappop(yigin)
+        f2, _, g2 = heapq.heappop(yigin)
+        for s in g1 + g2:
+            derinlik[s] += 1
+        heapq.heappush(yigin, (f1 + f2, sayac, g1 + g2))
+        sayac += 1
+
+    bits = np.bincount(list(derinlik.values()), minlength=2 * maks_bit + 2).tolist()
+    # Ek K.3 (Adjust_BITS): maks_bit'ten uzun kodlar kısaltılır
+    i = len(bits) - 1
+    while i > maks_bit:
+        while bits[i] > 0:
+            j = i - 2
+            while bits[j] == 0:
+                j -= 1
+            bits[i] -= 2
+            bits[i - 1] += 1
+            bits[j + 1] += 2
+            bits[j] -= 1
+        i -= 1
+    while bits[i] == 0:
+        i -= 1
+    # En uzun koddan biri ayrılmış sembolündür
+    bits[i] -= 1
+
+    # Sık mevcut kısa kodları alır
+    sirali = sorted(mevcut, key=lambda s: -int(frekanslar[s]))
+    uzunluklar[sirali] = np.repeat(np.arange(1, maks_bit + 1), bits[1:maks_bit + 1])
+    return uzunluklar
+
+
+def semboller(zikzak):
+    """
+    (T, B, 64) zikzak sıralı, tam sayı kuantalanmış katsayılardan (T tablo / görüntü, her biri
+    B blok, tarama sırasında) Huffman sembollerini çıkarır:
+      dc_kategori : (T, B) DC farkı kategorileri
+      ac_satir    : her AC sembolünün ait olduğu T indeksi
+      ac_sembol   : AC sembolleri (koşu << 4 | kategori, ZRL ve EOB dahil)
+      ek_bit      : (T,) genlik bitlerinin toplamı (DC + AC)
+    """
+    t, b = zikzak.shape[:2]
+
+    # DC: her görüntüde önceki bloğa göre fark (ilk blok 0'a göre)
+    dc = zikzak[..., 0].astype(np.int64)
+    dc_fark = np.diff(dc, axis=1, prepend=0)
+    dc_kategori = kategori(dc_fark)
+
+    # AC: sıfır olmayan katsayılar satır (blok) sırasıyla gelir
+    ac = zikzak[..., 1:].reshape(t * b, 63)
+    blok, konum = np.nonzero(ac)
+    ac_kategori = kategori(ac[blok, konum])
+    ayni_blok = np.concatenate(([False], blok[1:] == blok[:-1]))
+    onceki = np.where(ayni_blok, np.concatenate(([-1], konum[:-1])), -1)
+    kosu = konum - onceki - 1
+
+    # 16'dan uzun koşular ZRL (16 sıfır) sembolleriyle bölünür
+    zrl_sayisi = kosu // 16
+    sembol = ((kosu % 16) << 4) | ac_kategori
+
+    # Son katsayı (63) sıfırsa blok EOB ile biter
+    son_konum = np.full(t * b, -1)
+    son_konum[blok] = konum
+    eob_bloklar = np.flatnonzero(son_konum < 62)
+
+    ac_satir = np.concatenate((blok // b, np.repeat(blok // b, zrl_sayisi), eob_bloklar // b))
+    ac_sembol = np.concatenate((sembol, np.full(int(zrl_sayisi.sum()), ZRL), np.full(eob_bloklar.size, EOB)))
+
+    ek_bit = dc_kategori.sum(axis=1) + np.bincount(blok // b, weights=ac_kategori, minlength=t).astype(np.int64)
+    return dc_kategori, ac_satir, ac_sembol, ek_bit
+
+
+def _dht_bayt(uzunluklar):
+    # DHT segmenti: işaretçi (2) + uzunluk (2) + sınıf/kimlik (1) + BITS (16) + sembol sayısı
+    return 21 + int(np.count_nonzero(uzunluklar))
+
+
+def toplu_entropi_boyutu(kuante_yigini, huffman="standart"):
+    """
+    (T, ..., 8, 8) kuantalanmış blok yığını (örn. aynı görüntünün T tabloyla kuantalanmış hali) için
+    T adet tahmini taranan veri boyutu (bayt) döndürür. Bloklar tarama (satır) sırasında olmalı.
+    """
+    kuante_yigini = np.asarray(kuante_yigini)
+    t = kuante_yigini.shape[0]
+    zikzak = kuante_yigini.reshape(t, -1, 64)[..., ZIKZAK].astype(np.int32)
+    return zikzak_bayt(zikzak, huffman)
+
+
+def zikzak_bayt(zikzak, huffman="standart"):
+    """
+    toplu_entropi_boyutu'nun zikzak sıralı (T, B, 64) tam sayı girişli hali. Katsayılar ve tablolar
+    önceden zikzak sırasına alınırsa (rd_sweep) her tabloda yeniden sıralama yapılmaz.
+    """
+    t = zikzak.shape[0]
+    dc_kategori, ac_satir, ac_sembol, ek_bit = semboller(zikzak)
+
+    if huffman == "standart":
+        bit = (STANDART_DC_UZUNLUK[np.minimum(dc_kategori, 15)].sum(axis=1)
+               + np.bincount(ac_satir, weights=STANDART_AC_UZUNLUK[ac_sembol], minlength=t).astype(np.int64))
+        dht = np.zeros(t, dtype=np.int64)
+    elif huffman == "optimal":
+        dc_hist = np.apply_along_axis(np.bincount, 1, dc_kategori, minlength=16)
+        ac_hist = np.bincount(ac_satir * 256 + ac_sembol, minlength=t * 256).reshape(t, 256)
+        bit = np.empty(t, dtype=np.int64)
+        dht = np.empty(t, dtype=np.int64)
+        for i in range(t):
+            dc_uzunluk = huffman_uzunluklari(dc_hist[i])
+            ac_uzunluk = huffman_uzunluklari(ac_hist[i])
+            bit[i] = dc_hist[i] @ dc_uzunluk + ac_hist[i] @ ac_uzunluk
+            dht[i] = _dht_bayt(dc_uzunluk) + _dht_bayt(ac_uzunluk)
+    else:
+        raise ValueError(f"Bilinmeyen Huffman tablosu: {huffman}")
+
+    bayt = (bit + ek_bit + 7) // 8
+    # 0xFF dolgu baytları (ortalama)
+    return bayt + bayt // 256 + dht
+
+
+def entropi_boyutu(kuante_bloklar, huffman="standart"):
+    """
+    Tek görüntünün kuantalanmış blokları ((B, 8, 8) ya da (H/8, W/8, 8, 8)) için tahmini bayt.
+    """
+    return int(toplu_entropi_boyutu(np.asarray(kuante_bloklar)[None], huffman)[0])
+
+
+def goruntu_boyutu_tahmini(goruntu, kuantalama_tablosu, huffman="standart"):
+    """
+    jpeg_simule_et ile aynı blok DCT ve kuantalama üzerinden tahmini taranan veri boyutu (bayt).
+    """
+    from JPEG_with_RNG import blok_dct, bloklara_bol
+
+    h, w = goruntu.shape
+    h = (h // 8) * 8
+    w = (w // 8) * 8
+    katsayilar = blok_dct(bloklara_bol(goruntu[:h, :w].astype(float)) - 128)
+    return entropi_boyutu(np.round(katsayilar / kuantalama_tablosu), huffman)
@@ -0,0 +1,102 @@
+import argparse
+import concurrent.futures
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+from JPEG_with_RNG import bant_sikistir, standart_tablo, trng_tablo_uretici
+
+
+# --- BELLEKTEN BÜYÜK GÖRÜNTÜLER İÇİN ŞERİTLİ SIKIŞTIRMA ---
+# jpeg_simule_et tüm görüntüyü tek dizi olarak ister, goruntu_kaynagi_al ise genişliği 1024'e
+# küçültür. Burada giriş .npy (ya da ham uint8) dosyası memmap ile açılır, 8 piksele hizalı yatay
+# şeritler thread havuzunda sıkıştırılır (NumPy / scipy.fft GIL'i bırakır) ve geri çatılan görüntü
+# memmap'li çıktı dosyasına yazılır. Bellekte aynı anda sadece işçi başına birkaç şerit bulunur.
+# Katsayı sayısı ve PSNR, bellek içi jpeg_simule_et + psnr_hesapla ile aynı şekilde hesaplanır
+# (float64: katsayı sayısı birebir, PSNR toplama sırası kadar, ~1e-12).
+def goruntu_ac(yol, sekil=None):
+    """
+    .npy dosyasını ya da ham uint8 dosyasını (sekil=(yukseklik, genislik) gerekli) salt okunur memmap açar.
+    """
+    if yol.lower().endswith(".npy"):
+        goruntu = np.load(yol, mmap_mode="r")
+    else:
+        if sekil is None:
+            raise ValueError("Ham dosya için sekil=(yukseklik, genislik) verilmeli")
+        goruntu = np.memmap(yol, dtype=np.uint8, mode="r", shape=tuple(sekil))
+    if goruntu.ndim != 2 or goruntu.dtype != np.uint8:
+        raise ValueError(f"Gri (2 boyutlu) uint8 görüntü bekleniyor: {goruntu.shape} {goruntu.dtype}")
+    return goruntu
+
+
+def cikti_olustur(yol, sekil):
+    """
+    Geri çatılan görüntü için yazılabilir memmap (.npy ise başlıklı, değilse ham uint8).
+    """
+    if yol.lower().endswith(".npy"):
+        return np.lib.format.open_memmap(yol, mode="w+", dtype=np.uint8, shape=sekil)
+    return np.memmap(yol, dtype=np.uint8, mode="w+", shape=sekil)
+
+
+def jpeg_seritli(goruntu, kuantalama_tablosu, cikti=None, serit_blok=64, isci=None, dtype=np.float64):
+    """
+    Görüntüyü 8*serit_blok satırlık şeritler halinde paralel sıkıştırır.
+    goruntu : (H, W) uint8 dizi ya da memmap
+    cikti   : None veya (H//8*8, W//8*8) uint8 yazılabilir dizi / memmap
+    (sıfır olmayan katsayı sayısı, PSNR) döndürür.
+    """
+    h, w = goruntu.shape
+    h = (h // 8) * 8
+    w = (w // 8) * 8
+    if cikti is not None and cikti.shape != (h, w):
+        raise ValueError(f"Çıktı boyutu {(h, w)} olmalı")
+    tablo = np.asarray(kuantalama_tablosu, dtype=dtype)
+
+    def serit_isle(i):
+        son = min(i + 8 * serit_blok, h)
+        return bant_sikistir(goruntu[i:son, :w], tablo, None if cikti is None else cikti[i:son])
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=isci or os.cpu_count()) as havuz:
+        sonuclar = list(havuz.map(serit_isle, range(0, h, 8 * serit_blok)))
+
+    if isinstance(cikti, np.memmap):
+        cikti.flush()
+
+    sifir_olmayan_katsayi = sum(int(k) for k, _ in sonuclar)
+    mse = math.fsum(hata for _, hata in sonuclar) / (h * w)
+    psnr = 100 if mse == 0 else 20 * np.log10(255.0 / np.sqrt(mse))
+    return sifir_olmayan_katsayi, psnr
+
+
+# --- ÇALIŞTIRMA ---
+if __name__ == "__main__":
+    ayrac = argparse.ArgumentParser(description="Bellekten büyük görüntülerde şeritli JPEG simülasyonu")
+    ayrac.add_argument("giris", help=".npy ya da ham uint8 gri görüntü")
+    ayrac.add_argument("--sekil", help="ham dosya için YUKSEKLIKxGENISLIK (örn. 40000x30000)")
+    ayrac.add_argument("--cikti", help="geri çatılan görüntü (.npy ya da ham); verilmezse sadece ölçülür")
+    ayrac.add_argument("--trng", action="store_true", help="standart tablo yerine TRNG tablosu")
+    ayrac.add_argument("--serit-blok", type=int, default=64, help="şerit başına 8 piksellik blok satırı")
+    ayrac.add_argument("--isci", type=int, default=None)
+    argumanlar = ayrac.parse_args()
+
+    sekil = tuple(int(x) for x in argumanlar.sekil.lower().split("x")) if argumanlar.sekil else None
+    try:
+        goruntu = goruntu_ac(argumanlar.giris, sekil)
+    except (OSError, ValueError) as e:
+        print(f"Hata: {e}")
+        sys.exit(1)
+
+    tablo = trng_tablo_uretici() if argumanlar.trng else standart_tablo
+    h, w = (goruntu.shape[0] // 8) * 8, (goruntu.shape[1] // 8) * 8
+    cikti = cikti_olustur(argumanlar.cikti, (h, w)) if argumanlar.cikti else None
+
+    print(f"[ŞERİTLİ] {goruntu.shape[1]}x{goruntu.shape[0]} görüntü, {8 * argumanlar.serit_blok} satırlık şeritler")
+    baslangic = time.perf_counter()
+    boyut, psnr = jpeg_seritli(goruntu, tablo, cikti, argumanlar.serit_blok, argumanlar.isci)
+
+    print(f"-> Kalite (PSNR): {psnr:.2f} dB  (Yüksek değer = Daha İyi Görüntü Kalitesi)")
+    print(f"-> Veri Boyutu  : {boyut}       (Düşük değer = Daha İyi Sıkıştırma/Daha Küçük Dosya)")
+    print(f"-> Süre         : {time.perf_counter() - baslangic:.2f} sn")
@@ -0,0 +1,286 @@
+import cProfile
+import io
+import os
+import pstats
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+# --- METRİKLER (Prometheus metin formatı + Python istatistik nesnesi) ---
+# Verimlilik, bit dengesi, süre gibi sayılar sadece çalıştırma sonundaki print satırlarındaydı.
+# Bu modül aşama başına sayaç ve gecikme histogramları tutar; dışa aktarım:
+#   - prometheus_metni()     : Prometheus text exposition formatı
+#   - dosyaya_yaz(yol)       : node_exporter textfile toplayıcısı için (atomik yazım)
+#   - http_sunucusu(port)    : /metrics uç noktası
+#   - istatistikler()        : düz Python sözlüğü
+# Kapalıyken (varsayılan) her çağrı tek bir bayrak kontrolüyle döner. BSG_METRIK=1 ile ya da
+# etkinlestir() ile açılır; etkinlestir(profil=True) her aşamayı ayrıca cProfile ile sarar.
+_etkin = os.environ.get("BSG_METRIK", "") not in ("", "0")
+_profil = False
+_profiller = {}
+_kilit = threading.Lock()
+
+VARSAYILAN_SINIRLAR = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+
+def etkin():
+    return _etkin
+
+
+def etkinlestir(acik=True, profil=False):
+    global _etkin, _profil
+    _etkin = acik
+    _profil = acik and profil
+
+
+def _etiket_metni(adlar, degerler):
+    if not adlar:
+        return ""
+    return "{" + ",".join(f'{a}="{d}"' for a, d in zip(adlar, degerler)) + "}"
+
+
+class _Metrik:
+    tur = None
+
+    def __init__(self, ad, aciklama, etiketler=()):
+        self.ad = ad
+        self.aciklama = aciklama
+        self.etiketler = tuple(etiketler)
+        self._degerler = {}
+
+    def _anahtar(self, etiketler):
+        return tuple(str(etiketler.get(a, "")) for a in self.etiketler)
+
+    def sifirla(self):
+        with _kilit:
+            self._degerler.clear()
+
+
+class Sayac(_Metrik):
+    """
+    Sadece artan sayaç (Prometheus counter).
+    """
+    tur = "counter"
+
+    def ekle(self, n=1, **etiketler):
+        if not _etkin:
+            return
+        anahtar = self._anahtar(etiketler)
+        with _kilit:
+            self._degerler[anahtar] = self._degerler.get(anahtar, 0) + n
+
+    def deger(self, **etiketler):
+        return self._degerler.get(self._anahtar(etiketler), 0)
+
+    def satirlar(self):
+        return [f"{self.ad}{_etiket_metni(self.etiketler, a)} {d}" for a, d in sorted(self._degerler.items())]
+
+    def sozluk(self):
+        return {",".join(a) or "": d for a, d in self._degerler.items()}
+
+
+class Gosterge(Sayac):
+    """
+    Anlık değer (Prometheus gauge), örn. havuz doluluğu.
+    """
+    tur = "gauge"
+
+    def ayarla(self, deger, **etiketler):
+        if not _etkin:
+            return
+        anahtar = self._anahtar(etiketler)
+        with _kilit:
+            self._degerler[anahtar] = deger
+
+
+class Histogram(_Metrik):
+    """
+    Gecikme histogramı (Prometheus histogram): kova sayıları, toplam ve adet.
+    """
+    tur = "histogram"
+
+    def __init__(self, ad, aciklama, etiketler=(), sinirlar=VARSAYILAN_SINIRLAR):
+        super().__init__(ad, aciklama, etiketler)
+        self.sinirlar = tuple(sinirlar)
+
+    def gozlemle(self, deger, **etiketler):
+        if not _etkin:
+            return
+        anahtar = self._anahtar(etiketler)
+        with _kilit:
+            kayit = self._degerler.get(anahtar)
+            if kayit is None:
+                kayit = self._degerler[anahtar] = [[0] * len(self.sinirlar), 0.0, 0]
+            for i, sinir in enumerate(self.sinirlar):
+                if deger <= sinir:
+                    kayit[0][i] += 1
+                    break
+            kayit[1] += deger
+            kayit[2] += 1
+
+    def satirlar(self):
+        satirlar = []
+        for anahtar, (kovalar, toplam, adet) in sorted(self._degerler.items()):
+            birikimli = 0
+            for sinir, sayi in zip(self.sinirlar, kovalar):
+                birikimli += sayi
+                etiket = _etiket_metni(self.etiketler + ("le",), anahtar + (repr(sinir),))
+                satirlar.append(f"{self.ad}_bucket{etiket} {birikimli}")
+            etiket = _etiket_metni(self.etiketler + ("le",), anahtar + ("+Inf",))
+            satirlar.append(f"{self.ad}_bucket{etiket} {adet}")
+            satirlar.append(f"{self.ad}_sum{_etiket_metni(self.etiketler, anahtar)} {toplam}")
+            satirlar.append(f"{self.ad}_count{_etiket_metni(self.etiketler, anahtar)} {adet}")
+        return satirlar
+
+    def sozluk(self):
+        return {",".join(a) or "": {"adet": adet, "toplam_s": toplam,
+                                   "ortalama_s": toplam / adet if adet else 0.0}
+                for a, (_, toplam, adet) in self._degerler.items()}
+
+
+# --- KAYIT DEFTERİ ---
+_metrikler = {}
+
+
+def _kaydet(metrik):
+    return _metrikler.setdefault(metrik.ad, metrik)
+
+
+def sayac(ad, aciklama, etiketler=()):
+    return _kaydet(Sayac(ad, aciklama, etiketler))
+
+
+def gosterge(ad, aciklama, etiketler=()):
+    return _kaydet(Gosterge(ad, aciklama, etiketler))
+
+
+def histogram(ad, aciklama, etiketler=(), sinirlar=VARSAYILAN_SINIRLAR):
+    return _kaydet(Histogram(ad, aciklama, etiketler, sinirlar))
+
+
+# Hattın ortak metrikleri
+ASAMA_SURESI = histogram("bsg_asama_sure_saniye", "Aşama başına gecikme", ("asama",))
+ASAMA_CAGRI = sayac("bsg_asama_cagri_toplam", "Aşama çağrı sayısı", ("asama",))
+KARE = sayac("bsg_kare_toplam", "İşlenen kare sayısı")
+ATILAN_KARE = sayac("bsg_atilan_kare_toplam", "Sağlık testinde atılan kare sayısı")
+HAM_BIT = sayac("bsg_ham_bit_toplam", "Collatz'dan çıkan ham bit sayısı")
+TEMIZ_BIT = sayac("bsg_temiz_bit_toplam", "Ekstraktörden çıkan temiz bit sayısı")
+TEMIZ_BIR = sayac("bsg_temiz_bir_toplam", "Temiz bitlerden 1 olanların sayısı (bit dengesi)")
+ATILAN_BIT = sayac("bsg_atilan_bit_toplam", "Havuz dolu olduğu için atılan temiz bit sayısı")
+OKUNAN_BIT = sayac("bsg_okunan_bit_toplam", "Tüketicilere verilen bit sayısı")
+SAGLIK_HATASI = sayac("bsg_saglik_hatasi_toplam", "Sağlık testi hataları", ("test",))
+HAVUZ_DOLULUK = gosterge("bsg_havuz_doluluk_bit", "Havuzdaki temiz bit sayısı")
+HAVUZ_KAPASITE = gosterge("bsg_havuz_kapasite_bit", "Havuz kapasitesi (bit)")
+
+
+_BOS = nullcontext()
+
+
+def asama(ad):
+    """
+    Bir aşamayı zamanlar (ve profil açıksa cProfile ile sarar):
+        with metrics.asama("collatz"):
+            ...
+    Kapalıyken paylaşılan boş bağlam yöneticisini döndürür.
+    """
+    if not _etkin:
+        return _BOS
+    return _asama(ad)
+
+
+@contextmanager
+def _asama(ad):
+    profil = None
+    if _profil:
+        with _kilit:
+            profil = _profiller.setdefault(ad, cProfile.Profile())
+        try:
+            profil.enable()
+        except ValueError:
+            # Başka bir profil zaten açık (iç içe aşama ya da başka thread); sadece zamanla
+            profil = None
+
+    baslangic = time.perf_counter()
+    try:
+        yield
+    finally:
+        sure = time.perf_counter() - baslangic
+        if profil is not None:
+            profil.disable()
+        ASAMA_SURESI.gozlemle(sure, asama=ad)
+        ASAMA_CAGRI.ekle(asama=ad)
+
+
+def profil_raporu(ad=None, satir=20, siralama="cumulative"):
+    """
+    cProfile sonuçlarını metin olarak döndürür (ad=None: tüm aşamalar).
+    """
+    cikti = io.StringIO()
+    for asama_adi, profil in sorted(_profiller.items()):
+        if ad is not None and asama_adi != ad:
+            continue
+        cikti.write(f"\n=== {asama_adi} ===\n")
+        pstats.Stats(profil, stream=cikti).sort_stats(siralama).print_stats(satir)
+    return cikti.getvalue()
+
+
+# --- DIŞA AKTARIM ---
+def prometheus_metni():
+    satirlar = []
+    with _kilit:
+        for metrik in _metrikler.values():
+            satirlar.append(f"# HELP {metrik.ad} {metrik.aciklama}")
+            satirlar.append(f"# TYPE {metrik.ad} {metrik.tur}")
+            satirlar.extend(metrik.satirlar())
+    return "\n".join(satirlar) + "\n"
+
+
+def istatistikler():
+    """
+    Tüm metrikler ve türetilmiş oranlar (verimlilik, atılan kare oranı) sözlük olarak.
+    """
+    with _kilit:
+        sonuc = {ad: metrik.sozluk() for ad, metrik in _metrikler.items()}
+    ham, temiz = HAM_BIT.deger(), TEMIZ_BIT.deger()
+    kare, atilan = KARE.deger(), ATILAN_KARE.deger()
+    sonuc["verimlilik"] = temiz / ham if ham else 0.0
+    sonuc["bit_dengesi"] = TEMIZ_BIR.deger() / temiz if temiz else 0.0
+    sonuc["atilan_kare_orani"] = atilan / (kare + atilan) if kare + atilan else 0.0
+    return sonuc
+
+
+def dosyaya_yaz(yol):
+    # Yarım yazılmış dosya okunmasın diye önce geçici dosyaya yazılıp taşınır
+    gecici = f"{yol}.{os.getpid()}.tmp"
+    with open(gecici, "w", encoding="utf-8") as f:
+        f.write(prometheus_metni())
+    os.replace(gecici, yol)
+
+
+class _MetrikIstegi(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        govde = prometheus_metni().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(govde)))
+        self.end_headers()
+        self.wfile.write(govde)
+
+    def log_message(self, *args):
+        pass
+
+
+def http_sunucusu(port=9477, host="127.0.0.1"):
+    """
+    /metrics uç noktasını arka plan thread'inde sunar; sunucu nesnesini döndürür (shutdown() ile kapanır).
+    Metrikler kapalıysa açar.
+    """
+    etkinlestir(True, _profil)
+    sunucu = ThreadingHTTPServer((host, port), _MetrikIstegi)
+    threading.Thread(target=sunucu.serve_forever, name="bsg-metrik", daemon=True).start()
+    return sunucu
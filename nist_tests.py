@@ -0,0 +1,330 @@
+import sys
+
+import numpy as np
+from scipy.special import erfc, gammaincc, ndtr
+
+ALFA = 0.01  # NIST SP 800-22 önerilen anlamlılık düzeyi
+
+# En uzun birler koşusu testi: blok boyu M -> (sınıf sınırları, olasılıklar)  [SP 800-22, 2.4.4]
+_UZUN_KOSU_TABLOLARI = {
+    8: (1, 4, [0.2148, 0.3672, 0.2305, 0.1875]),
+    128: (4, 9, [0.1174, 0.2430, 0.2493, 0.1752, 0.1027, 0.1124]),
+    10000: (10, 16, [0.0882, 0.2092, 0.2483, 0.1933, 0.1208, 0.0675, 0.0727]),
+}
+
+
+def _bloklara_ayir(kalan, bitler, m):
+    """
+    Önceki parçadan kalan bitlerle yenilerini birleştirip (N, m) tam bloklara böler.
+    (bloklar, yeni kalan) döndürür.
+    """
+    tum = np.concatenate((kalan, bitler)) if kalan.size else bitler
+    tam = (tum.size // m) * m
+    return tum[:tam].reshape(-1, m), tum[tam:]
+
+
+def _en_uzun_birler(bloklar):
+    """
+    (N, M) 0/1 bloklarının her birindeki en uzun kesintisiz 1 koşusu.
+    """
+    sira = np.arange(1, bloklar.shape[1] + 1, dtype=np.int32)
+    son_sifir = np.maximum.accumulate(np.where(bloklar == 0, sira, 0), axis=1)
+    return (sira - son_sifir).max(axis=1)
+
+
+def _desen_say(bitler, k):
+    """
+    Örtüşen tüm k bitlik desenlerin sayıları (uzunluk 2^k).
+    """
+    adet = bitler.size - k + 1
+    degerler = np.zeros(adet, dtype=np.int64)
+    for j in range(k):
+        degerler = (degerler << 1) | bitler[j:j + adet]
+    return np.bincount(degerler, minlength=1 << k)
+
+
+class NistBataryasi:
+    """
+    SP 800-22 çekirdek testlerini akış (stream) halinde çalıştırır.
+    Bitler parça parça ekle() ile verilir; her test sadece küçük bir durum taşır,
+    bu yüzden gigabitlik akışlar sınırlı bellekle doğrulanabilir.
+
+    Testler: frekans, blok frekans, koşular, en uzun koşu, FFT spektral,
+    seri, yaklaşık entropi, kümülatif toplamlar.
+    """
+
+    def __init__(self, blok_frekans_m=128, uzun_kosu_m=10000, fft_blok=1 << 16,
+                 seri_m=16, apen_m=10, parca_bit=1 << 22):
+        if uzun_kosu_m not in _UZUN_KOSU_TABLOLARI:
+            raise ValueError("uzun_kosu_m 8, 128 veya 10000 olmalı")
+
+        self.blok_frekans_m = blok_frekans_m
+        self.uzun_kosu_m = uzun_kosu_m
+        self.fft_blok = fft_blok
+        self.seri_m = seri_m
+        self.apen_m = apen_m
+        self.parca_bit = parca_bit
+
+        bos = np.zeros(0, dtype=np.uint8)
+        self.n = 0
+        self._birler = 0
+
+        # Koşular
+        self._gecis = 0
+        self._son_bit = None
+
+        # Blok frekans
+        self._bf_kalan = bos
+        self._bf_ki_kare = 0.0
+        self._bf_blok = 0
+
+        # En uzun koşu
+        alt, ust, _ = _UZUN_KOSU_TABLOLARI[uzun_kosu_m]
+        self._uk_kalan = bos
+        self._uk_sayac = np.zeros(ust - alt + 1, dtype=np.int64)
+
+        # FFT spektral (bloklar ayrı ayrı dönüştürülür, N1 ve beklenen değer toplanır)
+        self._fft_kalan = bos
+        self._fft_n1 = 0
+        self._fft_bit = 0
+
+        # Seri ve yaklaşık entropi: tek bir k-bit desen histogramı yeter
+        self._k = max(seri_m, apen_m + 1)
+        self._desenler = np.zeros(1 << self._k, dtype=np.int64)
+        self._bas = bos
+        self._kuyruk = bos
+
+        # Kümülatif toplamlar: S_k = Σ(2ε - 1)
+        self._S = 0
+        self._S_max = 0
+        self._S_min = 0
+        self._ileri_z = 0
+
+    # --- VERİ EKLEME ---
+    def ekle(self, paketli, bit_sayisi=None):
+        """
+        Paketlenmiş (np.packbits, MSB önce) bitleri ekler.
+        """
+        paketli = np.asarray(paketli, dtype=np.uint8).ravel()
+        if bit_sayisi is None:
+            bit_sayisi = paketli.size * 8
+
+        parca_bayt = max(1, self.parca_bit // 8)
+        for bas in range(0, (bit_sayisi + 7) // 8, parca_bayt):
+            parca_bit = min(parca_bayt * 8, bit_sayisi - bas * 8)
+            self._isle(np.unpackbits(paketli[bas:bas + parca_bayt], count=parca_bit))
+        return self
+
+    def ekle_bitler(self, bitler):
+        """
+        Paketlenmemiş 0/1 bit dizisini ekler.
+        """
+        bitler = np.asarray(bitler, dtype=np.uint8).ravel()
+        for bas in range(0, bitler.size, self.parca_bit):
+            self._isle(bitler[bas:bas + self.parca_bit])
+        return self
+
+    def _isle(self, b):
+        if b.size == 0:
+            return
+
+        self.n += b.size
+        self._birler += int(np.count_nonzero(b))
+
+        # Koşular: komşu bitlerin farklı olduğu yerler (parça sınırı dahil)
+        self._gecis += int(np.count_nonzero(b[1:] != b[:-1]))
+        if self._son_bit is not None and self._son_bit != b[0]:
+            self._gecis += 1
+        self._son_bit = b[-1]
+
+        # Blok frekans
+        bloklar, self._bf_kalan = _bloklara_ayir(self._bf_kalan, b, self.blok_frekans_m)
+        if len(bloklar):
+            oran = bloklar.mean(axis=1)
+            self._bf_ki_kare += 4.0 * self.blok_frekans_m * float(np.sum((oran - 0.5) ** 2))
+            self._bf_blok += len(bloklar)
+
+        # En uzun koşu
+        bloklar, self._uk_kalan = _bloklara_ayir(self._uk_kalan, b, self.uzun_kosu_m)
+        if len(bloklar):
+            alt, ust, _ = _UZUN_KOSU_TABLOLARI[self.uzun_kosu_m]
+            sinif = np.clip(_en_uzun_birler(bloklar), alt, ust) - alt
+            self._uk_sayac += np.bincount(sinif, minlength=self._uk_sayac.size)
+
+        # FFT spektral
+        bloklar, self._fft_kalan = _bloklara_ayir(self._fft_kalan, b, self.fft_blok)
+        if len(bloklar):
+            n = self.fft_blok
+            genlik = np.abs(np.fft.rfft(2.0 * bloklar - 1.0, axis=1)[:, :n // 2])
+            esik = np.sqrt(np.log(1 / 0.05) * n)
+            self._fft_n1 += int(np.count_nonzero(genlik < esik))
+            self._fft_bit += bloklar.size
+
+        # Desen sayımı (önceki parçanın son k-1 biti ile birleştirerek)
+        k = self._k
+        if self._bas.size < k - 1:
+            self._bas = np.concatenate((self._bas, b[:k - 1 - self._bas.size]))
+        dizi = np.concatenate((self._kuyruk, b))
+        if dizi.size >= k:
+            self._desenler += _desen_say(dizi, k)
+        self._kuyruk = dizi[-(k - 1):]
+
+        # Kümülatif toplamlar
+        kismi = self._S + np.cumsum(2 * b.astype(np.int64) - 1)
+        onceki = np.concatenate(([self._S], kismi[:-1]))  # S_0 ... S_{n-1}
+        self._ileri_z = max(self._ileri_z, int(np.abs(kismi).max()))
+        self._S_max = max(self._S_max, int(onceki.max()))
+        self._S_min = min(self._S_min, int(onceki.min()))
+        self._S = int(kismi[-1])
+
+    # --- SONUÇLAR ---
+    def _dairesel_desenler(self):
+        # Dizinin sonuna ilk k-1 biti ekleyerek (dairesel) kalan desenleri say
+        k = self._k
+        ek = np.concatenate((self._kuyruk, self._bas))
+        desenler = self._desenler.copy()
+        if ek.size >= k:
+            desenler += _desen_say(ek, k)
+        return desenler
+
+    def _psi_kare(self, desenler, m):
+        if m <= 0:
+            return 0.0
+        nu = desenler.reshape(1 << m, -1).sum(axis=1)
+        return (1 << m) / self.n * float(np.sum(nu.astype(float) ** 2)) - self.n
+
+    def _phi(self, desenler, m):
+        if m <= 0:
+            return 0.0
+        nu = desenler.reshape(1 << m, -1).sum(axis=1)
+        pi = nu[nu > 0] / self.n
+        return float(np.sum(pi * np.log(pi)))
+
+    def sonuclar(self):
+        """
+        Test adı -> p-değeri sözlüğü. Seri ve kümülatif toplam testleri iki p-değeri verir.
+        Yeterli veri olmayan testler None döner.
+        """
+        n = self.n
+        if n == 0:
+            return {}
+        p = {}
+
+        # 1. Frekans (Monobit)
+        s = 2 * self._birler - n
+        p["frekans"] = float(erfc(abs(s) / np.sqrt(2 * n)))
+
+        # 2. Blok frekans
+        if self._bf_blok:
+            p["blok_frekans"] = float(gammaincc(self._bf_blok / 2, self._bf_ki_kare / 2))
+        else:
+            p["blok_frekans"] = None
+
+        # 3. Koşular
+        pi = self._birler / n
+        if abs(pi - 0.5) >= 2 / np.sqrt(n):
+            p["kosular"] = 0.0
+        else:
+            v = self._gecis + 1
+            p["kosular"] = float(erfc(abs(v - 2 * n * pi * (1 - pi)) / (2 * np.sqrt(2 * n) * pi * (1 - pi))))
+
+        # 4. En uzun koşu
+        blok_sayisi = int(self._uk_sayac.sum())
+        if blok_sayisi:
+            _, _, olasilik = _UZUN_KOSU_TABLOLARI[self.uzun_kosu_m]
+            beklenen = blok_sayisi * np.array(olasilik)
+            ki_kare = float(np.sum((self._uk_sayac - beklenen) ** 2 / beklenen))
+            p["en_uzun_kosu"] = float(gammaincc((len(olasilik) - 1) / 2, ki_kare / 2))
+        else:
+            p["en_uzun_kosu"] = None
+
+        # 5. FFT spektral (tüm bloklar birlikte)
+        if self._fft_bit:
+            n0 = 0.95 * self._fft_bit / 2
+            d = (self._fft_n1 - n0) / np.sqrt(self._fft_bit * 0.95 * 0.05 / 4)
+            p["fft"] = float(erfc(abs(d) / np.sqrt(2)))
+        else:
+            p["fft"] = None
+
+        # 6-7. Seri ve yaklaşık entropi
+        if n >= self._k:
+            desenler = self._dairesel_desenler()
+            m = self.seri_m
+            psi_m, psi_m1, psi_m2 = (self._psi_kare(desenler, m - i) for i in range(3))
+            p["seri"] = (float(gammaincc(2 ** (m - 2), (psi_m - psi_m1) / 2)),
+                         float(gammaincc(2 ** (m - 3), (psi_m - 2 * psi_m1 + psi_m2) / 2)))
+
+            m = self.apen_m
+            apen = self._phi(desenler, m) - self._phi(desenler, m + 1)
+            ki_kare = 2 * n * (np.log(2) - apen)
+            p["yaklasik_entropi"] = float(gammaincc(2 ** (m - 1), ki_kare / 2))
+        else:
+            p["seri"] = None
+            p["yaklasik_entropi"] = None
+
+        # 8. Kümülatif toplamlar (ileri, geri)
+        geri_z = max(self._S - self._S_min, self._S_max - self._S)
+        p["kumulatif_toplam"] = (_kumulatif_p(n, self._ileri_z), _kumulatif_p(n, geri_z))
+
+        return p
+
+
+def _kumulatif_p(n, z):
+    if z == 0:
+        return 1.0
+    kok_n = np.sqrt(n)
+    k1 = np.arange(int((-n / z + 1) / 4), int((n / z - 1) / 4) + 1)
+    k2 = np.arange(int((-n / z - 3) / 4), int((n / z - 1) / 4) + 1)
+    toplam1 = np.sum(ndtr((4 * k1 + 1) * z / kok_n) - ndtr((4 * k1 - 1) * z / kok_n))
+    toplam2 = np.sum(ndtr((4 * k2 + 3) * z / kok_n) - ndtr((4 * k2 + 1) * z / kok_n))
+    return float(1.0 - toplam1 + toplam2)
+
+
+def nist_testleri(paketli, bit_sayisi=None, **ayarlar):
+    """
+    Tek seferlik kullanım: paketlenmiş bitleri test edip p-değerlerini döndürür.
+    """
+    return NistBataryasi(**ayarlar).ekle(paketli, bit_sayisi).sonuclar()
+
+
+def rapor(sonuclar, alfa=ALFA):
+    print("=" * 50)
+    print("NIST SP 800-22 TEST RAPORU")
+    print("=" * 50)
+    for ad, deger in sonuclar.items():
+        if deger is None:
+            print(f"- {ad:<18}: (yetersiz veri)")
+            continue
+        degerler = deger if isinstance(deger, tuple) else (deger,)
+        durum = "✅" if all(d >= alfa for d in degerler) else "❌"
+        metin = ", ".join(f"{d:.4f}" for d in degerler)
+        print(f"- {ad:<18}: p = {metin}  {durum}")
+    print("=" * 50)
+
+
+# --- ÇALIŞTIRMA ---
+if __name__ == "__main__":
+    from entropy_pool import varsayilan_havuz
+
+    # Havuzdan bit_sayisi temiz bit alıp parça parça test et
+    bit_sayisi = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    parca = 1 << 20
+
+    havuz = varsayilan_havuz()
+    if len(sys.argv) > 2 and sys.argv[2] == "drbg":
+        # Kamera tohumlu HMAC-DRBG çıktısını test et (drbg.py)
+        from drbg import DrbgUreteci
+        havuz = DrbgUreteci(havuz)
+    batarya = NistBataryasi()
+    alinan = 0
+    while alinan < bit_sayisi:
+        bitler = havuz.read_bits(min(parca, bit_sayisi - alinan))
+        if bitler is None:
+            print(f"Hata: {havuz.hata or 'Entropi alınamadı.'}")
+            break
+        batarya.ekle_bitler(bitler)
+        alinan += bitler.size
+        print(".", end="", flush=True)
+
+    print(f"\nTest edilen bit: {batarya.n}")
+    rapor(batarya.sonuclar())
@@ -0,0 +1,118 @@
+import sys
+
+import cv2
+import numpy as np
+
+from JPEG_with_RNG import blok_dct, bloklara_bol, standart_tablo, trng_tablo_uretici
+from jpeg_size import ZIKZAK, zikzak_bayt
+
+
+# 8x8 ortonormal DCT-II matrisi: dct2(B) = D @ B @ D.T, idct2(C) = D.T @ C @ D
+# Tablo yığınının geri çatılmasında matmul, scipy.fft'ten birkaç kat hızlıdır (fark ~1e-12 mertebesinde).
+def _dct_matrisi(n=8):
+    k = np.arange(n)[:, None]
+    x = np.arange(n)[None, :]
+    matris = np.cos(np.pi * (2 * x + 1) * k / (2 * n)) * np.sqrt(2 / n)
+    matris[0] /= np.sqrt(2)
+    return matris
+
+
+DCT_MATRISI = _dct_matrisi()
+
+
+# --- ORAN-BOZULMA (RATE-DISTORTION) TARAMA MOTORU ---
+# Farklı kuantalama tablolarını karşılaştırırken sadece kuantalama adımı değişir;
+# blok DCT katsayıları görüntü başına bir kez hesaplanıp saklanır.
+class TabloDegerlendirici:
+    """
+    Bir görüntünün blok DCT katsayılarını önbelleğe alır ve (N, 8, 8) tablo yığınlarını
+    toplu halde kuantalar, geri çatar ve puanlar.
+    Sonuçlar jpeg_simule_et + psnr_hesapla ile aynıdır.
+    """
+
+    def __init__(self, goruntu, bellek_siniri=256 * 1024 * 1024):
+        h, w = goruntu.shape
+        h = (h // 8) * 8
+        w = (w // 8) * 8
+
+        # Katsayılar jpeg_simule_et ile bit düzeyinde aynı olsun diye ileri DCT scipy.fft ile
+        self.orijinal_bloklar = np.ascontiguousarray(bloklara_bol(goruntu[:h, :w].astype(float)))
+        self.katsayilar = blok_dct(self.orijinal_bloklar - 128)
+        self.piksel_sayisi = h * w
+
+        # Bir tablo için ara diziler (~4 adet float64 görüntü boyutu) bu sınırı aşmasın
+        tablo_basina = 4 * self.katsayilar.nbytes
+        self.parca_boyutu = max(1, bellek_siniri // tablo_basina)
+        self._zikzak_katsayilar = None
+
+    def degerlendir(self, tablolar):
+        """
+        tablolar: (8, 8) veya (N, 8, 8). (psnr dizisi, sıfır olmayan katsayı dizisi) döndürür.
+        """
+        tablolar = np.asarray(tablolar, dtype=float).reshape(-1, 8, 8)
+        psnr = np.empty(len(tablolar))
+        katsayi_sayisi = np.empty(len(tablolar), dtype=np.int64)
+
+        for bas in range(0, len(tablolar), self.parca_boyutu):
+            parca = tablolar[bas:bas + self.parca_boyutu][:, None, None]  # (n, 1, 1, 8, 8)
+
+            kuante = np.round(self.katsayilar / parca)
+            katsayi_sayisi[bas:bas + len(parca)] = np.count_nonzero(kuante, axis=(1, 2, 3, 4))
+
+            # Geri çatma: tablo başına tek matmul çifti (DCT_MATRISI), ara diziler yerinde
+            kuante *= parca
+            yeniden = DCT_MATRISI.T @ kuante @ DCT_MATRISI
+            yeniden += 128
+            np.clip(yeniden, 0, 255, out=yeniden)
+            yeniden -= self.orijinal_bloklar
+            mse = np.mean(np.square(yeniden, out=yeniden), axis=(1, 2, 3, 4))
+
+            with np.errstate(divide="ignore"):
+                parca_psnr = 20 * np.log10(255.0 / np.sqrt(mse))
+            psnr[bas:bas + len(parca)] = np.where(mse == 0, 100, parca_psnr)
+
+        return psnr, katsayi_sayisi
+
+    def bayt_tahmini(self, tablolar, huffman="standart"):
+        """
+        Her tablo için tahmini entropi kodlu (Huffman) taranan veri boyutu, bayt (jpeg_size.py).
+        """
+        tablolar = np.asarray(tablolar, dtype=float).reshape(-1, 64)[:, ZIKZAK]
+        if self._zikzak_katsayilar is None:
+            # Katsayılar bir kez zikzak sırasına alınır; tablolar da aynı sırayla kuantalanır
+            self._zikzak_katsayilar = self.katsayilar.reshape(-1, 64)[:, ZIKZAK]
+        bayt = np.empty(len(tablolar), dtype=np.int64)
+        # Kuantalanmış katsayılar + sembol dizileri ~ 2 görüntü boyutu; degerlendir ile aynı parça sınırı
+        for bas in range(0, len(tablolar), self.parca_boyutu):
+            parca = tablolar[bas:bas + self.parca_boyutu][:, None]
+            kuante = np.round(self._zikzak_katsayilar / parca).astype(np.int32)
+            bayt[bas:bas + len(parca)] = zikzak_bayt(kuante, huffman)
+        return bayt
+
+
+# --- ÇALIŞTIRMA ---
+if __name__ == "__main__":
+    dosya_yolu = sys.argv[1] if len(sys.argv) > 1 else "ORİJİNAL.png"
+    tablo_adedi = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+    # Türkçe karakter sorunu için numpy ile okuma
+    goruntu = cv2.imdecode(np.fromfile(dosya_yolu, dtype=np.uint8), cv2.IMREAD_GRAYSCALE)
+    if goruntu is None:
+        print("Hata: Dosya formatı bozuk veya resim değil.")
+        sys.exit(1)
+
+    degerlendirici = TabloDegerlendirici(goruntu)
+    tablolar = np.concatenate((standart_tablo[None], trng_tablo_uretici(adet=tablo_adedi)))
+    psnr, boyut = degerlendirici.degerlendir(tablolar)
+    # Sıralama sıfır olmayan katsayı sayısıyla değil, Huffman kodlu bayt tahminiyle yapılır
+    bayt = degerlendirici.bayt_tahmini(tablolar)
+
+    print(f"\nStandart Tablo -> PSNR: {psnr[0]:.2f} dB, Veri Boyutu: {boyut[0]}, Tahmini Boyut: {bayt[0]} bayt")
+    print(f"{tablo_adedi} TRNG tablosu değerlendirildi.")
+
+    # Standart tablodan hem daha kaliteli hem daha küçük olan TRNG tabloları
+    daha_iyi = np.flatnonzero((psnr[1:] >= psnr[0]) & (bayt[1:] <= bayt[0])) + 1
+    en_iyi = 1 + np.argmax(psnr[1:] - 10 * np.log10(bayt[1:]))
+    print(f"Standart tabloyu geçen TRNG tablosu: {len(daha_iyi)} adet")
+    print(f"En iyi denge (PSNR - 10·log10(Bayt)): #{en_iyi} -> PSNR: {psnr[en_iyi]:.2f} dB, "
+          f"Veri Boyutu: {boyut[en_iyi]}, Tahmini Boyut: {bayt[en_iyi]} bayt")
@@ -0,0 +1,196 @@
+import math
+import threading
+
+import numpy as np
+
+from entropy_pool import varsayilan_havuz
+
+
+# --- BİT VERİMLİ, YANLILIKSIZ ARALIK ÖRNEKLEME ---
+# (sayi % aralik) + min_deger aralık 2'nin kuvveti değilse küçük sayıları kayırır.
+# Temiz bit en kıt kaynağımız olduğu için hiçbir bit boşa atılmaz:
+#   - Tekli çekimde "rastgelelik geri dönüşümü" (Fast Dice Roller): c, [0, v) içinde düzgün
+#     bir durumdur. c < q*n (q = v // n) ise c % n sonuç olur ve c // n, [0, q) içinde yeni
+#     durum olarak sonraki çekime kalır; reddedilirse c - q*n, [0, v - q*n) içinde kalır.
+#   - Toplu çekimde k değer tek bir b bitlik sayıya paketlenir (bit maskesi + reddetme):
+#     x < n^k ise n tabanındaki k basamağı k değer olur. k, bit/değer oranı en iyi olacak şekilde
+#     seçilir (n = 99 için değer başına ~7.2 bit; tek tek çekimde ~9 bit).
+#   - Havuzdan okunup kullanılmayan bitler ve fazladan çözülen değerler sonraki çekime kalır.
+class AralikOrnekleyici:
+    """
+    Entropi havuzu üzerinde yanlılıksız tam sayı örnekleyici.
+    Havuz okunamazsa (kamera hatası / zaman aşımı) çekimler None döndürür.
+    """
+
+    def __init__(self, havuz=None, parca_bit=1024, zaman_asimi=None):
+        self.havuz = havuz
+        self.parca_bit = parca_bit
+        self.zaman_asimi = zaman_asimi
+
+        self._bitler = np.zeros(0, dtype=np.uint8)
+        self._v = 1
+        self._c = 0
+        self._artik = {}
+        self._kilit = threading.Lock()
+
+        # İstatistik: havuzdan çekilen bit sayısı
+        self.kullanilan_bit = 0
+
+    def _bit_al(self, m):
+        # Kilit altında çağrılır. m adet 0/1 bit döndürür; eksik kalırsa None.
+        if self._bitler.size < m:
+            if self.havuz is None:
+                self.havuz = varsayilan_havuz()
+            yeni = self.havuz.read_bits(max(m - self._bitler.size, self.parca_bit),
+                                        zaman_asimi=self.zaman_asimi)
+            if yeni is None:
+                return None
+            self.kullanilan_bit += yeni.size
+            self._bitler = np.concatenate((self._bitler, yeni))
+        bitler, self._bitler = self._bitler[:m], self._bitler[m:]
+        return bitler
+
+    def bitleri_ekle(self, deger, bit_sayisi):
+        """
+        Dışarıdan gelen (düzgün dağıldığı varsayılan) bit_sayisi bitlik değeri geri dönüşüm
+        durumuna katar; sonraki çekimler önce bu bitleri kullanır.
+        """
+        with self._kilit:
+            self._c = (self._c << bit_sayisi) | (deger & ((1 << bit_sayisi) - 1))
+            self._v <<= bit_sayisi
+
+    def randbits(self, k):
+        with self._kilit:
+            bitler = self._bit_al(k)
+        if bitler is None:
+            return None
+        return int.from_bytes(np.packbits(bitler).tobytes(), "big") >> (-k % 8)
+
+    def randbelow(self, n):
+        """
+        [0, n) aralığında tek bir yanlılıksız tam sayı (n istenildiği kadar büyük olabilir).
+        """
+        if n <= 0:
+            raise ValueError("n pozitif olmalı")
+        with self._kilit:
+            while True:
+                if self._v < n:
+                    b = n.bit_length() - self._v.bit_length() + 1
+                    bitler = self._bit_al(b)
+                    if bitler is None:
+                        return None
+                    ek = int.from_bytes(np.packbits(bitler).tobytes(), "big") >> (-b % 8)
+                    self._c = (self._c << b) | ek
+                    self._v <<= b
+
+                q = self._v // n
+                if self._c < q * n:
+                    self._c, sonuc = divmod(self._c, n)
+                    self._v = q
+                    return sonuc
+                self._v -= q * n
+                self._c -= q * n
+
+    def randrange(self, low, high):
+        deger = self.randbelow(high - low)
+        return None if deger is None else low + deger
+
+    def randint(self, low, high, size=None):
+        """
+        NumPy tarzı: [low, high) aralığında tam sayılar. size verilirse dizi döndürür.
+        """
+        n = high - low
+        if n <= 0:
+            raise ValueError("high, low'dan büyük olmalı")
+        if size is None:
+            return self.randrange(low, high)
+
+        adet = int(np.prod(size))
+        if n >= 1 << 32:
+            # Büyük aralıklar: tek tek geri dönüşümlü çekim
+            degerler = [self.randbelow(n) for _ in range(adet)]
+            if any(d is None for d in degerler):
+                return None
+            dtype = np.int64 if high <= 1 << 63 else object
+            return (low + np.array(degerler, dtype=object)).astype(dtype).reshape(size)
+
+        with self._kilit:
+            degerler = self._toplu_cek(n, adet)
+        if degerler is None:
+            return None
+        return (low + degerler.astype(np.int64)).reshape(size)
+
+    def _toplu_cek(self, n, adet):
+        # Kilit altında çağrılır. [0, n) aralığında adet değer (uint64).
+        artik = self._artik.get(n, np.zeros(0, dtype=np.uint64))
+        parcalar = [artik[:adet]]
+        self._artik[n] = artik = artik[adet:]
+        eksik = adet - parcalar[0].size
+        if eksik == 0 or n == 1:
+            return np.concatenate(parcalar + [np.zeros(eksik, dtype=np.uint64)])
+
+        k, b, kabul = _paket_duzeni(n)
+        ust = np.uint64(n ** k)
+        agirliklar = np.uint64(1) << np.arange(b - 1, -1, -1, dtype=np.uint64)
+
+        while eksik > 0:
+            # Beklenen reddi karşılayacak kadar aday çek; fazlası artık olarak saklanır
+            aday = math.ceil(math.ceil(eksik / k) / kabul) + 1
+            bitler = self._bit_al(aday * b)
+            if bitler is None:
+                self._artik[n] = np.concatenate(parcalar + [artik])
+                return None
+
+            x = bitler.reshape(aday, b).astype(np.uint64) @ agirliklar
+            x = x[x < ust]
+
+            basamaklar = np.empty((x.size, k), dtype=np.uint64)
+            for j in range(k):
+                basamaklar[:, j] = x % np.uint64(n)
+                x //= np.uint64(n)
+            yeni = basamaklar.ravel()
+
+            parcalar.append(yeni[:eksik])
+            artik = np.concatenate((artik, yeni[eksik:]))
+            eksik -= min(eksik, yeni.size)
+
+        self._artik[n] = artik
+        return np.concatenate(parcalar)
+
+
+def _paket_duzeni(n):
+    """
+    n için (k, b, kabul oranı): b bitlik adayda k değer; değer başına beklenen bit en az.
+    """
+    en_iyi = None
+    for k in range(1, 64):
+        ust = n ** k
+        b = (ust - 1).bit_length()
+        if b > 63:
+            break
+        kabul = ust / (1 << b)
+        maliyet = b / (k * kabul)
+        if en_iyi is None or maliyet < en_iyi[0]:
+            en_iyi = (maliyet, k, b, kabul)
+    return en_iyi[1:]
+
+
+_varsayilan_ornekleyici = None
+
+
+def varsayilan_ornekleyici():
+    """
+    Varsayılan havuz üzerinde paylaşılan örnekleyici.
+    """
+    global _varsayilan_ornekleyici
+    if _varsayilan_ornekleyici is None:
+        _varsayilan_ornekleyici = AralikOrnekleyici()
+    return _varsayilan_ornekleyici
+
+
+def randbelow(n):
+    return varsayilan_ornekleyici().randbelow(n)
+
+
+def randint(low, high, size=None):
+    return varsayilan_ornekleyici().randint(low, high, size)
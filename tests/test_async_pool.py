@@ -0,0 +1,151 @@
+import asyncio
+import threading
+
+import numpy as np
+
+from async_pool import AsyncEntropiHavuzu
+
+
+class SiraliKaynak:
+    """
+    Ardışık baytlar (0, 1, 2, ...) veren havuz benzeri kaynak; okuma boyutlarını kaydeder.
+    sinir baytı aşılınca None döndürüp hata kaydeder.
+    """
+
+    def __init__(self, sinir=None):
+        self.sinir = sinir
+        self.konum = 0
+        self.okumalar = []
+        self.hata = None
+        self._kilit = threading.Lock()
+
+    def read_bytes(self, n, blok=True, zaman_asimi=None):
+        with self._kilit:
+            if self.sinir is not None and self.konum + n > self.sinir:
+                self.hata = "Kaynak tükendi"
+                return None
+            self.okumalar.append(n)
+            baytlar = bytes((self.konum + i) % 256 for i in range(n))
+            self.konum += n
+            return baytlar
+
+
+def test_es_zamanli_istekler_birlesir():
+    kaynak = SiraliKaynak()
+
+    async def calis():
+        async with AsyncEntropiHavuzu(kaynak) as havuz:
+            return await asyncio.gather(*(havuz.read_bytes(n) for n in range(1, 41)))
+
+    sonuclar = asyncio.run(calis())
+    # Her istek kendi uzunluğunu alır, dilimler çakışmaz ve akışın tamamını kapsar
+    assert [len(s) for s in sonuclar] == list(range(1, 41))
+    assert sorted(b"".join(sonuclar)) == sorted(bytes(i % 256 for i in range(kaynak.konum)))
+    assert len(kaynak.okumalar) < 40
+
+
+def test_parti_siniri():
+    kaynak = SiraliKaynak()
+
+    async def calis():
+        async with AsyncEntropiHavuzu(kaynak, parti_bayt=64) as havuz:
+            await asyncio.gather(*(havuz.read_bytes(16) for _ in range(32)))
+
+    asyncio.run(calis())
+    # Bir okuma, sınırı aşan son istek dahil en fazla parti_bayt + istek boyu kadardır
+    assert max(kaynak.okumalar) < 64 + 16
+    assert sum(kaynak.okumalar) == 32 * 16
+
+
+def test_kaynak_hatasi_none_dondurur():
+    kaynak = SiraliKaynak(sinir=32)
+
+    async def calis():
+        async with AsyncEntropiHavuzu(kaynak) as havuz:
+            ilk = await havuz.read_bytes(16)
+            ikinci = await havuz.read_bytes(64)
+            parcalar = [p async for p in havuz.bit_parcalari(64)]
+            return ilk, ikinci, parcalar, havuz.hata
+
+    ilk, ikinci, parcalar, hata = asyncio.run(calis())
+    assert ilk == bytes(range(16))
+    assert ikinci is None
+    # 16 bayt kalmıştı: iki 64 bitlik parça, sonra kaynak biter
+    assert len(parcalar) == 2
+    assert hata == "Kaynak tükendi"
+
+
+def test_randint_aralikta():
+    async def calis():
+        async with AsyncEntropiHavuzu(SiraliKaynak()) as havuz:
+            return await havuz.randint(3, 10, size=500)
+
+    degerler = np.asarray(asyncio.run(calis()))
+    assert degerler.shape == (500,)
+    assert degerler.min() >= 3 and degerler.max() < 10
+
+
+class YavasKaynak:
+    """
+    'hazir' olayı kurulana kadar bekleyen kaynak; verilen zaman aşımlarını kaydeder.
+    """
+
+    def __init__(self):
+        self.hata = None
+        self.hazir = threading.Event()
+        self.zaman_asimlari = []
+
+    def read_bytes(self, n, blok=True, zaman_asimi=None):
+        self.zaman_asimlari.append(zaman_asimi)
+        if not self.hazir.wait(zaman_asimi):
+            return None
+        return bytes(n)
+
+
+def test_yavas_okuma_toplayiciyi_kilitlemez():
+    kaynak = YavasKaynak()
+
+    async def calis():
+        async with AsyncEntropiHavuzu(kaynak) as havuz:
+            ilk = await havuz.read_bytes(8, zaman_asimi=0.2)
+            kaynak.hazir.set()
+            ikinci = await asyncio.wait_for(havuz.read_bytes(8, zaman_asimi=5), 2)
+            return ilk, ikinci
+
+    ilk, ikinci = asyncio.run(calis())
+    assert ilk is None
+    assert ikinci == bytes(8)
+    # İsteğin süresi kaynağa iletilir
+    assert kaynak.zaman_asimlari[0] is not None and kaynak.zaman_asimlari[0] <= 0.2
+
+
+class SinirliKaynak:
+    """
+    Elinde 'mevcut' bayt olan havuz gibi: fazlası istenirse hiçbir şey tüketmeden None döner.
+    """
+
+    def __init__(self, mevcut):
+        self.hata = None
+        self.mevcut = mevcut
+        self.okumalar = []
+
+    def read_bytes(self, n, blok=True, zaman_asimi=None):
+        self.okumalar.append((n, blok))
+        if n > self.mevcut:
+            return None
+        self.mevcut -= n
+        return bytes(n)
+
+
+def test_parti_karsilanamazsa_sigan_istekler_karsilanir():
+    kaynak = SinirliKaynak(10)
+
+    async def calis():
+        async with AsyncEntropiHavuzu(kaynak) as havuz:
+            return await asyncio.gather(havuz.read_bytes(4, zaman_asimi=1), havuz.read_bytes(100, zaman_asimi=1),
+                                        havuz.read_bytes(4, zaman_asimi=1))
+
+    sonuclar = asyncio.run(calis())
+    assert sonuclar == [bytes(4), None, bytes(4)]
+    assert kaynak.okumalar[0] == (108, True)
+    assert all(not blok for _, blok in kaynak.okumalar[1:])
@@ -0,0 +1,24 @@
+import json
+import os
+
+from benchmarks import KARE_OZETI, VARSAYILAN_TEMEL, dizi_ozeti, kare_fiksturu, temelle_karsilastir
+
+KOK = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_sentetik_fikstur_ozeti(tmp_path):
+    # Kamera kaydı olmayan her makinede aynı kareler üretilir
+    assert dizi_ozeti(kare_fiksturu(str(tmp_path / "kareler.npy"))) == KARE_OZETI
+
+
+def test_referans_temel_fiksturle_eslesir():
+    with open(os.path.join(KOK, VARSAYILAN_TEMEL), encoding="utf-8") as f:
+        temel = json.load(f)
+    assert temel["fiksturler"]["kareler"] == KARE_OZETI
+    assert "jpeg_simule_et" in temel["sonuclar"]
+
+
+def test_gerileme_bulunur():
+    temel = {"a": {"hiz": 100.0}, "b": {"hiz": 100.0}}
+    sonuclar = {"a": {"hiz": 85.0}, "b": {"hiz": 70.0}, "yeni": {"hiz": 1.0}}
+    assert temelle_karsilastir(sonuclar, temel, tolerans=0.2) == ["b"]
@@ -0,0 +1,41 @@
+import time
+
+from capture_supervisor import HATA, YakalamaYoneticisi
+
+
+def _bekle(kosul, sure=30.0):
+    son = time.monotonic() + sure
+    while not kosul():
+        assert time.monotonic() < son, "zaman aşımı"
+        time.sleep(0.01)
+
+
+def test_olen_isci_okumayi_kilitlemez_ve_baytlar_korunur():
+    with YakalamaYoneticisi(["sentetik:1"], halka_bayt=1 << 12, isinma_suresi=0, saglik=False) as yonetici:
+        _bekle(lambda: yonetici.doluluk >= 8 * 64)
+        # Sert öldürme: işçi durumunu HATA'ya çekemez
+        surec = yonetici._surecler[0]
+        surec.kill()
+        surec.join()
+        mevcut = yonetici.doluluk // 8
+
+        # zaman_asimi=None ile bile dönmeli; okunan baytlar kaybolmamalı
+        assert yonetici.read_bytes(mevcut + 1000) is None
+        assert yonetici.hata == "Tüm yakalama işçileri durdu."
+        assert yonetici.durumlar() == [HATA]
+        assert yonetici.doluluk // 8 == mevcut
+        assert len(yonetici.read_bytes(mevcut)) == mevcut
+
+
+def test_zaman_asiminda_baytlar_sirayla_geri_verilir():
+    with YakalamaYoneticisi(["sentetik:2"], halka_bayt=1 << 12, isinma_suresi=0, saglik=False) as yonetici:
+        _bekle(lambda: yonetici.doluluk >= 8 * 64)
+        yonetici._surecler[0].kill()
+        yonetici._surecler[0].join()
+        mevcut = yonetici.doluluk // 8
+        ilk = yonetici.read_bytes(mevcut + 10, zaman_asimi=0.05)
+        assert ilk is None
+        # Geri konan baytlar tek parça olarak, aynı sırayla gelir
+        a = yonetici.read_bytes(10)
+        b = yonetici.read_bytes(mevcut - 10)
+        assert len(a + b) == mevcut
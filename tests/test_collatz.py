@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from collatz import CollatzMotoru, collatz_advance, collatz_bits, collatz_step, collatz_toplu
+
+
+def _dongu(n, adim):
+    # Scriptlerdeki tek adımlı döngü: adımdan sonraki sayının paritesi yazılır
+    bitler = []
+    for _ in range(adim):
+        n = collatz_step(n)
+        bitler.append(n % 2)
+    return bitler, n
+
+
+def _tohumlar(adet, bit, tohum=0):
+    rng = np.random.default_rng(tohum)
+    return [int.from_bytes(rng.bytes(bit // 8), "big") | 1 for _ in range(adet)]
+
+
+@pytest.mark.parametrize("k", [1, 3, 12, 16])
+@pytest.mark.parametrize("adim", [0, 1, 15, 16, 17, 100, 333])
+def test_motor_tek_adimli_dongu_ile_ayni(k, adim):
+    motor = CollatzMotoru(k)
+    for n in _tohumlar(5, 256, adim) + [1, 2, 27, 2 ** 64 + 7]:
+        beklenen_bitler, beklenen_son = _dongu(n, adim)
+        bitler, son = motor.parity_bits(n, adim)
+        assert bitler.tolist() == beklenen_bitler
+        assert son == beklenen_son
+        assert motor.advance(n, adim) == beklenen_son
+
+
+def test_jump():
+    motor = CollatzMotoru(8)
+    n = _tohumlar(1, 256)[0]
+    yeni, pariteler = motor.jump(n)
+    # jump adımdan ÖNCEKİ pariteleri verir
+    beklenen = []
+    m = n
+    for _ in range(8):
+        beklenen.append(m % 2)
+        m = collatz_step(m)
+    assert pariteler.tolist() == beklenen
+    assert yeni == m
+
+
+def test_kisayollar_ve_sinirlar():
+    n = _tohumlar(1, 256, 9)[0]
+    assert collatz_bits(n, 100)[0].tolist() == _dongu(n, 100)[0]
+    assert collatz_advance(n, 100) == _dongu(n, 100)[1]
+    for k in (0, 21):
+        with pytest.raises(ValueError):
+            CollatzMotoru(k)
+
+
+def _karsilastir(tohumlar, adimlar):
+    bitler, sonlar = collatz_toplu(tohumlar, adimlar)
+    adimlar = np.broadcast_to(np.asarray(adimlar), (len(tohumlar),))
+    assert bitler.shape == (len(tohumlar), int(adimlar.max()) if tohumlar else 0)
+    for i, (n, adim) in enumerate(zip(tohumlar, adimlar)):
+        beklenen_bitler, beklenen_son = collatz_bits(n, int(adim))
+        assert np.array_equal(bitler[i, :adim], beklenen_bitler)
+        assert not bitler[i, adim:].any()
+        assert sonlar[i] == beklenen_son
+
+
+@pytest.mark.parametrize("adim", [1, 11, 12, 13, 24, 100, 257])
+def test_sabit_adim(adim):
+    _karsilastir(_tohumlar(50, 256, adim), adim)
+
+
+def test_tohum_basina_adim():
+    # Farklı uzunluklar, 12'nin katı olmayan kalanlar ve sıfır adım birlikte
+    tohumlar = _tohumlar(40, 256, 7) + [1, 2, 3, 27, 2 ** 255]
+    adimlar = np.random.default_rng(7).integers(0, 300, len(tohumlar))
+    adimlar[0] = 0
+    _karsilastir(tohumlar, adimlar)
+
+
+def test_kisa_ve_uzun_tohumlar():
+    # Basamak sayısı en uzun tohuma göre seçilir; kısa tohumlar baştaki sıfırlarla doğru ilerlemeli
+    _karsilastir([5, 2 ** 64 - 1, 2 ** 300 + 1, 6], 500)
@@ -0,0 +1,88 @@
+import hashlib
+
+import numpy as np
+import pytest
+
+from conditioning import Kosullandirici
+
+
+def _kare(sekil=(48, 64, 3), tohum=0):
+    return np.random.default_rng(tohum).integers(0, 256, sekil, dtype=np.uint8)
+
+
+def test_varsayilan_eski_tohumla_ayni():
+    # Scriptlerdeki: int(hashlib.sha256(frame).hexdigest(), 16)
+    kare = _kare()
+    k = Kosullandirici()
+    assert k.tohum(kare) == int(hashlib.sha256(kare).hexdigest(), 16)
+    assert k.tohumlar(kare) == [k.tohum(kare)]
+
+    # Bitişik olmayan görünüm, kopyasıyla aynı özeti verir
+    gorunum = _kare((96, 64, 3))[::2]
+    assert k.ozet(gorunum) == hashlib.sha256(gorunum.copy()).digest()
+
+
+def _bitleri_paketle(degerler, duzlem):
+    bitler = [(int(v) >> duzlem) & 1 for v in degerler.ravel()]
+    return np.packbits(np.array(bitler, dtype=np.uint8)).tobytes()
+
+
+@pytest.mark.parametrize("bit_duzlemi", [1, 2, 3])
+def test_bit_duzlemi(bit_duzlemi):
+    kare = _kare()
+    k = Kosullandirici("bit_duzlemi", kanal=1, adim=2, bit_duzlemi=bit_duzlemi)
+    secili = kare[::2, ::2, 1]
+    beklenen = b"".join(_bitleri_paketle(secili, d) for d in range(bit_duzlemi))
+    assert k.secim(kare).tobytes() == beklenen
+    assert k.ozet(kare) == hashlib.sha256(beklenen).digest()
+
+
+def test_alt_ornek():
+    kare = _kare()
+    k = Kosullandirici("alt_ornek", kanal=2, adim=3, pencere=(4, 40, 8, 60))
+    beklenen = np.ascontiguousarray(kare[4:40:3, 8:60:3, 2]).tobytes()
+    assert k.ozet(kare) == hashlib.sha256(beklenen).digest()
+    # Kanal verilmezse tüm kanallar
+    k = Kosullandirici("alt_ornek", adim=5)
+    assert k.ozet(kare) == hashlib.sha256(kare[::5, ::5].tobytes()).digest()
+
+
+def test_blake2b_ve_shake():
+    kare = _kare()
+    anahtar = b"gizli"
+    k = Kosullandirici(algoritma="blake2b", cikti_bayt=48, tohum_bayt=16, anahtar=anahtar)
+    ozet = hashlib.blake2b(kare, key=anahtar, digest_size=48).digest()
+    assert k.ozet(kare) == ozet
+    assert k.tohumlar(kare) == [int.from_bytes(ozet[i:i + 16], "big") for i in (0, 16, 32)]
+
+    k = Kosullandirici(algoritma="shake256", cikti_bayt=100, tohum_bayt=32, anahtar=anahtar)
+    assert k.ozet(kare) == hashlib.shake_256(anahtar + kare.tobytes()).digest(100)
+    # Artan baytlar tohuma dönüşmez (100 // 32 = 3 tohum)
+    assert len(k.tohumlar(kare)) == 3
+
+
+def test_blake2x_genisletme():
+    kare = _kare()
+    k = Kosullandirici(algoritma="blake2b", cikti_bayt=200, tohum_bayt=40)
+    ozet = k.ozet(kare)
+    kok = hashlib.blake2b(kare, digest_size=64).digest()
+    assert len(ozet) == 200
+    assert ozet[:64] == hashlib.blake2b(kok, digest_size=64, salt=bytes(16), person=b"BSG-RNG blake2x").digest()
+    assert ozet[192:] == hashlib.blake2b(kok, digest_size=8, salt=(3).to_bytes(16, "little"),
+                                         person=b"BSG-RNG blake2x").digest()
+    # Bloklar birbirinden farklı, anahtar çıktıyı değiştirir
+    assert len({ozet[i:i + 64] for i in range(0, 192, 64)}) == 3
+    assert Kosullandirici(algoritma="blake2b", cikti_bayt=200, tohum_bayt=40, anahtar=b"x").ozet(kare) != ozet
+    assert len(k.tohumlar(kare)) == 5
+
+
+@pytest.mark.parametrize("ayarlar", [
+    {"bolge": "yok"},
+    {"algoritma": "md5"},
+    {"cikti_bayt": 64},
+    {"tohum_bayt": 0},
+    {"tohum_bayt": 33},
+])
+def test_gecersiz_ayarlar(ayarlar):
+    with pytest.raises(ValueError):
+        Kosullandirici(**ayarlar)
@@ -0,0 +1,81 @@
+import cv2
+import numpy as np
+import pytest
+
+from JPEG_with_RNG import (
+    blok_dct, blok_idct, bloklara_bol, bloklari_birlestir, jpeg_simule_et, jpeg_simule_et_bantli,
+    psnr_hesapla, standart_tablo,
+)
+from rd_sweep import DCT_MATRISI, TabloDegerlendirici
+
+
+def _goruntu(h=64, w=80, tohum=0):
+    # Düz bölgeler ve gürültü karışık: kuantalamadan sonra hem sıfır hem sıfır olmayan katsayılar kalır
+    rng = np.random.default_rng(tohum)
+    y, x = np.mgrid[:h, :w]
+    goruntu = 128 + 60 * np.sin(x / 7.0) * np.cos(y / 5.0) + rng.normal(0, 12, (h, w))
+    return np.clip(goruntu, 0, 255).astype(np.uint8)
+
+
+def test_blok_dct_cv2_ile_ayni():
+    img = _goruntu().astype(float) - 128
+    katsayilar = blok_dct(bloklara_bol(img))
+    for i in range(katsayilar.shape[0]):
+        for j in range(katsayilar.shape[1]):
+            beklenen = cv2.dct(np.ascontiguousarray(img[i * 8:i * 8 + 8, j * 8:j * 8 + 8]))
+            np.testing.assert_allclose(katsayilar[i, j], beklenen, atol=1e-9)
+
+
+def test_blok_idct_ters_donusum():
+    img = _goruntu(tohum=1).astype(float)
+    np.testing.assert_allclose(bloklari_birlestir(blok_idct(blok_dct(bloklara_bol(img)))), img, atol=1e-9)
+
+
+def test_dct_matrisi_cv2_ile_ayni():
+    blok = _goruntu(8, 8, 2).astype(float)
+    np.testing.assert_allclose(DCT_MATRISI @ blok @ DCT_MATRISI.T, cv2.dct(blok), atol=1e-9)
+
+
+def test_toplu_ve_dongu_ayni():
+    goruntu = _goruntu(67, 85, 3)  # 8'in katı olmayan kenarlar kırpılır
+    toplu, toplu_sayi = jpeg_simule_et(goruntu, standart_tablo, toplu=True)
+    dongu, dongu_sayi = jpeg_simule_et(goruntu, standart_tablo, toplu=False)
+    np.testing.assert_allclose(toplu, dongu, atol=1e-9)
+    assert toplu_sayi == dongu_sayi
+
+
+@pytest.mark.parametrize("olcek", [0.5, 1.0, 3.0])
+def test_tablo_degerlendirici_simulasyonla_ayni(olcek):
+    goruntu = _goruntu(tohum=4)
+    tablolar = np.stack([np.maximum(1, np.round(standart_tablo * olcek)), np.full((8, 8), 7.0)])
+    psnr, katsayi_sayisi = TabloDegerlendirici(goruntu).degerlendir(tablolar)
+    for tablo, p, k in zip(tablolar, psnr, katsayi_sayisi):
+        sikistirilmis, beklenen_sayi = jpeg_simule_et(goruntu, tablo)
+        assert k == beklenen_sayi
+        assert p == pytest.approx(psnr_hesapla(goruntu.astype(float), sikistirilmis), abs=1e-9)
+
+
+@pytest.mark.parametrize("bant_blok", [1, 3, 16])
+def test_bantli_simulasyonla_ayni(bant_blok):
+    # 8'e ve banda bölünmeyen boyut: kırpma ve yarım son bant da denenir
+    goruntu = _goruntu(203, 171, tohum=4)
+    beklenen_img, beklenen_katsayi = jpeg_simule_et(goruntu, standart_tablo)
+    beklenen_psnr = psnr_hesapla(goruntu[:200, :168].astype(float), beklenen_img)
+
+    img, katsayi, psnr = jpeg_simule_et_bantli(goruntu, standart_tablo, bant_blok, dtype=np.float64)
+    assert img.dtype == np.uint8 and img.shape == (200, 168)
+    assert katsayi == beklenen_katsayi
+    assert psnr == pytest.approx(beklenen_psnr, abs=1e-9)
+    assert np.abs(img.astype(float) - beklenen_img).max() <= 0.5 + 1e-9
+
+
+def test_bantli_float32_ve_ciktisiz():
+    goruntu = _goruntu(128, 96, tohum=5)
+    tablo = standart_tablo * 0.5
+    _, beklenen_katsayi = jpeg_simule_et(goruntu, tablo)
+    beklenen_psnr = psnr_hesapla(goruntu.astype(float), jpeg_simule_et(goruntu, tablo)[0])
+
+    img, katsayi, psnr = jpeg_simule_et_bantli(goruntu, tablo, dtype=np.float32, cikti=False)
+    assert img is None
+    assert abs(katsayi - beklenen_katsayi) <= beklenen_katsayi * 1e-3
+    assert psnr == pytest.approx(beklenen_psnr, abs=1e-3)
@@ -0,0 +1,67 @@
+import os
+
+import pytest
+
+from drbg import DrbgUreteci, HmacDrbg
+
+
+# NIST CAVP drbgvectors_pr_false / HMAC_DRBG.rsp: [SHA-256], PredictionResistance = False,
+# EntropyInputLen = 256, NonceLen = 128, PersonalizationStringLen = 0, AdditionalInputLen = 0,
+# ReturnedBitsLen = 1024, COUNT = 0
+_CAVP = {
+    "EntropyInput": "06032cd5eed33f39265f49ecb142c511da9aff2af71203bffaf34a9ca5bd9c0d",
+    "Nonce": "0e66f71edc43e42a45ad3c6fc6cdc4df",
+    "EntropyInputReseed": "01920a4e669ed3a85ae8a33b35a74ad7fb2a6bb4cf395ce00334a9c9a5a5d552",
+    "ReturnedBits": (
+        "76fc79fe9b50beccc991a11b5635783a83536add03c157fb30645e611c2898bb"
+        "2b1bc215000209208cd506cb28da2a51bdb03826aaf2bd2335d576d519160842"
+        "e7158ad0949d1a9ec3e66ea1b1a064b005de914eac2e9d4f2d72a8616a802254"
+        "22918250ff66a41bd2f864a6a38cc5b6499dc43f7f2bd09e1e0f8f5885935124"
+    ),
+}
+
+
+def test_hmac_drbg_cavp():
+    drbg = HmacDrbg(bytes.fromhex(_CAVP["EntropyInput"]), bytes.fromhex(_CAVP["Nonce"]))
+    drbg.reseed(bytes.fromhex(_CAVP["EntropyInputReseed"]))
+    # CAVP: iki generate çağrısı yapılır, ikincinin çıktısı karşılaştırılır
+    drbg.generate(128)
+    assert drbg.generate(128).hex() == _CAVP["ReturnedBits"]
+
+
+def test_uzun_istek_parcalara_bolunur():
+    # MAKS_ISTEK_BAYT'tan uzun istek, sınır uzunluğunda ardışık isteklerle aynıdır
+    a = HmacDrbg(b"\x11" * 32, b"\x22" * 16)
+    b = HmacDrbg(b"\x11" * 32, b"\x22" * 16)
+    n = HmacDrbg.MAKS_ISTEK_BAYT
+    assert a.generate(2 * n + 5) == b.generate(n) + b.generate(n) + b.generate(5)
+
+
+class SayacliHavuz:
+    hata = None
+
+    def __init__(self):
+        self.okuma = 0
+
+    def read_bytes(self, n, blok=True, zaman_asimi=None):
+        self.okuma += 1
+        return os.urandom(n)
+
+
+def test_bayt_sinirinda_yeniden_tohumlama():
+    havuz = SayacliHavuz()
+    drbg = DrbgUreteci(havuz, yeniden_tohum_bayt=1000, yeniden_tohum_sure=None)
+    assert len(drbg.read_bytes(3500)) == 3500
+    assert drbg.tohumlama_sayisi == 4
+
+
+@pytest.mark.parametrize("ayar", [
+    {"yeniden_tohum_bayt": 0},
+    {"yeniden_tohum_bayt": -1},
+    {"yeniden_tohum_sure": 0},
+    {"yeniden_tohum_sure": -5.0},
+    {"entropi_bayt": 0},
+])
+def test_gecersiz_ayarlar(ayar):
+    with pytest.raises(ValueError):
+        DrbgUreteci(SayacliHavuz(), **ayar)
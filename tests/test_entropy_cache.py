@@ -0,0 +1,131 @@
+import os
+
+import numpy as np
+
+from entropy_cache import _BASLIK, EntropiOnbellegi
+
+
+def _baytlar(n, tohum=0):
+    return np.random.default_rng(tohum).integers(0, 256, n, dtype=np.uint8).tobytes()
+
+
+def test_kuyruk_modeliyle_ayni(tmp_path):
+    # Başvuru: sığdığı kadar ekleyen, baştan tüketen düz bir bytearray kuyruğu
+    onbellek = EntropiOnbellegi(str(tmp_path / "onb.bin"), kapasite=1000)
+    model = bytearray()
+    rng = np.random.default_rng(1)
+    try:
+        for adim in range(200):
+            if rng.random() < 0.5:
+                veri = _baytlar(int(rng.integers(0, 300)), adim)
+                eklenen = onbellek.yaz(veri)
+                assert eklenen == min(len(veri), 1000 - len(model))
+                model += veri[:eklenen]
+            else:
+                n = int(rng.integers(0, 300))
+                assert onbellek.tuket(n) == bytes(model[:n])
+                del model[:n]
+            assert onbellek.kalan == len(model)
+            assert onbellek.bos_alan == 1000 - len(model)
+        assert onbellek.tuket() == bytes(model)
+        assert onbellek.tuket() == b""
+    finally:
+        onbellek.kapat()
+
+
+def test_yeniden_acilinca_kalan_servis_edilir(tmp_path):
+    yol = str(tmp_path / "onb.bin")
+    veri = _baytlar(500)
+    onbellek = EntropiOnbellegi(yol, kapasite=1024)
+    onbellek.yaz(veri)
+    assert onbellek.tuket(200) == veri[:200]
+    onbellek.kapat()
+
+    onbellek = EntropiOnbellegi(yol, kapasite=1024)
+    try:
+        assert onbellek.kalan == 300
+        assert onbellek.tuket() == veri[200:]
+    finally:
+        onbellek.kapat()
+
+
+def test_okunan_diskte_sifirlanir(tmp_path):
+    yol = str(tmp_path / "onb.bin")
+    veri = _baytlar(256, 2)
+    onbellek = EntropiOnbellegi(yol, kapasite=256)
+    try:
+        onbellek.yaz(veri)
+        onbellek.tuket(100)
+        with open(yol, "rb") as f:
+            icerik = f.read()[_BASLIK.size:]
+        assert icerik[:100] == bytes(100)
+        assert icerik[100:] == veri[100:]
+    finally:
+        onbellek.kapat()
+
+
+def test_iki_acilis_ayni_bayti_vermez(tmp_path):
+    yol = str(tmp_path / "onb.bin")
+    a = EntropiOnbellegi(yol, kapasite=512)
+    b = EntropiOnbellegi(yol, kapasite=512)
+    try:
+        veri = _baytlar(512, 3)
+        a.yaz(veri)
+        ilk, ikinci = a.tuket(300), b.tuket(300)
+        assert ilk + ikinci == veri
+        assert a.tuket() == b.tuket() == b""
+    finally:
+        a.kapat()
+        b.kapat()
+
+
+def test_bozuk_muhur_servis_edilmez(tmp_path, capsys):
+    yol = str(tmp_path / "onb.bin")
+    onbellek = EntropiOnbellegi(yol, kapasite=256)
+    onbellek.yaz(_baytlar(256, 4))
+    onbellek.kapat()
+
+    # Okunmamış veride tek bayt değiştirilir
+    with open(yol, "r+b") as f:
+        f.seek(_BASLIK.size + 17)
+        bayt = f.read(1)
+        f.seek(_BASLIK.size + 17)
+        f.write(bytes([bayt[0] ^ 1]))
+
+    onbellek = EntropiOnbellegi(yol, kapasite=256)
+    try:
+        assert "mührü bozuk" in capsys.readouterr().out
+        assert onbellek.kalan == 0
+        assert onbellek.tuket() == b""
+    finally:
+        onbellek.kapat()
+
+
+def test_acikken_bozulan_dosya_servis_edilmez(tmp_path, capsys):
+    yol = str(tmp_path / "onb.bin")
+    onbellek = EntropiOnbellegi(yol, kapasite=256)
+    try:
+        onbellek.yaz(_baytlar(256, 5))
+        with open(yol, "r+b") as f:
+            f.seek(_BASLIK.size + 200)
+            f.write(b"\0\0\0\0")
+        assert onbellek.tuket(16) == b""
+        assert "mührü bozuk" in capsys.readouterr().out
+        assert onbellek.kalan == 0
+    finally:
+        onbellek.kapat()
+
+
+def test_boyut_uyusmazsa_sifirlanir(tmp_path, capsys):
+    yol = str(tmp_path / "onb.bin")
+    onbellek = EntropiOnbellegi(yol, kapasite=256)
+    onbellek.yaz(_baytlar(256, 6))
+    onbellek.kapat()
+
+    onbellek = EntropiOnbellegi(yol, kapasite=512)
+    try:
+        assert "boyutu uyuşmuyor" in capsys.readouterr().out
+        assert os.path.getsize(yol) == _BASLIK.size + 512
+        assert onbellek.kalan == 0
+    finally:
+        onbellek.kapat()
@@ -0,0 +1,71 @@
+import threading
+
+from conditioning import Kosullandirici
+from entropy_pool import EntropiHavuzu
+
+
+class BozukKosullandirici(Kosullandirici):
+    def tohumlar(self, frame):
+        raise ValueError("bozuk kare")
+
+
+def _kucuk_havuz(**ayarlar):
+    ayarlar.setdefault("saglik", False)
+    return EntropiHavuzu("sentetik:3", kapasite=1 << 14, **ayarlar)
+
+
+def _sure_sinirli(fonksiyon, sure=20.0):
+    sonuc = {}
+    thread = threading.Thread(target=lambda: sonuc.setdefault("deger", fonksiyon()), daemon=True)
+    thread.start()
+    thread.join(sure)
+    assert not thread.is_alive(), "okuma takıldı"
+    return sonuc["deger"]
+
+
+def test_uretici_istisnasi_okuyucuyu_uyandirir():
+    havuz = _kucuk_havuz(kosullandirici=BozukKosullandirici())
+    try:
+        assert _sure_sinirli(lambda: havuz.read_bits(64)) is None
+        assert "ValueError" in havuz.hata and "bozuk kare" in havuz.hata
+    finally:
+        havuz.stop()
+
+
+def test_ilk_okuma_baslatir():
+    havuz = _kucuk_havuz()
+    try:
+        assert _sure_sinirli(lambda: havuz.read_bits(256)).size == 256
+    finally:
+        havuz.stop()
+
+
+def test_durdurulan_havuz_kendiliginden_baslamaz():
+    havuz = _kucuk_havuz()
+    try:
+        havuz.read_bits(8)
+        havuz.stop()
+        kalan = havuz.doluluk
+        # Tamponda kalanlar verilir, sonrası start()'a kadar None
+        if kalan:
+            assert havuz.read_bits(kalan, blok=False).size == kalan
+        assert _sure_sinirli(lambda: havuz.read_bits(8)) is None
+        assert havuz._thread is None
+
+        havuz.start()
+        assert _sure_sinirli(lambda: havuz.read_bits(8)).size == 8
+    finally:
+        havuz.stop()
+
+
+def test_hata_sonrasi_yeniden_baslamaz():
+    havuz = _kucuk_havuz(kosullandirici=BozukKosullandirici())
+    try:
+        assert _sure_sinirli(lambda: havuz.read_bits(8)) is None
+        hata = havuz.hata
+        assert _sure_sinirli(lambda: havuz.read_bits(8)) is None
+        # Hata silinmez, üretici yeniden başlatılmaz
+        assert havuz.hata == hata
+        assert not havuz._thread.is_alive()
+    finally:
+        havuz.stop()
@@ -0,0 +1,95 @@
+import asyncio
+import os
+import socket
+import stat
+import threading
+import time
+
+import pytest
+
+from entropy_pool import EntropiHavuzu
+from entropy_server import EntropiIstemcisi, EntropiSunucusu
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix soketi yok")
+
+_havuzlar = []
+
+
+@pytest.fixture(autouse=True)
+def _havuzlari_durdur():
+    # Sunucu havuzu kendisi durdurmaz; arka planda çalışmaya devam edip ortak metrikleri bozmasın
+    yield
+    while _havuzlar:
+        _havuzlar.pop().stop()
+
+
+def _sunucu_baslat(adres):
+    havuz = EntropiHavuzu("sentetik:5", saglik=False)
+    _havuzlar.append(havuz)
+    sunucu = EntropiSunucusu(havuz, adres=f"unix:{adres}")
+    dongu = asyncio.new_event_loop()
+    hata = {}
+
+    def calistir():
+        try:
+            dongu.run_until_complete(sunucu.serve())
+        except (asyncio.CancelledError, OSError) as e:
+            hata["hata"] = e
+
+    thread = threading.Thread(target=calistir, daemon=True)
+    thread.start()
+    son = time.monotonic() + 10
+    while sunucu._sunucu is None and thread.is_alive():
+        assert time.monotonic() < son
+        time.sleep(0.01)
+    return sunucu, dongu, thread, hata
+
+
+def _durdur(sunucu, dongu, thread):
+    dongu.call_soon_threadsafe(sunucu._sunucu.close)
+    thread.join(10)
+
+
+def test_soket_sadece_sahibine_acik(tmp_path):
+    yol = str(tmp_path / "alt" / "bsg.sock")
+    sunucu, dongu, thread, _ = _sunucu_baslat(yol)
+    try:
+        assert stat.S_IMODE(os.stat(yol).st_mode) == 0o600
+        assert stat.S_IMODE(os.stat(os.path.dirname(yol)).st_mode) & 0o077 == 0
+        with EntropiIstemcisi(f"unix:{yol}", zaman_asimi=10) as istemci:
+            assert len(istemci.read_bytes(16)) == 16
+    finally:
+        _durdur(sunucu, dongu, thread)
+    assert not os.path.exists(yol)
+
+
+def test_calisan_sunucunun_soketi_silinmez(tmp_path):
+    yol = str(tmp_path / "bsg.sock")
+    sunucu, dongu, thread, _ = _sunucu_baslat(yol)
+    try:
+        ikinci, ikinci_dongu, ikinci_thread, hata = _sunucu_baslat(yol)
+        ikinci_thread.join(10)
+        assert isinstance(hata.get("hata"), OSError)
+        # İlk sunucu hâlâ erişilebilir
+        with EntropiIstemcisi(f"unix:{yol}", zaman_asimi=10) as istemci:
+            assert len(istemci.read_bytes(8)) == 8
+    finally:
+        _durdur(sunucu, dongu, thread)
+
+
+def test_eski_soket_temizlenir_dosya_korunur(tmp_path):
+    yol = str(tmp_path / "bsg.sock")
+    # Bağlantıyı reddeden (dinlemeyen) eski soket
+    eski = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    eski.bind(yol)
+    eski.close()
+    sunucu, dongu, thread, _ = _sunucu_baslat(yol)
+    assert sunucu._sunucu is not None
+    _durdur(sunucu, dongu, thread)
+
+    dosya = tmp_path / "dosya"
+    dosya.write_text("silinmemeli")
+    _, _, dosya_thread, hata = _sunucu_baslat(str(dosya))
+    dosya_thread.join(10)
+    assert isinstance(hata.get("hata"), FileExistsError)
+    assert dosya.read_text() == "silinmemeli"
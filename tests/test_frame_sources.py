@@ -0,0 +1,130 @@
+import cv2
+import numpy as np
+import pytest
+
+from frame_sources import (
+    HamDokumKaynagi, KameraKaynagi, KareKaynagi, KlasorKaynagi, SentetikKaynak, VideoKaynagi,
+    kaynak_ac, kareleri_kaydet,
+)
+
+SEKIL = (24, 32, 3)
+
+
+def _hepsini_oku(kaynak, parti=3):
+    kareler = []
+    while True:
+        p = kaynak.read_batch(parti)
+        if len(p) == 0:
+            break
+        kareler.extend(np.array(k) for k in p)
+    kaynak.release()
+    return kareler
+
+
+def _referans_kareler(adet=7):
+    return list(np.random.default_rng(1).integers(0, 256, (adet,) + SEKIL, dtype=np.uint8))
+
+
+def _esit(a, b):
+    assert len(a) == len(b)
+    for x, y in zip(a, b):
+        np.testing.assert_array_equal(x, y)
+
+
+def test_sentetik_tohumlu():
+    a = _hepsini_oku(SentetikKaynak(5, SEKIL, adet=10))
+    _esit(a, _hepsini_oku(SentetikKaynak(5, SEKIL, adet=10), parti=4))
+    assert len(a) == 10
+    assert not np.array_equal(a[0], _hepsini_oku(SentetikKaynak(6, SEKIL, adet=1))[0])
+
+
+def test_kaydet_ve_ham_dokum(tmp_path):
+    yol = str(tmp_path / "kareler.npy")
+    assert kareleri_kaydet(SentetikKaynak(3, SEKIL, adet=9), yol, 9) == 9
+    beklenen = _hepsini_oku(SentetikKaynak(3, SEKIL, adet=9))
+    _esit(_hepsini_oku(HamDokumKaynagi(yol)), beklenen)
+
+    # Başlıksız ham döküm: şekil verilir
+    ham = tmp_path / "kareler.raw"
+    np.stack(beklenen).tofile(ham)
+    _esit(_hepsini_oku(HamDokumKaynagi(str(ham), sekil=SEKIL)), beklenen)
+    with pytest.raises(ValueError):
+        HamDokumKaynagi(str(ham))
+
+    # Döngü başa sarar
+    dongulu = HamDokumKaynagi(yol, dongu=True, parti_boyutu=4)
+    kareler = [dongulu.read()[1] for _ in range(12)]
+    dongulu.release()
+    _esit(kareler, beklenen + beklenen[:3])
+
+
+def test_klasor_cv2_ile_ayni(tmp_path):
+    beklenen = _referans_kareler()
+    for i, kare in enumerate(beklenen):
+        cv2.imwrite(str(tmp_path / f"{i:03d}.png"), kare)
+    (tmp_path / "bozuk.png").write_bytes(b"resim degil")
+    _esit(_hepsini_oku(KlasorKaynagi(str(tmp_path))), beklenen)
+    assert not KlasorKaynagi(str(tmp_path / "yok")).isOpened()
+
+
+def test_video_videocapture_ile_ayni(tmp_path):
+    yol = str(tmp_path / "video.avi")
+    yazici = cv2.VideoWriter(yol, cv2.VideoWriter_fourcc(*"MJPG"), 10, (SEKIL[1], SEKIL[0]))
+    if not yazici.isOpened():
+        pytest.skip("Video yazıcı yok")
+    for kare in _referans_kareler():
+        yazici.write(kare)
+    yazici.release()
+
+    # Referans: scriptlerdeki cv2.VideoCapture döngüsü
+    cap = cv2.VideoCapture(yol)
+    beklenen = []
+    while True:
+        ret, kare = cap.read()
+        if not ret:
+            break
+        beklenen.append(kare)
+    cap.release()
+
+    _esit(_hepsini_oku(VideoKaynagi(yol, onden_okuma=0)), beklenen)
+    _esit(_hepsini_oku(VideoKaynagi(yol, onden_okuma=2)), beklenen)
+    dongulu = VideoKaynagi(yol, dongu=True, parti_boyutu=4)
+    _esit([dongulu.read()[1] for _ in range(len(beklenen) + 2)], beklenen + beklenen[:2])
+    dongulu.release()
+
+
+def test_onden_okuma_ve_read_karisik():
+    beklenen = _hepsini_oku(SentetikKaynak(8, SEKIL, adet=20))
+    kaynak = SentetikKaynak(8, SEKIL, adet=20, parti_boyutu=4, onden_okuma=2)
+    kareler = [kaynak.read()[1]]
+    kareler.extend(kaynak.read_batch(2))
+    kareler.extend(_hepsini_oku(kaynak, parti=5))
+    _esit(kareler, beklenen)
+    assert kaynak.read() == (False, None)
+
+
+class BozukKaynak(KareKaynagi):
+    def _oku_parti(self, n):
+        raise OSError("disk hatası")
+
+
+def test_onden_okuma_hatasi_tuketiciye_gecer():
+    kaynak = BozukKaynak(parti_boyutu=2, onden_okuma=1)
+    for _ in range(2):
+        with pytest.raises(OSError, match="disk hatası"):
+            kaynak.read_batch(2)
+    kaynak.release()
+
+
+def test_kaynak_ac():
+    assert isinstance(kaynak_ac("sentetik:4"), SentetikKaynak)
+    kaynak = SentetikKaynak()
+    assert kaynak_ac(kaynak) is kaynak
+    with pytest.raises(ValueError):
+        kaynak_ac("bilinmeyen:1")
+
+
+def test_olmayan_kamera():
+    kamera = KameraKaynagi(99, isinma_suresi=0)
+    assert not kamera.isOpened()
+    kamera.release()
@@ -0,0 +1,121 @@
+import threading
+
+import numpy as np
+import pytest
+
+from entropy_pool import EntropiHavuzu
+from frame_sources import KareKaynagi
+from health_tests import SaglikIzleyici, UyarlamaliOranTesti, TekrarSayisiTesti
+
+# Varsayılan kesimler (min_entropi=1.0, ornek_adimi=257) kamera okuma gürültüsü bilinen sentetik
+# karelerle sınanır: gürültü standart sapması (DN) örnek başına min-entropiyi belirler.
+SEKIL = (480, 640, 3)
+
+
+def _sahne():
+    # Durağan doğal sahne yerine yumuşak geçişli ışık ve gölge
+    y, x = np.mgrid[:SEKIL[0], :SEKIL[1]]
+    return np.stack([60 + 120 * x / SEKIL[1] + 30 * np.sin(y / 40.0)] * 3, axis=-1)
+
+
+def _kareler(taban, sapma, adet, tohum=0):
+    rng = np.random.default_rng(tohum)
+    for _ in range(adet):
+        yield np.clip(np.round(taban + rng.normal(0, sapma, SEKIL)), 0, 255).astype(np.uint8)
+
+
+@pytest.mark.parametrize("taban, sapma", [
+    (_sahne(), 1.0),
+    (_sahne(), 0.5),                  # dokulu sahnede değişkenlik sahneden de gelir
+    (np.full(SEKIL, 128.0), 1.0),    # en kötü durum: düz duvar, sadece sensör gürültüsü
+    (np.full(SEKIL, 128.0), 2.0),
+])
+def test_gurultulu_duragan_sahne_gecer(taban, sapma):
+    izleyici = SaglikIzleyici(eylem="durdur")
+    assert all(izleyici.kontrol(kare) for kare in _kareler(taban, sapma, 50))
+    assert izleyici.sayaclar["atilan_kare"] == 0
+
+
+@pytest.mark.parametrize("taban, sapma", [
+    (np.zeros(SEKIL), 0.0),          # kapalı lens, siyah seviyesi 0
+    (np.full(SEKIL, 2.0), 0.5),      # kapalı lens, düşük karanlık gürültüsü
+    (np.full(SEKIL, 255.0), 0.0),    # doymuş sensör
+    (np.full(SEKIL, 128.0), 0.3),    # düz sahnede H < 1 bit: varsayım tutmaz, kaynak reddedilir
+])
+def test_dusuk_entropili_kaynak_kalir(taban, sapma):
+    izleyici = SaglikIzleyici(eylem="durdur")
+    kare = next(_kareler(taban, sapma, 1))
+    assert not izleyici.kontrol(kare)
+    assert izleyici.durdu
+    assert "Uyarlamalı Oran Testi" in izleyici.son_hata
+
+
+def test_donmus_kare():
+    izleyici = SaglikIzleyici()
+    kare = next(_kareler(_sahne(), 1.0, 1))
+    assert izleyici.kontrol(kare)
+    assert not izleyici.kontrol(kare.copy())
+    assert izleyici.son_hata == "Tekrar Eden Kare"
+
+
+def test_kesimler_kareler_arasi_tasinir():
+    # Koşu ve pencere kare sınırında bölünse de tek parça verilmiş gibi sayılır
+    rct = TekrarSayisiTesti(1.0)
+    assert rct.esik == 21
+    assert rct.kontrol(np.array([1, 2] + [7] * 15, dtype=np.uint8))
+    assert not rct.kontrol(np.array([7] * 6, dtype=np.uint8))
+
+    apt = UyarlamaliOranTesti(1.0, pencere=512)
+    ornekler = (np.arange(512) % 250 + 6).astype(np.uint8)
+    ornekler[0] = 5
+    ornekler[200:200 + apt.esik - 1] = 5
+    assert apt.kontrol(ornekler[:100])
+    assert not apt.kontrol(ornekler[100:])
+
+
+def test_sifirla():
+    izleyici = SaglikIzleyici(eylem="durdur")
+    assert not izleyici.kontrol(np.zeros(SEKIL, dtype=np.uint8))
+    assert not izleyici.kontrol(next(_kareler(_sahne(), 1.0, 1)))
+    izleyici.sifirla()
+    assert izleyici.kontrol(next(_kareler(_sahne(), 1.0, 1, tohum=1)))
+    assert izleyici.sayaclar["atilan_kare"] == 1
+
+
+class DonmusKaynak(KareKaynagi):
+    def __init__(self):
+        super().__init__(parti_boyutu=4)
+        self.kare = next(_kareler(_sahne(), 1.0, 1))
+
+    def _oku_parti(self, n):
+        return np.stack([self.kare] * n)
+
+
+def _sure_sinirli(fonksiyon, sure=20.0):
+    sonuc = {}
+    thread = threading.Thread(target=lambda: sonuc.setdefault("deger", fonksiyon()), daemon=True)
+    thread.start()
+    thread.join(sure)
+    assert not thread.is_alive(), "okuma takıldı"
+    return sonuc["deger"]
+
+
+def test_havuz_durmasi_kalicidir():
+    havuz = EntropiHavuzu(DonmusKaynak(), kapasite=1 << 14, saglik=SaglikIzleyici(eylem="durdur"))
+    try:
+        assert _sure_sinirli(lambda: havuz.read_bits(64)) is None
+        assert havuz.hata.startswith("Sağlık testi hatası")
+
+        # Sonraki okumalar ve start() kaynağı yeniden açmaz, hata korunur
+        assert _sure_sinirli(lambda: havuz.read_bits(64)) is None
+        havuz.start()
+        assert _sure_sinirli(lambda: havuz.read_bits(64)) is None
+        assert havuz.hata.startswith("Sağlık testi hatası")
+
+        # Kaynak düzeltilip açıkça sıfırlanınca üretim sürer
+        havuz.kaynak = "sentetik:9"
+        havuz.yeniden_baslat()
+        assert _sure_sinirli(lambda: havuz.read_bits(64)).size == 64
+        assert havuz.hata is None
+    finally:
+        havuz.stop()
@@ -0,0 +1,91 @@
+import cv2
+import numpy as np
+import pytest
+
+from image_loader import azaltma_bayragi, goruntu_boyutu, goruntu_coz, goruntu_yukle
+
+_ORANLAR = {cv2.IMREAD_GRAYSCALE: 1, cv2.IMREAD_REDUCED_GRAYSCALE_2: 2,
+            cv2.IMREAD_REDUCED_GRAYSCALE_4: 4, cv2.IMREAD_REDUCED_GRAYSCALE_8: 8}
+
+
+def _goruntu(h, w, tohum=0, gurultu=6):
+    rng = np.random.default_rng(tohum)
+    y, x = np.mgrid[:h, :w]
+    goruntu = 128 + 60 * np.sin(x / 37.0) * np.cos(y / 23.0) + rng.normal(0, gurultu, (h, w))
+    return np.clip(goruntu, 0, 255).astype(np.uint8)
+
+
+def _kodla(goruntu, uzanti, *ayarlar):
+    ok, dosya = cv2.imencode(uzanti, goruntu, list(ayarlar))
+    assert ok
+    return dosya.tobytes()
+
+
+def _app_ekle(jpeg, n):
+    # SOI'den sonra n baytlık APP1 (EXIF benzeri) segmenti ve dolgu baytları
+    return jpeg[:2] + b"\xff\xe1" + (n + 2).to_bytes(2, "big") + bytes(n) + b"\xff\xff" + jpeg[2:]
+
+
+@pytest.mark.parametrize("h,w", [(1, 1), (37, 53), (480, 641), (1200, 16)])
+def test_boyut_cozucuyle_ayni(h, w):
+    goruntu = _goruntu(h, w)
+    dosyalar = [
+        _kodla(goruntu, ".png"),
+        _kodla(goruntu, ".jpg"),
+        _kodla(goruntu, ".jpg", cv2.IMWRITE_JPEG_PROGRESSIVE, 1),
+        _app_ekle(_kodla(goruntu, ".jpg"), 3000),
+    ]
+    for dosya in dosyalar:
+        cozulen = cv2.imdecode(np.frombuffer(dosya, np.uint8), cv2.IMREAD_UNCHANGED)
+        assert goruntu_boyutu(dosya) == (cozulen.shape[1], cozulen.shape[0])
+        assert goruntu_boyutu(np.frombuffer(dosya, np.uint8)) == (w, h)
+
+
+def test_bilinmeyen_ve_kesik_baslik():
+    assert goruntu_boyutu(_kodla(_goruntu(8, 8), ".bmp")) is None
+    assert goruntu_boyutu(b"") is None
+    jpeg = _app_ekle(_kodla(_goruntu(8, 8), ".jpg"), 100)
+    assert goruntu_boyutu(jpeg[:60]) is None
+
+
+@pytest.mark.parametrize("genislik", [500, 1023, 1024, 2047, 2048, 2049, 4100, 8191, 8192, 20000])
+def test_azaltma_bayragi(genislik):
+    maks = 1024
+    bayrak = azaltma_bayragi(genislik, maks)
+    oran = _ORANLAR[bayrak]
+    # Seçilen oran genişliği maks'ın altına düşürmez; bir büyük oran düşürürdü
+    assert genislik // oran >= maks or oran == 1
+    daha_buyuk = [r for r in _ORANLAR.values() if r > oran]
+    assert all(genislik // r < maks for r in daha_buyuk)
+    assert azaltma_bayragi(None, maks) == cv2.IMREAD_GRAYSCALE
+
+
+@pytest.mark.parametrize("w", [900, 2100, 4400])
+def test_azaltilmis_cozme_eski_yolla_ayni(w):
+    # Piksel gürültüsü küçültme yöntemine göre farklı ortalanır; karşılaştırma düzgün sahnede yapılır
+    h = w * 2 // 3
+    renkli = cv2.cvtColor(_goruntu(h, w, gurultu=0), cv2.COLOR_GRAY2BGR)
+    dosya = _kodla(renkli, ".jpg", cv2.IMWRITE_JPEG_QUALITY, 95)
+
+    # Eski yol: tam çözünürlükte renkli çöz, griye çevir, 1024 genişliğe küçült
+    eski = cv2.cvtColor(cv2.imdecode(np.frombuffer(dosya, np.uint8), cv2.IMREAD_COLOR), cv2.COLOR_BGR2GRAY)
+    if w > 1024:
+        eski = cv2.resize(eski, (0, 0), fx=1024 / w, fy=1024 / w)
+
+    yeni = goruntu_coz(dosya, maks_genislik=1024)
+    assert yeni.shape == eski.shape
+    assert np.mean(np.abs(yeni.astype(int) - eski)) < 2.0
+
+
+def test_goruntu_yukle(tmp_path):
+    goruntu = _goruntu(64, 96)
+    yol = tmp_path / "görüntü_ışık.png"
+    yol.write_bytes(_kodla(goruntu, ".png"))
+    np.testing.assert_array_equal(goruntu_yukle(str(yol)), goruntu)
+
+    bos = tmp_path / "bos.png"
+    bos.write_bytes(b"")
+    assert goruntu_yukle(str(bos)) is None
+    bozuk = tmp_path / "bozuk.png"
+    bozuk.write_bytes(b"\x89PNG\r\n\x1a\n" + bytes(40))
+    assert goruntu_yukle(str(bozuk)) is None
@@ -0,0 +1,65 @@
+import cv2
+import numpy as np
+import pytest
+
+from JPEG_with_RNG import standart_tablo
+from jpeg_size import goruntu_boyutu_tahmini, toplu_entropi_boyutu
+
+
+def _goruntu(h=256, w=320, tohum=0, bulaniklik=0):
+    rng = np.random.default_rng(tohum)
+    y, x = np.mgrid[:h, :w]
+    goruntu = 128 + 60 * np.sin(x / 7.0) * np.cos(y / 5.0) + rng.normal(0, 12, (h, w))
+    goruntu = np.clip(goruntu, 0, 255).astype(np.uint8)
+    return cv2.GaussianBlur(goruntu, (0, 0), bulaniklik) if bulaniklik else goruntu
+
+
+def _gercek_boyut(goruntu, optimal):
+    """
+    libjpeg (kalite 50 = Ek K.1 tablosu) ile kodlanmış dosyadaki taranan veri baytı.
+    optimal=True ise tahmin gibi DHT segmentleri de eklenir.
+    """
+    ok, dosya = cv2.imencode(".jpg", goruntu, [cv2.IMWRITE_JPEG_QUALITY, 50,
+                                               cv2.IMWRITE_JPEG_OPTIMIZE, int(optimal)])
+    assert ok
+    veri = dosya.tobytes()
+    i, dht = 2, 0
+    while True:
+        isaretci = veri[i + 1]
+        uzunluk = int.from_bytes(veri[i + 2:i + 4], "big")
+        if isaretci == 0xC4:
+            dht += 2 + uzunluk
+        if isaretci == 0xDA:
+            # SOS başlığından EOI'ye (son 2 bayt) kadar
+            tarama = len(veri) - 2 - (i + 2 + uzunluk)
+            return tarama + (dht if optimal else 0)
+        i += 2 + uzunluk
+
+
+@pytest.mark.parametrize("huffman", ["standart", "optimal"])
+@pytest.mark.parametrize("bulaniklik", [0, 2])
+def test_imencode_ile_yakin(huffman, bulaniklik):
+    # libjpeg tam sayı DCT kullanır; birkaç katsayı farklı yuvarlanabilir, sonuç yaklaşık olmalı
+    goruntu = _goruntu(tohum=bulaniklik, bulaniklik=bulaniklik)
+    tahmin = goruntu_boyutu_tahmini(goruntu, standart_tablo, huffman)
+    assert tahmin == pytest.approx(_gercek_boyut(goruntu, huffman == "optimal"), rel=0.03)
+
+
+def test_optimal_standarttan_kucuk():
+    goruntu = _goruntu()
+    assert goruntu_boyutu_tahmini(goruntu, standart_tablo, "optimal") < \
+        goruntu_boyutu_tahmini(goruntu, standart_tablo, "standart")
+
+
+def test_toplu_tekli_ile_ayni():
+    rng = np.random.default_rng(3)
+    yigin = np.round(rng.laplace(0, 2, (4, 40, 8, 8)) * (rng.random((4, 40, 8, 8)) < 0.3))
+    for huffman in ("standart", "optimal"):
+        toplu = toplu_entropi_boyutu(yigin, huffman)
+        tekli = [toplu_entropi_boyutu(yigin[i:i + 1], huffman)[0] for i in range(len(yigin))]
+        assert toplu.tolist() == tekli
+
+
+def test_bilinmeyen_huffman():
+    with pytest.raises(ValueError):
+        toplu_entropi_boyutu(np.zeros((1, 1, 8, 8)), "yok")
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from JPEG_with_RNG import jpeg_simule_et, psnr_hesapla, standart_tablo
+from jpeg_tiled import cikti_olustur, goruntu_ac, jpeg_seritli
+
+
+def _goruntu(h, w, tohum=0):
+    rng = np.random.default_rng(tohum)
+    y, x = np.mgrid[:h, :w]
+    goruntu = 128 + 60 * np.sin(x / 7.0) * np.cos(y / 5.0) + rng.normal(0, 12, (h, w))
+    return np.clip(goruntu, 0, 255).astype(np.uint8)
+
+
+@pytest.mark.parametrize("serit_blok,isci", [(1, 1), (2, 4), (64, None)])
+def test_simulasyonla_ayni(serit_blok, isci):
+    goruntu = _goruntu(157, 210, tohum=serit_blok)
+    beklenen_img, beklenen_katsayi = jpeg_simule_et(goruntu, standart_tablo)
+    beklenen_psnr = psnr_hesapla(goruntu[:152, :208].astype(float), beklenen_img)
+
+    cikti = np.empty((152, 208), dtype=np.uint8)
+    katsayi, psnr = jpeg_seritli(goruntu, standart_tablo, cikti, serit_blok, isci)
+    assert katsayi == beklenen_katsayi
+    assert psnr == pytest.approx(beklenen_psnr, abs=1e-9)
+    assert np.abs(cikti.astype(float) - beklenen_img).max() <= 0.5 + 1e-9
+
+
+def test_memmap_giris_ve_cikti(tmp_path):
+    goruntu = _goruntu(96, 136, tohum=7)
+    np.save(tmp_path / "giris.npy", goruntu)
+    goruntu.tofile(tmp_path / "giris.raw")
+    beklenen_img, beklenen_katsayi = jpeg_simule_et(goruntu, standart_tablo)
+
+    for giris, sekil in (("giris.npy", None), ("giris.raw", (96, 136))):
+        kaynak = goruntu_ac(str(tmp_path / giris), sekil)
+        cikti = cikti_olustur(str(tmp_path / ("cikti_" + giris)), (96, 136))
+        katsayi, _ = jpeg_seritli(kaynak, standart_tablo, cikti, serit_blok=3)
+        assert katsayi == beklenen_katsayi
+        del cikti
+
+    okunan = np.load(tmp_path / "cikti_giris.npy")
+    ham = np.fromfile(tmp_path / "cikti_giris.raw", dtype=np.uint8).reshape(96, 136)
+    np.testing.assert_array_equal(okunan, ham)
+    assert np.abs(okunan.astype(float) - beklenen_img).max() <= 0.5 + 1e-9
+
+
+def test_hatali_girdiler(tmp_path):
+    with pytest.raises(ValueError):
+        jpeg_seritli(_goruntu(64, 64), standart_tablo, np.empty((64, 56), dtype=np.uint8))
+    goruntu = _goruntu(16, 16)
+    goruntu.tofile(tmp_path / "ham.raw")
+    with pytest.raises(ValueError):
+        goruntu_ac(str(tmp_path / "ham.raw"))
+    np.save(tmp_path / "renkli.npy", np.zeros((8, 8, 3), dtype=np.uint8))
+    with pytest.raises(ValueError):
+        goruntu_ac(str(tmp_path / "renkli.npy"))
@@ -0,0 +1,110 @@
+import urllib.error
+import urllib.request
+
+import pytest
+
+import metrics
+from entropy_pool import EntropiHavuzu
+
+
+@pytest.fixture
+def acik_metrikler():
+    for metrik in metrics._metrikler.values():
+        metrik.sifirla()
+    metrics.etkinlestir(True)
+    yield
+    metrics.etkinlestir(False)
+    for metrik in metrics._metrikler.values():
+        metrik.sifirla()
+
+
+def _ornekler(metin):
+    # "# HELP/TYPE" dışındaki satırları {ad{etiketler}: değer} sözlüğüne çevirir
+    sonuc = {}
+    for satir in metin.splitlines():
+        if satir and not satir.startswith("#"):
+            ad, deger = satir.rsplit(" ", 1)
+            sonuc[ad] = float(deger)
+    return sonuc
+
+
+def test_kapaliyken_kayit_yok():
+    metrics.etkinlestir(False)
+    sayac = metrics.Sayac("bsg_test_kapali", "test")
+    sayac.ekle(5)
+    assert sayac.deger() == 0
+    assert metrics.asama("collatz") is metrics.asama("ekstraktor")
+
+
+def test_prometheus_metni(acik_metrikler):
+    metrics.SAGLIK_HATASI.ekle(test="rct")
+    metrics.SAGLIK_HATASI.ekle(2, test="apt")
+    metrics.HAVUZ_DOLULUK.ayarla(4096)
+    for sure in (0.0002, 0.003, 0.003, 7.0):
+        metrics.ASAMA_SURESI.gozlemle(sure, asama="collatz")
+
+    metin = metrics.prometheus_metni()
+    assert "# TYPE bsg_saglik_hatasi_toplam counter" in metin
+    assert "# TYPE bsg_havuz_doluluk_bit gauge" in metin
+    assert "# TYPE bsg_asama_sure_saniye histogram" in metin
+
+    ornek = _ornekler(metin)
+    assert ornek['bsg_saglik_hatasi_toplam{test="rct"}'] == 1
+    assert ornek['bsg_saglik_hatasi_toplam{test="apt"}'] == 2
+    assert ornek["bsg_havuz_doluluk_bit"] == 4096
+
+    # Kovalar birikimli; +Inf kovası toplam adede eşit
+    kova = 'bsg_asama_sure_saniye_bucket{asama="collatz",le="%s"}'
+    assert ornek[kova % "0.0001"] == 0
+    assert ornek[kova % "0.0005"] == 1
+    assert ornek[kova % "0.005"] == 3
+    assert ornek[kova % "5.0"] == 3
+    assert ornek[kova % "+Inf"] == 4
+    assert ornek['bsg_asama_sure_saniye_count{asama="collatz"}'] == 4
+    assert ornek['bsg_asama_sure_saniye_sum{asama="collatz"}'] == pytest.approx(7.0062)
+
+
+def test_havuz_sayaclariyla_ayni(acik_metrikler):
+    havuz = EntropiHavuzu("sentetik:5", kapasite=1 << 14, saglik=False)
+    try:
+        okunan = 0
+        for n in (1000, 4096, 333):
+            assert havuz.read_bits(n).size == n
+            okunan += n
+    finally:
+        havuz.stop()
+
+    assert metrics.KARE.deger() == havuz.kare_sayisi
+    assert metrics.HAM_BIT.deger() == havuz.ham_bit_sayisi
+    assert metrics.TEMIZ_BIT.deger() == havuz.temiz_bit_sayisi
+    assert metrics.OKUNAN_BIT.deger() == okunan
+
+    istatistik = metrics.istatistikler()
+    assert istatistik["verimlilik"] == pytest.approx(havuz.verimlilik)
+    assert 0.45 < istatistik["bit_dengesi"] < 0.55
+    assert istatistik["atilan_kare_orani"] == 0.0
+
+
+def test_dosyaya_yaz(acik_metrikler, tmp_path):
+    metrics.KARE.ekle(7)
+    yol = tmp_path / "bsg.prom"
+    metrics.dosyaya_yaz(str(yol))
+    assert yol.read_text(encoding="utf-8") == metrics.prometheus_metni()
+    assert list(tmp_path.iterdir()) == [yol]
+
+
+def test_http_sunucusu(acik_metrikler):
+    metrics.KARE.ekle(3)
+    sunucu = metrics.http_sunucusu(port=0)
+    try:
+        adres = f"http://127.0.0.1:{sunucu.server_address[1]}"
+        with urllib.request.urlopen(adres + "/metrics", timeout=5) as yanit:
+            assert yanit.status == 200
+            assert yanit.headers["Content-Type"].startswith("text/plain")
+            assert _ornekler(yanit.read().decode("utf-8"))["bsg_kare_toplam"] == 3
+        with pytest.raises(urllib.error.HTTPError) as hata:
+            urllib.request.urlopen(adres + "/baska", timeout=5)
+        assert hata.value.code == 404
+    finally:
+        sunucu.shutdown()
+        sunucu.server_close()
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from nist_tests import NistBataryasi, nist_testleri
+from von_neumann import str_to_bits
+
+# NIST SP 800-22 Rev. 1a örnekleri (2.x.4 ve 2.x.8 bölümleri)
+PI_100 = ("11001001000011111101101010100010001000010110100011"
+          "00001000110100110001001100011001100010100010111000")
+UZUN_KOSU_128 = ("11001100000101010110110001001100111000000000001001001101010100010001001111010110"
+                 "100000001101011111001100111001101101100010110010")
+
+
+def _p(bit_dizisi, **ayarlar):
+    return NistBataryasi(**ayarlar).ekle_bitler(str_to_bits(bit_dizisi)).sonuclar()
+
+
+@pytest.mark.parametrize("bit_dizisi, ayarlar, test, beklenen", [
+    ("1011010101", {}, "frekans", 0.527089),
+    (PI_100, {}, "frekans", 0.109599),
+    ("0110011010", {"blok_frekans_m": 3}, "blok_frekans", 0.801252),
+    (PI_100, {"blok_frekans_m": 10}, "blok_frekans", 0.706438),
+    ("1001101011", {}, "kosular", 0.147232),
+    (PI_100, {}, "kosular", 0.500798),
+    (UZUN_KOSU_128, {"uzun_kosu_m": 8}, "en_uzun_kosu", 0.180598),
+    ("0011011101", {"seri_m": 3, "apen_m": 3}, "seri", (0.808792, 0.670320)),
+    ("0100110101", {"seri_m": 3, "apen_m": 3}, "yaklasik_entropi", 0.261961),
+    ("1011010111", {}, "kumulatif_toplam", (0.411659, 0.411659)),
+    (PI_100, {}, "kumulatif_toplam", (0.219194, 0.114866)),
+])
+def test_nist_ornekleri(bit_dizisi, ayarlar, test, beklenen):
+    assert _p(bit_dizisi, **ayarlar)[test] == pytest.approx(beklenen, abs=1e-6)
+
+
+def test_yetersiz_veri():
+    p = _p("1011010101")
+    assert p["en_uzun_kosu"] is None and p["fft"] is None and p["seri"] is None
+    assert NistBataryasi().sonuclar() == {}
+
+
+def _karsilastir(a, b):
+    assert a.keys() == b.keys()
+    for ad in a:
+        if a[ad] is None:
+            assert b[ad] is None, ad
+        else:
+            assert a[ad] == pytest.approx(b[ad], rel=1e-9, abs=1e-12), ad
+
+
+@pytest.mark.parametrize("ayarlar", [{}, {"uzun_kosu_m": 128, "fft_blok": 4096, "seri_m": 5, "apen_m": 4}])
+def test_parcali_tek_seferle_ayni(ayarlar):
+    rng = np.random.default_rng(22)
+    bit_sayisi = 300_001  # bayt sınırına denk gelmeyen uzunluk
+    paketli = np.packbits(rng.integers(0, 2, bit_sayisi, dtype=np.uint8))
+
+    tek = nist_testleri(paketli, bit_sayisi, parca_bit=1 << 30, **ayarlar)
+    _karsilastir(tek, nist_testleri(paketli, bit_sayisi, parca_bit=12345, **ayarlar))
+
+    # ekle_bitler ile düzensiz boylu art arda parçalar
+    bitler = np.unpackbits(paketli, count=bit_sayisi)
+    batarya = NistBataryasi(parca_bit=12345, **ayarlar)
+    sinirlar = [0, 1, 2, 17, 5000, 12345, 99_999, bit_sayisi]
+    for bas, son in zip(sinirlar[:-1], sinirlar[1:]):
+        batarya.ekle_bitler(bitler[bas:son])
+    _karsilastir(tek, batarya.sonuclar())
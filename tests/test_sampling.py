@@ -0,0 +1,128 @@
+import itertools
+import os
+
+import numpy as np
+import pytest
+from scipy.stats import chisquare
+
+from sampling import AralikOrnekleyici, _paket_duzeni
+
+
+class ListeHavuzu:
+    """
+    Verilen bit dizisini sırayla veren havuz; bitince None döner.
+    """
+
+    def __init__(self, bitler):
+        self.bitler = np.asarray(bitler, dtype=np.uint8)
+        self.konum = 0
+        self.hata = None
+
+    def read_bits(self, n, blok=True, zaman_asimi=None):
+        if self.konum + n > self.bitler.size:
+            self.hata = "Entropi bitti."
+            return None
+        parca = self.bitler[self.konum:self.konum + n]
+        self.konum += n
+        return parca
+
+
+class RastgeleHavuz:
+    hata = None
+
+    def read_bits(self, n, blok=True, zaman_asimi=None):
+        return np.unpackbits(np.frombuffer(os.urandom((n + 7) // 8), dtype=np.uint8), count=n)
+
+
+@pytest.mark.parametrize("n", [2, 3, 5, 6, 7, 10, 100])
+def test_randbelow_tam_duzgun(n):
+    # L bitlik tüm diziler eşit olasılıklıdır; L bit içinde biten çekimlerin sonuçları tam eşit sayıda olmalı
+    uzunluk = 14
+    sayilar = np.zeros(n, dtype=np.int64)
+    for dizi in itertools.product((0, 1), repeat=uzunluk):
+        sonuc = AralikOrnekleyici(ListeHavuzu(dizi), parca_bit=1).randbelow(n)
+        if sonuc is not None:
+            assert 0 <= sonuc < n
+            sayilar[sonuc] += 1
+    assert sayilar.min() == sayilar.max() > 0
+
+
+def _naif_fdr(n, bit):
+    # Referans: Lumbroso'nun Fast Dice Roller'ı, her adımda tek bit
+    v, c = 1, 0
+    while True:
+        v, c = 2 * v, 2 * c + bit()
+        if v >= n:
+            if c < n:
+                return c
+            v, c = v - n, c - n
+
+
+@pytest.mark.parametrize("n", [6, 37, 1000])
+def test_randbelow_naif_fdr_ile_kiyas(n):
+    adet = 10_000
+    ornekleyici = AralikOrnekleyici(RastgeleHavuz(), parca_bit=1)
+    degerler = [ornekleyici.randbelow(n) for _ in range(adet)]
+    assert chisquare(np.bincount(degerler, minlength=n)).pvalue > 1e-4
+
+    havuz = RastgeleHavuz()
+    naif_bit = 0
+
+    def bit():
+        nonlocal naif_bit
+        naif_bit += 1
+        return int(havuz.read_bits(1)[0])
+    for _ in range(adet):
+        _naif_fdr(n, bit)
+    # Geri dönüşüm naif FDR'den fazla bit harcamaz; ikisi de log2(n) + 2 sınırının altında
+    assert ornekleyici.kullanilan_bit <= 1.02 * naif_bit
+    assert ornekleyici.kullanilan_bit / adet < np.log2(n) + 2
+
+
+def _naif_toplu(bitler, n, adet):
+    # Referans: b bitlik adaylar, n^k altındakiler n tabanında k basamağa (en düşük önce) açılır
+    k, b, _ = _paket_duzeni(n)
+    degerler = []
+    for i in range(0, len(bitler) - b + 1, b):
+        x = int("".join(map(str, bitler[i:i + b])), 2)
+        if x < n ** k:
+            for _ in range(k):
+                degerler.append(x % n)
+                x //= n
+        if len(degerler) >= adet:
+            return degerler[:adet]
+    raise AssertionError("referans için yetersiz bit")
+
+
+@pytest.mark.parametrize("n", [2, 6, 99, 1000, 65537, 2 ** 31 - 1])
+def test_toplu_cekim_naif_ile_ayni(n):
+    bitler = np.random.default_rng(n).integers(0, 2, 200_000, dtype=np.uint8)
+    degerler = AralikOrnekleyici(ListeHavuzu(bitler)).randint(0, n, size=1000)
+    assert degerler.tolist() == _naif_toplu(bitler.tolist(), n, 1000)
+
+
+def test_randint_aralik_ve_dagilim():
+    ornekleyici = AralikOrnekleyici(RastgeleHavuz())
+    degerler = ornekleyici.randint(1, 100, size=(200, 500))
+    assert degerler.shape == (200, 500) and degerler.dtype == np.int64
+    assert degerler.min() == 1 and degerler.max() == 99
+    assert chisquare(np.bincount(degerler.ravel() - 1, minlength=99)).pvalue > 1e-4
+    # n = 99 için toplu paketleme değer başına ~7.2 bit harcar (fazla çekilen bitler dahil)
+    assert ornekleyici.kullanilan_bit / degerler.size < 7.4
+
+    buyuk = ornekleyici.randint(-2 ** 40, 2 ** 40, size=50)
+    assert buyuk.min() >= -2 ** 40 and buyuk.max() < 2 ** 40
+    assert 5 <= ornekleyici.randint(5, 6) < 6
+
+
+def test_havuz_hatasi_none():
+    ornekleyici = AralikOrnekleyici(ListeHavuzu([1, 0, 1]))
+    assert ornekleyici.randint(0, 99, size=10) is None
+    assert ornekleyici.randbelow(1000) is None
+    assert ornekleyici.randbits(8) is None
+
+
+@pytest.mark.parametrize("low, high", [(5, 5), (5, 4)])
+def test_gecersiz_aralik(low, high):
+    with pytest.raises(ValueError):
+        AralikOrnekleyici(RastgeleHavuz()).randint(low, high)
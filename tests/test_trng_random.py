@@ -0,0 +1,157 @@
+import os
+import threading
+
+import numpy as np
+import pytest
+
+from trng_random import HavuzBitUreteci, HavuzRandom, trng_generator
+
+
+class HizliHavuz:
+    hata = None
+
+    def read_bytes(self, n, blok=True, zaman_asimi=None):
+        return os.urandom(n)
+
+
+class BozukHavuz:
+    """
+    İlk 'basarili' okumadan sonra kamera açılamamış gibi davranır.
+    """
+
+    def __init__(self, basarili=0):
+        self.basarili = basarili
+        self.hata = None
+
+    def read_bytes(self, n, blok=True, zaman_asimi=None):
+        if self.basarili > 0:
+            self.basarili -= 1
+            return os.urandom(n)
+        self.hata = "Kamera açılamadı."
+        return None
+
+
+class SayacHavuzu:
+    """
+    Ardışık 64 bitlik sayılar verir; her kelimenin bir kez kullanıldığı doğrulanabilir.
+    """
+
+    def __init__(self):
+        self.hata = None
+        self._sonraki = 0
+        self._kilit = threading.Lock()
+
+    def read_bytes(self, n, blok=True, zaman_asimi=None):
+        with self._kilit:
+            kelimeler = np.arange(self._sonraki, self._sonraki + n // 8, dtype=np.uint64)
+            self._sonraki += n // 8
+        return kelimeler.tobytes()
+
+
+def _sure_sinirli(fonksiyon, sure=10.0):
+    # Takılan çağrı testi kilitlemesin: ayrı thread'de çalıştırılır
+    sonuc = {}
+
+    def calistir():
+        try:
+            sonuc["deger"] = fonksiyon()
+        except BaseException as e:
+            sonuc["hata"] = e
+
+    thread = threading.Thread(target=calistir, daemon=True)
+    thread.start()
+    thread.join(sure)
+    assert not thread.is_alive(), "çağrı takıldı"
+    if "hata" in sonuc:
+        raise sonuc["hata"]
+    return sonuc["deger"]
+
+
+@pytest.mark.parametrize("cagri", [
+    lambda g: g.integers(0, 100),
+    lambda g: g.integers(0, 2 ** 64 - 1, dtype=np.uint64),
+    lambda g: g.integers(0, 100, size=5000),
+    lambda g: g.standard_normal(5000),
+    lambda g: g.random(),
+])
+@pytest.mark.parametrize("basarili", [0, 1])
+def test_bozuk_havuz_hata_firlatir(cagri, basarili):
+    g = trng_generator(BozukHavuz(basarili), blok_kelime=64)
+    # İlk blok başarılıysa birkaç çağrı geçer; havuz bozulunca sonuç yerine hata gelmeli
+    with pytest.raises(RuntimeError, match="Kamera açılamadı"):
+        for _ in range(1000):
+            _sure_sinirli(lambda: cagri(g))
+    # Hata kalıcıdır
+    with pytest.raises(RuntimeError):
+        g.random()
+    with pytest.raises(RuntimeError):
+        g.bit_generator.random_raw(4)
+
+
+def test_dogrudan_generator_kontrol():
+    bit_uretici = HavuzBitUreteci(BozukHavuz(), blok_kelime=64)
+    g = np.random.Generator(bit_uretici)
+    _sure_sinirli(lambda: g.integers(0, 100, size=1000))
+    with pytest.raises(RuntimeError):
+        bit_uretici.kontrol()
+
+
+def test_her_kelime_bir_kez():
+    bit_uretici = HavuzBitUreteci(SayacHavuzu(), blok_kelime=256)
+    g = np.random.Generator(bit_uretici)
+    parcalar = [g.integers(0, 2 ** 64 - 1, size=300, dtype=np.uint64, endpoint=True),
+                bit_uretici.random_raw(500),
+                g.integers(0, 2 ** 64 - 1, size=300, dtype=np.uint64, endpoint=True)]
+    hepsi = np.concatenate(parcalar)
+    np.testing.assert_array_equal(hepsi, np.arange(hepsi.size, dtype=np.uint64))
+
+
+def test_dagilim():
+    g = trng_generator(HizliHavuz())
+    sayilar = np.bincount(g.integers(0, 10, size=100_000), minlength=10)
+    assert sayilar.min() > 9_000 and sayilar.max() < 11_000
+    assert abs(g.random(100_000).mean() - 0.5) < 0.01
+
+
+def test_havuz_random_threadler_arasi_tekrar_yok():
+    r = HavuzRandom(SayacHavuzu(), blok_kelime=1000)
+    ciktilar = []
+
+    def isci():
+        yerel = []
+        for i in range(5000):
+            if i % 7 == 0:
+                yerel.extend(r._tampon.kelimeler(3).tolist())
+            else:
+                yerel.append(r._tampon.kelime())
+        ciktilar.append(yerel)
+
+    threadler = [threading.Thread(target=isci) for _ in range(8)]
+    for t in threadler:
+        t.start()
+    for t in threadler:
+        t.join()
+    hepsi = [k for yerel in ciktilar for k in yerel]
+    assert len(hepsi) == len(set(hepsi))
+
+
+def test_havuz_random_bozuk_havuz():
+    r = HavuzRandom(BozukHavuz())
+    with pytest.raises(RuntimeError, match="Kamera açılamadı"):
+        r.random()
+
+
+def test_sarmalanan_yontemler():
+    g = trng_generator(HizliHavuz())
+    dizi = np.arange(100)
+    g.shuffle(dizi)
+    assert sorted(dizi.tolist()) == list(range(100))
+    assert sorted(g.permutation(10).tolist()) == list(range(10))
+    assert g.choice(5, size=20, replace=True).max() < 5
+    assert len(g.bytes(17)) == 17
+    assert 2.0 <= g.uniform(2.0, 3.0) < 3.0
+    assert g.normal(5.0, 0.0, size=3).tolist() == [5.0] * 3
+    assert g.random(4, dtype=np.float32).dtype == np.float32
+    # Denetimsiz Generator yöntemleri sunulmaz
+    with pytest.raises(AttributeError):
+        g.exponential()
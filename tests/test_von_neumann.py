@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from von_neumann import ekstrakt_et, peres_bits, von_neumann_bits, von_neumann_packed, von_neumann_str
+
+
+def naif_von_neumann(bitler):
+    # Tanımın birebir karşılığı: çiftleri sırayla gez, "01" -> 0, "10" -> 1
+    cikti = []
+    for i in range(0, len(bitler) - 1, 2):
+        if bitler[i] != bitler[i + 1]:
+            cikti.append(bitler[i])
+    return cikti
+
+
+def naif_peres(bitler, derinlik):
+    # Ψ(x) = VN(x) + Ψ(u) + Ψ(v); u = çiftlerin XOR'u, v = eşit çiftlerin ilk biti
+    if len(bitler) < 2:
+        return []
+    ciftler = [(bitler[i], bitler[i + 1]) for i in range(0, len(bitler) - 1, 2)]
+    cikti = [a for a, b in ciftler if a != b]
+    if derinlik == 0:
+        return cikti
+    u = [a ^ b for a, b in ciftler]
+    v = [a for a, b in ciftler if a == b]
+    return cikti + naif_peres(u, derinlik - 1) + naif_peres(v, derinlik - 1)
+
+
+@pytest.mark.parametrize("uzunluk", [0, 1, 2, 7, 8, 9, 15, 16, 63, 1001])
+@pytest.mark.parametrize("olasilik", [0.1, 0.5, 0.9])
+def test_von_neumann_naif_ile_ayni(uzunluk, olasilik):
+    rng = np.random.default_rng(uzunluk)
+    bitler = (rng.random(uzunluk) < olasilik).astype(np.uint8)
+    assert von_neumann_bits(bitler).tolist() == naif_von_neumann(bitler.tolist())
+
+
+def test_tum_baytlar():
+    # Tablonun her satırı tek tek doğrulanır
+    for bayt in range(256):
+        bitler = np.unpackbits(np.array([bayt], dtype=np.uint8))
+        paketli, sayi = von_neumann_packed(np.array([bayt], dtype=np.uint8))
+        assert np.unpackbits(paketli, count=sayi).tolist() == naif_von_neumann(bitler.tolist())
+
+
+def test_dolgu_bitleri_yok_sayilir():
+    # Son baytın geçerli olmayan bitleri ("10" çifti olsa bile) çıktıya karışmaz
+    paketli, sayi = von_neumann_packed(np.array([0b01101010], dtype=np.uint8), bit_sayisi=4)
+    assert np.unpackbits(paketli, count=sayi).tolist() == [0, 1]
+
+
+def test_str_arayuzu():
+    assert von_neumann_str("0110001110") == "011"
+
+
+@pytest.mark.parametrize("uzunluk", [0, 1, 2, 3, 9, 16, 17, 255, 2048])
+@pytest.mark.parametrize("derinlik", [0, 1, 2, 4, 6])
+def test_peres_naif_ile_ayni(uzunluk, derinlik):
+    rng = np.random.default_rng(1000 + uzunluk)
+    bitler = (rng.random(uzunluk) < 0.7).astype(np.uint8)
+    assert peres_bits(bitler, derinlik).tolist() == naif_peres(bitler.tolist(), derinlik)
+
+
+def test_peres_derinlik_sifir_von_neumann():
+    bitler = np.random.default_rng(5).integers(0, 2, 999, dtype=np.uint8)
+    assert np.array_equal(peres_bits(bitler, 0), von_neumann_bits(bitler))
+
+
+def test_bilinmeyen_ekstraktor():
+    with pytest.raises(ValueError):
+        ekstrakt_et(np.zeros(8, dtype=np.uint8), yontem="yok")
@@ -0,0 +1,318 @@
+import ctypes
+import random
+import threading
+
+import numpy as np
+
+from entropy_pool import varsayilan_havuz
+
+
+# --- NUMPY / random.Random ADAPTÖRLERİ ---
+# Havuzdaki temiz bitler büyük bloklar halinde (varsayılan 64K x 64 bit) bir kelime tamponuna
+# alınır; adaptörler bu tampondan servis edilir.
+#   - HavuzBitUreteci: numpy.random.Generator'ın kabul ettiği BitGenerator arayüzü
+#     ("BitGenerator" adlı capsule içinde bitgen_t yapısı + lock). C tarafı her değer için
+#     ctypes geri çağrısıyla tampondan okur; havuza sadece blok bitince gidilir.
+#   - HavuzRandom: random.Random alt sınıfı (SystemRandom gibi tohumsuz, durum kaydedilemez).
+# Toplu yollar (random_raw, doldur, randbytes, büyük getrandbits) tampondan buffer protokolüyle
+# tek kopyayla doldurulur; değer başına Python çağrısı yapılmaz.
+#
+# Havuz hatası: geri çağrı NumPy'a hata döndüremez. Yenileme başarısız olursa hata kaydedilir,
+# üreteç kalıcı olarak hatalı duruma geçer ve NumPy'ın ret (rejection) döngüleri takılmasın diye
+# o çağrının geri kalanı splitmix64 dizisiyle tamamlanır. Bu değerler kullanıcıya verilmez:
+# HavuzGenerator (trng_generator) her çağrıdan önce ve sonra kontrol() ile RuntimeError fırlatır.
+def _havuzdan_oku(havuz, adet, dtype, zaman_asimi):
+    """
+    Havuzdan adet kelime okur; okunamazsa RuntimeError fırlatır.
+    """
+    baytlar = havuz.read_bytes(adet * dtype.itemsize, zaman_asimi=zaman_asimi)
+    if baytlar is None:
+        raise RuntimeError(havuz.hata or "Entropi alınamadı.")
+    return np.frombuffer(baytlar, dtype=dtype)
+
+
+class _KelimeTamponu:
+    """
+    Havuzdan blok blok okunan kelimeler (varsayılan 64 bit). Havuz okunamazsa RuntimeError fırlatır.
+    Tekli ve toplu okumalar aynı kilit altında tek bir konum indeksini ilerletir; her kelime
+    bir kez verilir.
+    """
+
+    def __init__(self, havuz=None, blok_kelime=1 << 16, zaman_asimi=None, dtype=np.uint64):
+        self.havuz = havuz
+        self.blok_kelime = blok_kelime
+        self.zaman_asimi = zaman_asimi
+        self.dtype = np.dtype(dtype)
+
+        self._blok = np.zeros(0, dtype=self.dtype)
+        # Tekli okumalar için aynı bloğun Python tam sayı listesi (değer başına dönüşüm yapılmaz)
+        self._liste = []
+        self._konum = 0
+        self._kilit = threading.Lock()
+
+        self.okunan_kelime = 0
+
+    def _oku(self, adet):
+        if self.havuz is None:
+            self.havuz = varsayilan_havuz()
+        kelimeler = _havuzdan_oku(self.havuz, adet, self.dtype, self.zaman_asimi)
+        self.okunan_kelime += adet
+        return kelimeler
+
+    def kelime(self):
+        with self._kilit:
+            if self._konum >= len(self._liste):
+                self._blok = self._oku(self.blok_kelime)
+                self._liste = self._blok.tolist()
+                self._konum = 0
+            deger = self._liste[self._konum]
+            self._konum += 1
+            return deger
+
+    def kelimeler(self, adet):
+        """
+        adet kelimelik dizi (tek kopya). Blokta kalanlar önce kullanılır, eksik kısım
+        doğrudan havuzdan okunur (tekli okuma listesine çevrilmez).
+        """
+        with self._kilit:
+            mevcut = self._blok[self._konum:self._konum + adet]
+            if mevcut.size == adet:
+                parca = mevcut.copy()
+            else:
+                # Havuz okunamazsa konum ilerlemez, bloktaki kelimeler kaybolmaz
+                parca = np.concatenate((mevcut, self._oku(adet - mevcut.size)))
+            self._konum += mevcut.size
+            return parca
+
+    def doldur(self, hedef):
+        """
+        Yazılabilir herhangi bir tamponu (bytearray, numpy dizisi, memoryview ...) rastgele baytlarla doldurur.
+        """
+        hedef = np.frombuffer(hedef, dtype=np.uint8)
+        if not hedef.flags.writeable:
+            raise TypeError("Hedef tampon yazılabilir olmalı")
+        kelime_sayisi = -(-hedef.size // self.dtype.itemsize)
+        hedef[:] = self.kelimeler(kelime_sayisi).view(np.uint8)[:hedef.size]
+
+
+class _bitgen_t(ctypes.Structure):
+    # numpy/random/bitgen.h
+    _fields_ = [
+        ("state", ctypes.c_void_p),
+        ("next_uint64", ctypes.CFUNCTYPE(ctypes.c_uint64, ctypes.c_void_p)),
+        ("next_uint32", ctypes.CFUNCTYPE(ctypes.c_uint32, ctypes.c_void_p)),
+        ("next_double", ctypes.CFUNCTYPE(ctypes.c_double, ctypes.c_void_p)),
+        ("next_raw", ctypes.CFUNCTYPE(ctypes.c_uint64, ctypes.c_void_p)),
+    ]
+
+
+_PyCapsule_New = ctypes.pythonapi.PyCapsule_New
+_PyCapsule_New.restype = ctypes.py_object
+_PyCapsule_New.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_void_p]
+
+_CIFT_OLCEK = 1.0 / (1 << 53)
+_MASKE64 = (1 << 64) - 1
+
+
+class HavuzBitUreteci:
+    """
+    numpy.random.Generator ile kullanılabilen, kamera TRNG havuzundan beslenen bit üreteci:
+        rng = trng_generator()            # ya da HavuzGenerator(HavuzBitUreteci())
+        rng.integers(0, 100, size=10**6); rng.shuffle(dizi)
+
+    Tohum alınmaz, durum kaydedilemez. Havuz okunamazsa üreteç kalıcı olarak hatalı olur:
+    'hata' doldurulur, random_raw / doldur / kontrol() RuntimeError fırlatır. NumPy içinden
+    hata yükseltilemediği için doğrudan np.random.Generator(HavuzBitUreteci()) kullanılırsa
+    her çağrıdan sonra kontrol() çağrılmalıdır; HavuzGenerator bunu kendisi yapar.
+    """
+
+    def __init__(self, havuz=None, blok_kelime=1 << 16, zaman_asimi=None):
+        self._tampon = _KelimeTamponu(havuz, blok_kelime, zaman_asimi)
+        self.lock = threading.Lock()
+        self.hata = None
+
+        # 32 bitlik çekimler 64 bitlik kelimenin iki yarısından (bit israf edilmez)
+        self._yarim = None
+        # Hatadan sonra ret döngüleri sonlansın diye verilen (kullanıcıya ulaşmayan) splitmix64 durumu
+        self._yedek = 0
+
+        alan = _bitgen_t._fields_
+        # Geri çağrılar nesne yaşadıkça tutulmalı (ctypes onları serbest bırakmasın)
+        self._geri_cagrilar = (
+            alan[1][1](lambda _durum: self._kelime()),
+            alan[2][1](lambda _durum: self._uint32()),
+            alan[3][1](lambda _durum: (self._kelime() >> 11) * _CIFT_OLCEK),
+        )
+        self._bitgen = _bitgen_t(None, self._geri_cagrilar[0], self._geri_cagrilar[1],
+                                 self._geri_cagrilar[2], self._geri_cagrilar[0])
+        self._capsule = _PyCapsule_New(ctypes.addressof(self._bitgen), b"BitGenerator", None)
+
+    @property
+    def havuz(self):
+        return self._tampon.havuz
+
+    @property
+    def okunan_kelime(self):
+        return self._tampon.okunan_kelime
+
+    def _hata_kaydet(self, hata):
+        if self.hata is None:
+            print(f"Hata: {hata}")
+            self.hata = str(hata) or "Entropi alınamadı."
+
+    def kontrol(self):
+        """
+        Havuz hatası olduysa RuntimeError fırlatır (o andan sonraki değerler kullanılmamalıdır).
+        """
+        if self.hata is not None:
+            raise RuntimeError(self.hata)
+
+    # --- ctypes geri çağrıları (NumPy tarafından lock altında, değer başına) ---
+    def _kelime(self):
+        if self.hata is None:
+            try:
+                return self._tampon.kelime()
+            except Exception as e:
+                # Geri çağrıdan istisna NumPy'a geçmez; kaydedilir, kontrol() fırlatır
+                self._hata_kaydet(e)
+        self._yedek = (self._yedek + 0x9E3779B97F4A7C15) & _MASKE64
+        z = self._yedek
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASKE64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASKE64
+        return z ^ (z >> 31)
+
+    def _uint32(self):
+        if self._yarim is not None:
+            deger, self._yarim = self._yarim, None
+            return deger
+        k = self._kelime()
+        self._yarim = k >> 32
+        return k & 0xFFFFFFFF
+
+    # --- BitGenerator arayüzü ---
+    @property
+    def capsule(self):
+        return self._capsule
+
+    @property
+    def state(self):
+        return {"bit_generator": type(self).__name__}
+
+    def _kelimeler(self, adet):
+        self.kontrol()
+        try:
+            return self._tampon.kelimeler(adet)
+        except RuntimeError as e:
+            self._hata_kaydet(e)
+            raise
+
+    def random_raw(self, size=None, output=True):
+        """
+        Ham 64 bitlik çıktılar (BitGenerator.random_raw ile aynı arayüz).
+        """
+        with self.lock:
+            if size is None:
+                deger = int(self._kelimeler(1)[0])
+                return deger if output else None
+            dizi = self._kelimeler(int(np.prod(size))).reshape(size)
+        return dizi if output else None
+
+    def doldur(self, hedef):
+        """
+        Yazılabilir tamponu rastgele baytlarla doldurur (bkz. _KelimeTamponu.doldur).
+        """
+        hedef = np.frombuffer(hedef, dtype=np.uint8)
+        if not hedef.flags.writeable:
+            raise TypeError("Hedef tampon yazılabilir olmalı")
+        with self.lock:
+            hedef[:] = self._kelimeler(-(-hedef.size // 8)).view(np.uint8)[:hedef.size]
+
+
+class HavuzGenerator:
+    """
+    numpy.random.Generator sarmalayıcısı; sadece aşağıdaki yöntemleri sunar ve her çağrıdan
+    önce ve sonra bit üretecinin kontrol()'ünü çağırır. Havuz hatasında sonuç döndürülmez,
+    RuntimeError fırlatılır (shuffle'da dizi yarım karıştırılmış olabilir).
+    Diğer Generator yöntemleri için np.random.Generator(bit_generator) + kontrol() kullanılır.
+    """
+
+    def __init__(self, bit_generator=None):
+        self.bit_generator = HavuzBitUreteci() if bit_generator is None else bit_generator
+        self._generator = np.random.Generator(self.bit_generator)
+
+    def _denetle(self, yontem, *args):
+        self.bit_generator.kontrol()
+        sonuc = yontem(*args)
+        self.bit_generator.kontrol()
+        return sonuc
+
+    def integers(self, low, high=None, size=None, dtype=np.int64, endpoint=False):
+        return self._denetle(self._generator.integers, low, high, size, dtype, endpoint)
+
+    def random(self, size=None, dtype=np.float64, out=None):
+        return self._denetle(self._generator.random, size, dtype, out)
+
+    def uniform(self, low=0.0, high=1.0, size=None):
+        return self._denetle(self._generator.uniform, low, high, size)
+
+    def standard_normal(self, size=None, dtype=np.float64, out=None):
+        return self._denetle(self._generator.standard_normal, size, dtype, out)
+
+    def normal(self, loc=0.0, scale=1.0, size=None):
+        return self._denetle(self._generator.normal, loc, scale, size)
+
+    def bytes(self, length):
+        return self._denetle(self._generator.bytes, length)
+
+    def choice(self, a, size=None, replace=True, p=None, axis=0, shuffle=True):
+        return self._denetle(self._generator.choice, a, size, replace, p, axis, shuffle)
+
+    def shuffle(self, x, axis=0):
+        return self._denetle(self._generator.shuffle, x, axis)
+
+    def permutation(self, x, axis=0):
+        return self._denetle(self._generator.permutation, x, axis)
+
+
+class HavuzRandom(random.Random):
+    """
+    Kamera TRNG havuzundan beslenen random.Random (random.SystemRandom gibi tohumsuz):
+        r = HavuzRandom(); r.shuffle(liste); r.randint(1, 6)
+    Havuz okunamazsa RuntimeError fırlatır.
+    """
+
+    def __init__(self, havuz=None, blok_kelime=1 << 16, zaman_asimi=None):
+        self._tampon = _KelimeTamponu(havuz, blok_kelime, zaman_asimi)
+        super().__init__()
+
+    def random(self):
+        return (self._tampon.kelime() >> 11) * _CIFT_OLCEK
+
+    def getrandbits(self, k):
+        if k < 0:
+            raise ValueError("bit sayısı negatif olamaz")
+        if k <= 64:
+            return self._tampon.kelime() >> (64 - k) if k else 0
+        kelime_sayisi = (k + 63) // 64
+        return int.from_bytes(self._tampon.kelimeler(kelime_sayisi).tobytes(), "little") >> (64 * kelime_sayisi - k)
+
+    def randbytes(self, n):
+        hedef = bytearray(n)
+        self._tampon.doldur(hedef)
+        return bytes(hedef)
+
+    def seed(self, *args, **kwds):
+        # Fiziksel kaynak tohumlanamaz
+        return None
+
+    def _durum_yok(self, *args, **kwds):
+        raise NotImplementedError("Fiziksel entropi kaynağının durumu yoktur.")
+
+    getstate = setstate = _durum_yok
+
+
+def trng_generator(havuz=None, blok_kelime=1 << 16):
+    """
+    Kısayol: havuz üzerinde HavuzGenerator (havuz hatasında RuntimeError fırlatır).
+    """
+    return HavuzGenerator(HavuzBitUreteci(havuz, blok_kelime))
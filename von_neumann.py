@@ -0,0 +1,148 @@
+import numpy as np
+
+
+# --- BAYT BAŞINA VON NEUMANN TABLOSU ---
+# Her bayt 4 bit çifti içerir: (7,6), (5,4), (3,2), (1,0).
+# "01" -> 0, "10" -> 1, "00" ve "11" -> atılır.
+# Yani temiz bit her zaman çiftin İLK bitidir; sadece çiftin iki biti farklıysa tutulur.
+def _tablo_olustur():
+    tum_baytlar = np.arange(256, dtype=np.uint8)[:, None]
+    bitler = np.unpackbits(tum_baytlar, axis=1)  # (256, 8), MSB önce
+
+    ilk_bitler = bitler[:, 0::2]
+    ikinci_bitler = bitler[:, 1::2]
+    maske = ilk_bitler != ikinci_bitler
+
+    return ilk_bitler, maske, maske.sum(axis=1).astype(np.uint8)
+
+
+VN_BITLER, VN_MASKE, VN_SAYI = _tablo_olustur()
+
+
+def str_to_bits(bit_stream):
+    """
+    "0101..." biçimindeki bit dizisini (string) 0/1 değerli uint8 dizisine çevirir.
+    """
+    return np.frombuffer(bit_stream.encode("ascii"), dtype=np.uint8) - ord("0")
+
+
+def bits_to_str(bitler):
+    """
+    0/1 değerli bit dizisini tekrar "0101..." string biçimine çevirir.
+    """
+    return (np.asarray(bitler, dtype=np.uint8) + ord("0")).tobytes().decode("ascii")
+
+
+def von_neumann_packed(paketli, bit_sayisi=None):
+    """
+    Paketlenmiş (np.packbits, MSB önce) bit dizisini Von Neumann kuralına göre temizler.
+    Tek çağrıda megabitlik tamponları işler (Python döngüsü yok).
+
+    bit_sayisi verilirse sadece ilk bit_sayisi bit kullanılır (son baytın dolgu bitleri yok sayılır).
+    Geriye (paketlenmiş temiz bitler, temiz bit sayısı) döndürür.
+    """
+    veri = np.asarray(paketli, dtype=np.uint8).ravel()
+    if bit_sayisi is None:
+        bit_sayisi = veri.size * 8
+
+    # Tek kalan son bitin eşi yoktur, atılır
+    bit_sayisi -= bit_sayisi % 2
+    tam_bayt, kalan = divmod(bit_sayisi, 8)
+    veri = veri[:tam_bayt + (1 if kalan else 0)]
+
+    bitler = VN_BITLER[veri]
+    maske = VN_MASKE[veri]
+
+    if kalan:
+        # Son baytta sadece geçerli çiftleri bırak (dolgu bitlerini "00" yap)
+        son_bayt = veri[-1] & ((0xFF << (8 - kalan)) & 0xFF)
+        maske[-1] = VN_MASKE[son_bayt]
+
+    temiz = bitler[maske]
+    return np.packbits(temiz), temiz.size
+
+
+def von_neumann_bits(bitler):
+    """
+    0/1 değerli (paketlenmemiş) bit dizisini temizler, yine 0/1 dizisi döndürür.
+    """
+    bitler = np.asarray(bitler, dtype=np.uint8)
+    paketli, sayi = von_neumann_packed(np.packbits(bitler), bitler.size)
+    return np.unpackbits(paketli, count=sayi)
+
+
+def von_neumann_str(bit_stream):
+    """
+    Eski string tabanlı arayüz: "0110..." alır, temizlenmiş string döndürür.
+    """
+    return bits_to_str(von_neumann_bits(str_to_bits(bit_stream)))
+
+
+# --- PERES (YİNELEMELİ VON NEUMANN) ---
+# Von Neumann "00" / "11" çiftlerini atar; bu çiftlerde ve çiftlerin XOR dizisinde hâlâ entropi vardır.
+# Peres: Ψ(x) = VN(x) + Ψ(u) + Ψ(v)
+#   u = her çiftin XOR'u (a ^ b),
+#   v = eşit çiftlerin (00 / 11) ilk biti.
+# Derinlik arttıkça verim kaynağın entropi oranına yaklaşır (yansız girişte %25 -> ~%100).
+# Tablolar da bayt başınadır: XOR bitleri her zaman 4 tanedir, eşit çift bitleri VN_MASKE'nin tersidir.
+def _xor_tablosu_olustur():
+    bitler = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1)
+    return bitler[:, 0::2] ^ bitler[:, 1::2]
+
+
+PERES_XOR = _xor_tablosu_olustur()
+
+
+def _peres(veri, bit_sayisi, derinlik, cikti):
+    # veri: paketli bitler; cikti: 0/1 parçalarının toplandığı liste
+    cift_sayisi = bit_sayisi // 2
+    if cift_sayisi == 0:
+        return
+    veri = veri[:(cift_sayisi * 2 + 7) // 8]
+
+    # Çift düzeyinde: ilk bit, XOR biti, farklı mı (son baytın dolgu çiftleri kesilir)
+    ilk = VN_BITLER[veri].ravel()[:cift_sayisi]
+    farkli = VN_MASKE[veri].ravel()[:cift_sayisi]
+    cikti.append(ilk[farkli])
+    if derinlik == 0:
+        return
+
+    xor = PERES_XOR[veri].ravel()[:cift_sayisi]
+    _peres(np.packbits(xor), cift_sayisi, derinlik - 1, cikti)
+
+    esit = ilk[~farkli]
+    _peres(np.packbits(esit), esit.size, derinlik - 1, cikti)
+
+
+def peres_packed(paketli, bit_sayisi=None, derinlik=4):
+    """
+    von_neumann_packed ile aynı arayüz, Peres yinelemeli ekstraktörü.
+    derinlik=0 düz Von Neumann'dır; her düzey XOR ve eşit çift dizilerine yeniden uygulanır.
+    Geriye (paketlenmiş temiz bitler, temiz bit sayısı) döndürür.
+    """
+    veri = np.asarray(paketli, dtype=np.uint8).ravel()
+    if bit_sayisi is None:
+        bit_sayisi = veri.size * 8
+
+    cikti = []
+    _peres(veri, bit_sayisi, derinlik, cikti)
+    temiz = np.concatenate(cikti) if cikti else np.zeros(0, dtype=np.uint8)
+    return np.packbits(temiz), temiz.size
+
+
+def peres_bits(bitler, derinlik=4):
+    bitler = np.asarray(bitler, dtype=np.uint8)
+    paketli, sayi = peres_packed(np.packbits(bitler), bitler.size, derinlik)
+    return np.unpackbits(paketli, count=sayi)
+
+
+def ekstrakt_et(bitler, yontem="von_neumann", derinlik=4):
+    """
+    0/1 bit dizisini seçilen ekstraktörle temizler: "von_neumann" veya "peres".
+    """
+    if yontem == "von_neumann":
+        return von_neumann_bits(bitler)
+    if yontem == "peres":
+        return peres_bits(bitler, derinlik)
+    raise ValueError(f"Bilinmeyen ekstraktör: {yontem}")
+